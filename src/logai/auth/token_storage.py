@@ -5,12 +5,13 @@ from __future__ import annotations
 import json
 import os
 import stat
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TokenData:
     """
     Authentication token data.
@@ -249,7 +250,12 @@ class TokenStorage:
             data: dict[str, Any] = json.load(f)
             return data
 
-    def _write_auth_file_atomic(self, auth_data: dict[str, Any]) -> None:
+    def _write_auth_file_atomic(
+        self,
+        auth_data: dict[str, Any],
+        *,
+        dump: Callable[..., None] = json.dump,
+    ) -> None:
         """
         Write auth file atomically with secure permissions.
 
@@ -258,6 +264,7 @@ class TokenStorage:
 
         Args:
             auth_data: Complete auth data to write
+            dump: Serializer called as dump(data, file, indent=2) (overridable for testing)
 
         Raises:
             OSError: If file operations fail
@@ -268,7 +275,7 @@ class TokenStorage:
         try:
             # Write data
             with open(temp_file, "w") as f:
-                json.dump(auth_data, f, indent=2)
+                dump(auth_data, f, indent=2)
 
             # Set secure permissions (600 = owner read/write only)
             os.chmod(temp_file, stat.S_IRUSR | stat.S_IWUSR)
@@ -56,6 +56,7 @@ class CacheManager:
                 pass
             self._cleanup_task = None
 
+        await self.store.close()
         self._initialized = False
 
     async def get(
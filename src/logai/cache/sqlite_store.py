@@ -1,122 +1,248 @@
 """SQLite-based cache store for log data and query results."""
 
+import asyncio
 import json
 import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
+_INSERT_ENTRY_SQL = """
+    INSERT OR REPLACE INTO cache_entries
+    (id, query_type, log_group, start_time, end_time, filter_pattern,
+     payload, payload_size, log_count, created_at, expires_at,
+     last_accessed, hit_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _dumps_payload(payload: dict[str, Any]) -> str:
+    """Serialize a payload to JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload)
+
+
+def _loads_payload(data: str) -> Any:
+    """Parse a JSON payload, with orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Represents a cache entry."""
 
-    def __init__(
-        self,
-        id: str,
-        query_type: str,
-        payload: dict[str, Any],
-        log_group: str | None = None,
-        start_time: int | None = None,
-        end_time: int | None = None,
-        filter_pattern: str | None = None,
-        payload_size: int = 0,
-        log_count: int = 0,
-        created_at: int | None = None,
-        expires_at: int | None = None,
-        last_accessed: int | None = None,
-        hit_count: int = 0,
-    ):
-        """Initialize cache entry."""
-        self.id = id
-        self.query_type = query_type
-        self.log_group = log_group
-        self.start_time = start_time
-        self.end_time = end_time
-        self.filter_pattern = filter_pattern
-        self.payload = payload
-        self.payload_size = payload_size
-        self.log_count = log_count
-        self.created_at = created_at or int(time.time())
-        self.expires_at = expires_at or (self.created_at + 3600)  # Default 1 hour
-        self.last_accessed = last_accessed or self.created_at
-        self.hit_count = hit_count
+    id: str
+    query_type: str
+    payload: dict[str, Any]
+    log_group: str | None = None
+    start_time: int | None = None
+    end_time: int | None = None
+    filter_pattern: str | None = None
+    payload_size: int = 0
+    log_count: int = 0
+    created_at: int | None = None
+    expires_at: int | None = None
+    last_accessed: int | None = None
+    hit_count: int = 0
+
+    def __post_init__(self) -> None:
+        """Fill in timestamps that were not given."""
+        self.created_at = self.created_at or int(time.time())
+        self.expires_at = self.expires_at or (self.created_at + 3600)  # Default 1 hour
+        self.last_accessed = self.last_accessed or self.created_at
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "CacheEntry":
+        """Build an entry from a ``cache_entries`` row in table column order.
+
+        Args:
+            row: Row of (id, query_type, log_group, start_time, end_time,
+                filter_pattern, payload, payload_size, log_count, created_at,
+                expires_at, last_accessed, hit_count)
+
+        Returns:
+            Cache entry with its payload decoded
+
+        Raises:
+            json.JSONDecodeError: If the stored payload is not valid JSON
+        """
+        (
+            entry_id,
+            query_type,
+            log_group,
+            start_time,
+            end_time,
+            filter_pattern,
+            payload,
+            payload_size,
+            log_count,
+            created_at,
+            expires_at,
+            last_accessed,
+            hit_count,
+        ) = row
+        return cls(
+            entry_id,
+            query_type,
+            _loads_payload(payload),
+            log_group,
+            start_time,
+            end_time,
+            filter_pattern,
+            payload_size,
+            log_count,
+            created_at,
+            expires_at,
+            last_accessed,
+            hit_count,
+        )
 
 
 class SQLiteStore:
     """SQLite-based cache store."""
 
-    def __init__(self, cache_dir: Path):
+    def __init__(self, cache_dir: Path, database: str | None = None):
         """Initialize SQLite store.
 
         Args:
             cache_dir: Directory for cache database
+            database: SQLite URI to use instead of ``cache_dir/cache.db``, e.g.
+                ``:memory:`` for an in-memory store
         """
         self.cache_dir = cache_dir
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = self.cache_dir / "cache.db"
+        self.db_path: Path | str
+        if database is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.db_path = self.cache_dir / "cache.db"
+        else:
+            self.db_path = database
         self._initialized = False
+        # One connection, opened by initialize(), serves every operation
+        self._conn: aiosqlite.Connection | None = None
+        # Serializes first use, so concurrent callers share one connection
+        self._init_lock = asyncio.Lock()
+
+    def _connect(self) -> aiosqlite.Connection:
+        """Open a connection to the cache database."""
+        if isinstance(self.db_path, Path):
+            return aiosqlite.connect(str(self.db_path))
+        return aiosqlite.connect(self.db_path, uri=True)
+
+    async def _connection(self) -> aiosqlite.Connection:
+        """Return the store's connection, initializing the store if needed."""
+        await self.initialize()
+        if self._conn is None:
+            raise RuntimeError("SQLite store connection is not open")
+        return self._conn
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            self._initialized = False
 
     async def initialize(self) -> None:
-        """Initialize database schema."""
+        """Initialize database schema.
+
+        Safe to call concurrently: only the first caller opens the connection
+        and creates the schema, the others wait for it to finish.
+        """
         if self._initialized:
             return
 
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            # Create cache entries table
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS cache_entries (
-                    id TEXT PRIMARY KEY,
-                    query_type TEXT NOT NULL,
-                    log_group TEXT,
-                    start_time INTEGER,
-                    end_time INTEGER,
-                    filter_pattern TEXT,
-                    payload TEXT NOT NULL,
-                    payload_size INTEGER,
-                    log_count INTEGER,
-                    created_at INTEGER NOT NULL,
-                    expires_at INTEGER NOT NULL,
-                    last_accessed INTEGER NOT NULL,
-                    hit_count INTEGER DEFAULT 0
-                )
-                """
-            )
+        async with self._init_lock:
+            if self._initialized:
+                return
 
-            # Create indexes
-            await db.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_log_group_time
-                ON cache_entries(log_group, start_time, end_time)
-                """
-            )
-            await db.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_expires_at
-                ON cache_entries(expires_at)
-                """
-            )
-            await db.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_last_accessed
-                ON cache_entries(last_accessed)
-                """
-            )
+            db = await self._connect()
+            try:
+                await self._create_schema(db)
+            except BaseException:
+                await db.close()
+                raise
 
-            # Create cache statistics table
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS cache_stats (
-                    stat_key TEXT PRIMARY KEY,
-                    stat_value INTEGER
-                )
-                """
-            )
+            # Publish the connection only once the schema exists
+            self._conn = db
+            self._initialized = True
 
-            await db.commit()
+    async def _create_schema(self, db: aiosqlite.Connection) -> None:
+        """Create the cache tables and indexes if they don't exist.
+
+        Args:
+            db: Open connection to the cache database
+        """
+        # WAL lets readers proceed during writes and makes commits cheaper.
+        # The mode is persistent, so it only needs setting once per file.
+        await db.execute("PRAGMA journal_mode=WAL")
+
+        # Create cache entries table
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                id TEXT PRIMARY KEY,
+                query_type TEXT NOT NULL,
+                log_group TEXT,
+                start_time INTEGER,
+                end_time INTEGER,
+                filter_pattern TEXT,
+                payload TEXT NOT NULL,
+                payload_size INTEGER,
+                log_count INTEGER,
+                created_at INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL,
+                last_accessed INTEGER NOT NULL,
+                hit_count INTEGER DEFAULT 0
+            )
+            """
+        )
+
+        # Create indexes
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_log_group_time
+            ON cache_entries(log_group, start_time, end_time)
+            """
+        )
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_expires_at
+            ON cache_entries(expires_at)
+            """
+        )
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_last_accessed
+            ON cache_entries(last_accessed)
+            """
+        )
+
+        # Create cache statistics table
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_stats (
+                stat_key TEXT PRIMARY KEY,
+                stat_value INTEGER
+            )
+            """
+        )
 
-        self._initialized = True
+        await db.commit()
 
     async def get(self, key: str) -> CacheEntry | None:
         """Retrieve a cache entry by key.
@@ -127,68 +253,65 @@ class SQLiteStore:
         Returns:
             Cache entry if found and not expired, None otherwise
         """
-        await self.initialize()
+        now = int(time.time())
 
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            async with db.execute(
-                """
-                SELECT id, query_type, log_group, start_time, end_time,
-                       filter_pattern, payload, payload_size, log_count,
-                       created_at, expires_at, last_accessed, hit_count
-                FROM cache_entries
-                WHERE id = ?
-                """,
-                (key,),
-            ) as cursor:
-                row = await cursor.fetchone()
-
-            if not row:
-                return None
-
-            # Check if expired
-            now = int(time.time())
-            if row[10] < now:  # expires_at < now
-                # Delete expired entry
-                await db.execute("DELETE FROM cache_entries WHERE id = ?", (key,))
-                await db.commit()
-                return None
-
-            # Update last accessed and hit count
+        db = await self._connection()
+        # Each aiosqlite call is a round trip to its worker thread, so reads
+        # use execute_fetchall (one trip) rather than execute + fetch + close.
+        # Record the hit and read the entry back in one statement; expired
+        # entries don't match and are removed below.
+        rows = await db.execute_fetchall(
+            """
+            UPDATE cache_entries
+            SET last_accessed = ?, hit_count = hit_count + 1
+            WHERE id = ? AND expires_at >= ?
+            RETURNING id, query_type, log_group, start_time, end_time,
+                      filter_pattern, payload, payload_size, log_count,
+                      created_at, expires_at, last_accessed, hit_count
+            """,
+            (now, key, now),
+        )
+        row = next(iter(rows), None)
+
+        if not row:
+            # Delete the entry if it exists but has expired
             await db.execute(
-                """
-                UPDATE cache_entries
-                SET last_accessed = ?, hit_count = hit_count + 1
-                WHERE id = ?
-                """,
-                (now, key),
+                "DELETE FROM cache_entries WHERE id = ? AND expires_at < ?", (key, now)
             )
+            # Commit even when nothing matched so the shared connection
+            # doesn't keep the UPDATE's transaction open
             await db.commit()
+            return None
 
-            # Parse payload
-            try:
-                payload = json.loads(row[6])
-            except json.JSONDecodeError:
-                # If cache DB gets corrupted, don't crash - just skip the entry
-                # Log warning and delete corrupted entry
-                await db.execute("DELETE FROM cache_entries WHERE id = ?", (key,))
-                await db.commit()
-                return None
-
-            return CacheEntry(
-                id=row[0],
-                query_type=row[1],
-                log_group=row[2],
-                start_time=row[3],
-                end_time=row[4],
-                filter_pattern=row[5],
-                payload=payload,
-                payload_size=row[7],
-                log_count=row[8],
-                created_at=row[9],
-                expires_at=row[10],
-                last_accessed=now,
-                hit_count=row[12] + 1,
-            )
+        await db.commit()
+
+        try:
+            return CacheEntry.from_row(row)
+        except json.JSONDecodeError:
+            # If cache DB gets corrupted, don't crash - just skip the entry
+            # Log warning and delete corrupted entry
+            await db.execute("DELETE FROM cache_entries WHERE id = ?", (key,))
+            await db.commit()
+            return None
+
+    @staticmethod
+    def _entry_row(entry: CacheEntry) -> tuple[Any, ...]:
+        """Convert a cache entry to an INSERT parameter row."""
+        return (
+            entry.id,
+            entry.query_type,
+            entry.log_group,
+            entry.start_time,
+            entry.end_time,
+            entry.filter_pattern,
+            _dumps_payload(entry.payload),
+            entry.payload_size,
+            entry.log_count,
+            entry.created_at,
+            entry.expires_at,
+            entry.last_accessed,
+            entry.hit_count,
+        )
 
     async def set(self, entry: CacheEntry) -> None:
         """Store a cache entry.
@@ -196,36 +319,39 @@ class SQLiteStore:
         Args:
             entry: Cache entry to store
         """
-        await self.initialize()
+        db = await self._connection()
+        await db.execute(_INSERT_ENTRY_SQL, self._entry_row(entry))
+        await db.commit()
 
-        payload_json = json.dumps(entry.payload)
+    async def set_many(self, entries: Iterable[CacheEntry]) -> None:
+        """Store several cache entries in a single transaction.
 
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            await db.execute(
-                """
-                INSERT OR REPLACE INTO cache_entries
-                (id, query_type, log_group, start_time, end_time, filter_pattern,
-                 payload, payload_size, log_count, created_at, expires_at,
-                 last_accessed, hit_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    entry.id,
-                    entry.query_type,
-                    entry.log_group,
-                    entry.start_time,
-                    entry.end_time,
-                    entry.filter_pattern,
-                    payload_json,
-                    entry.payload_size,
-                    entry.log_count,
-                    entry.created_at,
-                    entry.expires_at,
-                    entry.last_accessed,
-                    entry.hit_count,
-                ),
-            )
-            await db.commit()
+        Args:
+            entries: Cache entries to store
+        """
+        rows = [self._entry_row(entry) for entry in entries]
+        if not rows:
+            return
+
+        db = await self._connection()
+        await db.executemany(_INSERT_ENTRY_SQL, rows)
+        await db.commit()
+
+    async def exists(self, key: str) -> bool:
+        """Check whether an unexpired entry exists, without counting a hit.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry exists and has not expired
+        """
+        db = await self._connection()
+        rows = await db.execute_fetchall(
+            "SELECT 1 FROM cache_entries WHERE id = ? AND expires_at >= ?",
+            (key, int(time.time())),
+        )
+        return bool(rows)
 
     async def delete(self, key: str) -> None:
         """Delete a cache entry by key.
@@ -233,11 +359,9 @@ class SQLiteStore:
         Args:
             key: Cache key
         """
-        await self.initialize()
-
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            await db.execute("DELETE FROM cache_entries WHERE id = ?", (key,))
-            await db.commit()
+        db = await self._connection()
+        await db.execute("DELETE FROM cache_entries WHERE id = ?", (key,))
+        await db.commit()
 
     async def delete_expired(self) -> int:
         """Delete all expired cache entries.
@@ -245,15 +369,13 @@ class SQLiteStore:
         Returns:
             Number of entries deleted
         """
-        await self.initialize()
-
         now = int(time.time())
 
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            cursor = await db.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
-            await db.commit()
-            result = cursor.rowcount
-            return int(result) if result is not None else 0
+        db = await self._connection()
+        cursor = await db.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
+        await db.commit()
+        result = cursor.rowcount
+        return int(result) if result is not None else 0
 
     async def delete_by_log_group(self, log_group: str) -> int:
         """Delete all entries for a specific log group.
@@ -264,13 +386,11 @@ class SQLiteStore:
         Returns:
             Number of entries deleted
         """
-        await self.initialize()
-
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            cursor = await db.execute("DELETE FROM cache_entries WHERE log_group = ?", (log_group,))
-            await db.commit()
-            result = cursor.rowcount
-            return int(result) if result is not None else 0
+        db = await self._connection()
+        cursor = await db.execute("DELETE FROM cache_entries WHERE log_group = ?", (log_group,))
+        await db.commit()
+        result = cursor.rowcount
+        return int(result) if result is not None else 0
 
     async def clear(self) -> int:
         """Clear all cache entries.
@@ -278,13 +398,11 @@ class SQLiteStore:
         Returns:
             Number of entries deleted
         """
-        await self.initialize()
-
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            cursor = await db.execute("DELETE FROM cache_entries")
-            await db.commit()
-            result = cursor.rowcount
-            return int(result) if result is not None else 0
+        db = await self._connection()
+        cursor = await db.execute("DELETE FROM cache_entries")
+        await db.commit()
+        result = cursor.rowcount
+        return int(result) if result is not None else 0
 
     async def get_cache_size(self) -> int:
         """Get total cache size in bytes.
@@ -292,14 +410,10 @@ class SQLiteStore:
         Returns:
             Total size of all payloads in bytes
         """
-        await self.initialize()
-
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            async with db.execute(
-                "SELECT COALESCE(SUM(payload_size), 0) FROM cache_entries"
-            ) as cursor:
-                row = await cursor.fetchone()
-                return int(row[0]) if row else 0
+        db = await self._connection()
+        rows = await db.execute_fetchall("SELECT COALESCE(SUM(payload_size), 0) FROM cache_entries")
+        row = next(iter(rows), None)
+        return int(row[0]) if row else 0
 
     async def get_entry_count(self) -> int:
         """Get total number of cache entries.
@@ -307,12 +421,10 @@ class SQLiteStore:
         Returns:
             Number of cache entries
         """
-        await self.initialize()
-
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            async with db.execute("SELECT COUNT(*) FROM cache_entries") as cursor:
-                row = await cursor.fetchone()
-                return int(row[0]) if row else 0
+        db = await self._connection()
+        rows = await db.execute_fetchall("SELECT COUNT(*) FROM cache_entries")
+        row = next(iter(rows), None)
+        return int(row[0]) if row else 0
 
     async def get_lru_entries(self, limit: int = 100) -> list[str]:
         """Get least recently used entries.
@@ -323,19 +435,16 @@ class SQLiteStore:
         Returns:
             List of cache entry IDs
         """
-        await self.initialize()
-
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            async with db.execute(
-                """
-                SELECT id FROM cache_entries
-                ORDER BY last_accessed ASC
-                LIMIT ?
-                """,
-                (limit,),
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return [row[0] for row in rows]
+        db = await self._connection()
+        rows = await db.execute_fetchall(
+            """
+            SELECT id FROM cache_entries
+            ORDER BY last_accessed ASC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return [row[0] for row in rows]
 
     async def delete_entries(self, entry_ids: list[str]) -> int:
         """Delete multiple cache entries by ID.
@@ -349,16 +458,14 @@ class SQLiteStore:
         if not entry_ids:
             return 0
 
-        await self.initialize()
-
         placeholders = ",".join("?" * len(entry_ids))
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            cursor = await db.execute(
-                f"DELETE FROM cache_entries WHERE id IN ({placeholders})", entry_ids
-            )
-            await db.commit()
-            result = cursor.rowcount
-            return int(result) if result is not None else 0
+        db = await self._connection()
+        cursor = await db.execute(
+            f"DELETE FROM cache_entries WHERE id IN ({placeholders})", entry_ids
+        )
+        await db.commit()
+        result = cursor.rowcount
+        return int(result) if result is not None else 0
 
     async def get_statistics(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -366,49 +473,30 @@ class SQLiteStore:
         Returns:
             Dictionary of cache statistics
         """
-        await self.initialize()
+        now = int(time.time())
 
-        async with aiosqlite.connect(str(self.db_path)) as db:
-            # Get entry count
-            async with db.execute("SELECT COUNT(*) FROM cache_entries") as cursor:
-                row = await cursor.fetchone()
-                entry_count = row[0] if row else 0
-
-            # Get total size
-            async with db.execute(
-                "SELECT COALESCE(SUM(payload_size), 0) FROM cache_entries"
-            ) as cursor:
-                row = await cursor.fetchone()
-                total_size = row[0] if row else 0
-
-            # Get total log count
-            async with db.execute(
-                "SELECT COALESCE(SUM(log_count), 0) FROM cache_entries"
-            ) as cursor:
-                row = await cursor.fetchone()
-                total_logs = row[0] if row else 0
-
-            # Get total hits
-            async with db.execute(
-                "SELECT COALESCE(SUM(hit_count), 0) FROM cache_entries"
-            ) as cursor:
-                row = await cursor.fetchone()
-                total_hits = row[0] if row else 0
-
-            # Get expired count
-            now = int(time.time())
-            async with db.execute(
-                "SELECT COUNT(*) FROM cache_entries WHERE expires_at < ?", (now,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                expired_count = row[0] if row else 0
-
-            return {
-                "entry_count": entry_count,
-                "total_size_bytes": total_size,
-                "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "total_logs": total_logs,
-                "total_hits": total_hits,
-                "expired_count": expired_count,
-                "db_path": str(self.db_path),
-            }
+        db = await self._connection()
+        # One scan for every statistic
+        rows = await db.execute_fetchall(
+            """
+            SELECT COUNT(*),
+                   COALESCE(SUM(payload_size), 0),
+                   COALESCE(SUM(log_count), 0),
+                   COALESCE(SUM(hit_count), 0),
+                   COALESCE(SUM(expires_at < ?), 0)
+            FROM cache_entries
+            """,
+            (now,),
+        )
+        row = next(iter(rows), None)
+        entry_count, total_size, total_logs, total_hits, expired_count = row or (0, 0, 0, 0, 0)
+
+        return {
+            "entry_count": entry_count,
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "total_logs": total_logs,
+            "total_hits": total_hits,
+            "expired_count": expired_count,
+            "db_path": str(self.db_path),
+        }
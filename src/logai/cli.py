@@ -11,6 +11,7 @@ from logai.cache.manager import CacheManager
 from logai.config import get_settings
 from logai.core.orchestrator import LLMOrchestrator
 from logai.core.sanitizer import LogSanitizer
+from logai.core.semantic_cache import SemanticCache
 from logai.core.tools.registry import ToolRegistry
 from logai.providers.datasources.cloudwatch import CloudWatchDataSource
 from logai.providers.llm.litellm_provider import LiteLLMProvider
@@ -327,7 +328,10 @@ For more information, visit: https://github.com/logai/logai
     try:
         # Initialize components
         datasource = CloudWatchDataSource(settings)
-        sanitizer = LogSanitizer(enabled=settings.pii_sanitization_enabled)
+        sanitizer = LogSanitizer(
+            enabled=settings.pii_sanitization_enabled,
+            use_hyperscan=settings.pii_sanitization_use_hyperscan,
+        )
         cache_manager = CacheManager(settings)
 
         # Import and register tools
@@ -380,6 +384,18 @@ For more information, visit: https://github.com/logai/logai
         # Initialize LLM provider
         llm_provider = LiteLLMProvider.from_settings(settings)
 
+        # Optional semantic cache for paraphrased opening questions
+        semantic_cache = None
+        if settings.enable_semantic_cache:
+            try:
+                semantic_cache = SemanticCache(threshold=settings.semantic_cache_threshold)
+                print("✓ Semantic cache enabled")
+            except ImportError:
+                print(
+                    "⚠️  Warning: sentence-transformers not installed, semantic cache disabled",
+                    file=sys.stderr,
+                )
+
         # Initialize orchestrator with context management
         orchestrator = LLMOrchestrator(
             llm_provider=llm_provider,
@@ -389,6 +405,7 @@ For more information, visit: https://github.com/logai/logai
             cache=cache_manager,
             log_group_manager=log_group_manager,
             result_cache=result_cache,
+            semantic_cache=semantic_cache,
         )
 
         print("✓ All components initialized")
@@ -1,5 +1,6 @@
 """Configuration settings for LogAI using Pydantic Settings."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Literal
@@ -97,6 +98,10 @@ class LogAISettings(BaseSettings):
         default=True,
         description="Enable PII sanitization before sending logs to LLM",
     )
+    pii_sanitization_use_hyperscan: bool = Field(
+        default=False,
+        description="Prefilter log text with Hyperscan before PII sanitization (requires hyperscan)",
+    )
 
     # === UI Settings ===
     log_groups_sidebar_visible: bool = Field(
@@ -206,6 +211,22 @@ class LogAISettings(BaseSettings):
     )
 
     # === Result Handling ===
+    response_cache_size: int = Field(
+        default=0,
+        description="Number of tool-free LLM answers kept in memory for identical conversations (0 disables)",
+        ge=0,
+        le=10000,
+    )
+    enable_semantic_cache: bool = Field(
+        default=False,
+        description="Answer paraphrased opening questions from earlier answers (requires sentence-transformers)",
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        description="Minimum cosine similarity for a semantic cache hit",
+        ge=0.5,
+        le=1.0,
+    )
     enable_result_caching: bool = Field(
         default=True,
         description="Enable caching of large tool results outside context window",
@@ -243,6 +264,13 @@ class LogAISettings(BaseSettings):
         le=100,
     )
 
+    history_max_messages: int = Field(
+        default=200,
+        description="Maximum number of messages kept in conversation history (oldest dropped first)",
+        ge=10,
+        le=1000,
+    )
+
     enable_history_summarization: bool = Field(
         default=False,
         description="Enable summarization of pruned history (future feature)",
@@ -364,20 +392,13 @@ class LogAISettings(BaseSettings):
         raise ValueError(f"Unknown LLM provider: {self.llm_provider}")
 
 
-# Global settings instance
-_settings: LogAISettings | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_settings() -> LogAISettings:
     """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = LogAISettings()
-    return _settings
+    return LogAISettings()
 
 
 def reload_settings() -> LogAISettings:
     """Reload settings from environment (useful for testing)."""
-    global _settings
-    _settings = LogAISettings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
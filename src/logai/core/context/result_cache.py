@@ -4,15 +4,62 @@ import hashlib
 import json
 import logging
 import time
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import pairwise
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_result(result: dict[str, Any]) -> tuple[str, int]:
+    """
+    Serialize a result to JSON, with orjson when it is installed.
+
+    Args:
+        result: Result dictionary
+
+    Returns:
+        Tuple of (JSON text, size in UTF-8 bytes)
+
+    Raises:
+        TypeError: If the result isn't JSON serializable
+    """
+    if orjson is not None:
+        data = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+        return data.decode(), len(data)
+    text = json.dumps(result)
+    # json.dumps escapes non-ASCII, so characters and UTF-8 bytes coincide
+    return text, len(text)
+
+
+def _loads_result(data: str) -> Any:
+    """
+    Parse a cached JSON result, with orjson when it is installed.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed result
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 @dataclass
 class CachedResultSummary:
     """Summary of a cached result for context inclusion."""
@@ -61,6 +108,62 @@ class CachedResultSummary:
         }
 
 
+# (filter_pattern, time_start, time_end) of a fetch_chunk call
+_FilterKey = tuple[str | None, int | None, int | None]
+
+
+@dataclass
+class _DecodedEvents:
+    """Decoded events of a cache entry, memoized across fetch_chunk calls."""
+
+    # (created_at, data_size_bytes) of the entry the events were decoded from
+    version: tuple[int, int]
+    events: list[dict[str, Any]]
+    # Filtered event lists keyed by (filter_pattern, time_start, time_end) (LRU order)
+    filtered: OrderedDict[_FilterKey, list[dict[str, Any]]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _messages_lower: list[str] | None = field(default=None, repr=False)
+    _sorted_timestamps: list[Any] | None = field(default=None, repr=False)
+    _timestamps_checked: bool = field(default=False, repr=False)
+
+    def sorted_timestamps(self) -> list[Any] | None:
+        """
+        Event timestamps, aligned with events, if they are in ascending order.
+
+        Built and checked on first use, so time range filters over the same
+        entry can binary search without rescanning the events.
+
+        Returns:
+            List of timestamps, or None if the events are unordered or
+            missing timestamps
+        """
+        if not self._timestamps_checked:
+            timestamps: list[Any] = [e.get("timestamp") for e in self.events]
+            try:
+                ordered = all(a <= b for a, b in pairwise(timestamps))
+            except TypeError:
+                # Missing timestamps (None) can't be ordered
+                ordered = False
+            self._sorted_timestamps = timestamps if ordered else None
+            self._timestamps_checked = True
+        return self._sorted_timestamps
+
+    def messages_lower(self) -> list[str]:
+        """
+        Lowercased event messages, aligned with events.
+
+        Built on first use, so repeated pattern filters over the same entry
+        don't lowercase every message again.
+
+        Returns:
+            List of lowercased messages
+        """
+        if self._messages_lower is None:
+            self._messages_lower = [e.get("message", "").lower() for e in self.events]
+        return self._messages_lower
+
+
 class ResultCacheManager:
     """
     Manages caching of large tool results outside the context window.
@@ -80,6 +183,8 @@ class ResultCacheManager:
     DEFAULT_TTL_SECONDS = 3600  # 1 hour
     MAX_SAMPLE_EVENTS = 5
     MAX_CACHE_SIZE_MB = 100
+    MAX_DECODED_RESULTS = 4
+    MAX_FILTERED_VIEWS = 8  # Per decoded result
 
     def __init__(
         self,
@@ -102,6 +207,9 @@ class ResultCacheManager:
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self._initialized = False
 
+        # Decoded events of recently fetched entries, keyed by cache_id (LRU order)
+        self._decoded_events: OrderedDict[str, _DecodedEvents] = OrderedDict()
+
     async def initialize(self) -> None:
         """Initialize database schema."""
         if self._initialized:
@@ -151,7 +259,7 @@ class ResultCacheManager:
                     total += 1
                     cache_id, result_data = row
                     try:
-                        json.loads(result_data)
+                        _loads_result(result_data)
                     except json.JSONDecodeError:
                         corrupted.append(cache_id)
                         logger.warning(f"Found corrupted cache entry: {cache_id}")
@@ -321,17 +429,14 @@ class ResultCacheManager:
         time_range = self._extract_time_range(events)
         sample_events = self._sample_events(events)
 
-        # Serialize result with validation
+        # Serialize result (the parser accepts anything the serializer produces,
+        # so serializing is the validation)
         try:
-            result_json = json.dumps(result)
-            # Validate by parsing it back to ensure it's valid JSON
-            json.loads(result_json)
-        except (TypeError, ValueError, json.JSONDecodeError) as e:
+            result_json, data_size = _dumps_result(result)
+        except (TypeError, ValueError) as e:
             logger.error(f"Failed to serialize result for caching: {e}")
             raise ValueError(f"Cannot cache result: invalid JSON structure - {str(e)}") from e
 
-        data_size = len(result_json.encode("utf-8"))
-
         now = int(time.time())
         expires_at = now + self.ttl_seconds
 
@@ -340,6 +445,9 @@ class ResultCacheManager:
             f"expires_at={expires_at} (TTL={self.ttl_seconds}s)"
         )
 
+        # A re-cached query replaces the entry, so drop any decoded copy
+        self._decoded_events.pop(cache_id, None)
+
         # Store in database
         async with aiosqlite.connect(str(self.db_path)) as db:
             try:
@@ -419,10 +527,10 @@ class ResultCacheManager:
         limit = min(limit, 200)
 
         async with aiosqlite.connect(str(self.db_path)) as db:
-            # Fetch cached result
+            # Fetch cache entry metadata (the payload is only loaded on a memo miss)
             async with db.execute(
                 """
-                SELECT result_data, event_count, expires_at
+                SELECT event_count, expires_at, created_at, data_size_bytes
                 FROM cached_results
                 WHERE cache_id = ?
             """,
@@ -432,13 +540,14 @@ class ResultCacheManager:
 
             if not row:
                 logger.warning(f"Cache miss: No entry found for cache_id={cache_id}")
+                self._decoded_events.pop(cache_id, None)
                 return {
                     "success": False,
                     "error": f"Cache entry '{cache_id}' not found",
                     "hint": "The cached result may have expired. Re-run the original query.",
                 }
 
-            result_data, event_count, expires_at = row
+            event_count, expires_at, created_at, data_size = row
 
             current_time = int(time.time())
             time_until_expiry = expires_at - current_time
@@ -454,6 +563,7 @@ class ResultCacheManager:
                 logger.warning(
                     f"Cache entry expired: cache_id={cache_id}, expired {expired_seconds_ago}s ago"
                 )
+                self._decoded_events.pop(cache_id, None)
                 await db.execute("DELETE FROM cached_results WHERE cache_id = ?", (cache_id,))
                 await db.commit()
                 return {
@@ -462,22 +572,42 @@ class ResultCacheManager:
                     "hint": "Re-run the original query to get fresh results.",
                 }
 
-            # Parse result BEFORE committing the access stats update
-            # This allows us to detect corruption and delete in the SAME transaction
-            try:
-                result = json.loads(result_data)
-            except json.JSONDecodeError as e:
-                logger.error(f"Cache {cache_id} contains corrupted JSON: {e}")
-                # Delete in the SAME transaction context (still inside async with db:)
-                await db.execute("DELETE FROM cached_results WHERE cache_id = ?", (cache_id,))
-                await db.commit()
-                return {
-                    "success": False,
-                    "error": "Cached result is corrupted and has been removed",
-                    "hint": "The cached data was invalid. Please re-run the original query to get fresh results.",
-                    "action_required": "Re-execute the original CloudWatch query",
-                    "cache_id": cache_id,
-                }
+            # Paging through a result fetches the same entry repeatedly, so the
+            # decoded events are memoized per entry version instead of parsing
+            # the full payload on every call
+            version = (created_at, data_size)
+            decoded = self._decoded_events.get(cache_id)
+            if decoded is not None and decoded.version == version:
+                self._decoded_events.move_to_end(cache_id)
+            else:
+                async with db.execute(
+                    "SELECT result_data FROM cached_results WHERE cache_id = ?",
+                    (cache_id,),
+                ) as cursor:
+                    data_row = await cursor.fetchone()
+                result_data = data_row[0] if data_row else "{}"
+
+                # Parse result BEFORE committing the access stats update
+                # This allows us to detect corruption and delete in the SAME transaction
+                try:
+                    result = _loads_result(result_data)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Cache {cache_id} contains corrupted JSON: {e}")
+                    # Delete in the SAME transaction context (still inside async with db:)
+                    await db.execute("DELETE FROM cached_results WHERE cache_id = ?", (cache_id,))
+                    await db.commit()
+                    return {
+                        "success": False,
+                        "error": "Cached result is corrupted and has been removed",
+                        "hint": "The cached data was invalid. Please re-run the original query to get fresh results.",
+                        "action_required": "Re-execute the original CloudWatch query",
+                        "cache_id": cache_id,
+                    }
+
+                decoded = _DecodedEvents(
+                    version=version, events=result.get("events", result.get("logs", []))
+                )
+                self._remember_events(cache_id, decoded)
 
             # Only update access stats if parsing succeeded
             await db.execute(
@@ -490,25 +620,8 @@ class ResultCacheManager:
             )
             await db.commit()
 
-        # Extract events
-        events = result.get("events", result.get("logs", []))
-
-        # Apply filters
-        filtered_events = events
-
-        if filter_pattern:
-            pattern_lower = filter_pattern.lower()
-            filtered_events = [
-                e for e in filtered_events if pattern_lower in e.get("message", "").lower()
-            ]
-
-        if time_start is not None:
-            filtered_events = [e for e in filtered_events if e.get("timestamp", 0) >= time_start]
-
-        if time_end is not None:
-            filtered_events = [
-                e for e in filtered_events if e.get("timestamp", float("inf")) <= time_end
-            ]
+        # Apply filters (reused across pages of the same filtered view)
+        filtered_events = self._filtered_events(decoded, filter_pattern, time_start, time_end)
 
         # Apply pagination
         total_filtered = len(filtered_events)
@@ -536,6 +649,160 @@ class ResultCacheManager:
             },
         }
 
+    def _remember_events(self, cache_id: str, decoded: _DecodedEvents) -> None:
+        """
+        Memoize the decoded events of a cache entry, evicting the oldest.
+
+        Args:
+            cache_id: Cache ID of the entry
+            decoded: Decoded events of the entry
+        """
+        self._decoded_events[cache_id] = decoded
+        self._decoded_events.move_to_end(cache_id)
+        if len(self._decoded_events) > self.MAX_DECODED_RESULTS:
+            self._decoded_events.popitem(last=False)
+
+    def _filtered_events(
+        self,
+        decoded: _DecodedEvents,
+        filter_pattern: str | None,
+        time_start: int | None,
+        time_end: int | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the events of an entry matching the filters, computing them once per filter.
+
+        Paginating a filtered view asks for the same filters on every page, so
+        the filtered list (and with it total_filtered) is memoized on the entry
+        and each page only slices it.
+
+        Args:
+            decoded: Decoded events of the entry
+            filter_pattern: Optional text pattern to filter events
+            time_start: Optional start timestamp filter (epoch milliseconds)
+            time_end: Optional end timestamp filter (epoch milliseconds)
+
+        Returns:
+            Events matching all filters, in their original order
+        """
+        key = (filter_pattern, time_start, time_end)
+        filtered = decoded.filtered.get(key)
+        if filtered is not None:
+            decoded.filtered.move_to_end(key)
+            return filtered
+
+        filtered = self._apply_filters(decoded, filter_pattern, time_start, time_end)
+        decoded.filtered[key] = filtered
+        if len(decoded.filtered) > self.MAX_FILTERED_VIEWS:
+            decoded.filtered.popitem(last=False)
+        return filtered
+
+    def _apply_filters(
+        self,
+        decoded: _DecodedEvents,
+        filter_pattern: str | None,
+        time_start: int | None,
+        time_end: int | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Filter the events of an entry by text pattern and time range.
+
+        Args:
+            decoded: Decoded events of the entry
+            filter_pattern: Optional text pattern to filter events (case-insensitive)
+            time_start: Optional start timestamp filter (epoch milliseconds)
+            time_end: Optional end timestamp filter (epoch milliseconds)
+
+        Returns:
+            Events matching all filters, in their original order
+        """
+        # Time range first, so the pattern only scans the window
+        filtered_events = decoded.events
+        # Lowercased messages aligned with filtered_events, while they stay aligned
+        messages_lower = decoded.messages_lower() if filter_pattern else None
+
+        if time_start is not None or time_end is not None:
+            window = self._time_window(decoded, time_start, time_end)
+            if window is not None:
+                filtered_events = filtered_events[window]
+                if messages_lower is not None:
+                    messages_lower = messages_lower[window]
+            else:
+                filtered_events = self._filter_time_range(filtered_events, time_start, time_end)
+                messages_lower = None
+
+        if filter_pattern:
+            pattern_lower = filter_pattern.lower()
+            if messages_lower is not None:
+                filtered_events = [
+                    e
+                    for e, message in zip(filtered_events, messages_lower, strict=True)
+                    if pattern_lower in message
+                ]
+            else:
+                filtered_events = [
+                    e for e in filtered_events if pattern_lower in e.get("message", "").lower()
+                ]
+
+        return filtered_events
+
+    def _time_window(
+        self,
+        decoded: _DecodedEvents,
+        time_start: int | None,
+        time_end: int | None,
+    ) -> slice | None:
+        """
+        Locate the events with time_start <= timestamp <= time_end by binary search.
+
+        Cached results are usually already in ascending timestamp order, which
+        makes the time range a contiguous slice of the events.
+
+        Args:
+            decoded: Decoded events of the entry
+            time_start: Optional start timestamp (epoch milliseconds, inclusive)
+            time_end: Optional end timestamp (epoch milliseconds, inclusive)
+
+        Returns:
+            Slice of the entry's events within the time range, or None if the
+            events are unordered or missing timestamps
+        """
+        timestamps = decoded.sorted_timestamps()
+        if timestamps is None:
+            return None
+        try:
+            lo = 0 if time_start is None else bisect_left(timestamps, time_start)
+            hi = len(timestamps) if time_end is None else bisect_right(timestamps, time_end)
+        except TypeError:
+            # Timestamps of a type that can't be compared with the bounds
+            return None
+        return slice(lo, hi)
+
+    def _filter_time_range(
+        self,
+        events: list[dict[str, Any]],
+        time_start: int | None,
+        time_end: int | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Filter events to those with time_start <= timestamp <= time_end by linear scan.
+
+        Args:
+            events: List of event dictionaries
+            time_start: Optional start timestamp (epoch milliseconds, inclusive)
+            time_end: Optional end timestamp (epoch milliseconds, inclusive)
+
+        Returns:
+            Events within the time range, in their original order
+        """
+        if time_start is not None:
+            events = [e for e in events if e.get("timestamp", 0) >= time_start]
+
+        if time_end is not None:
+            events = [e for e in events if e.get("timestamp", float("inf")) <= time_end]
+
+        return events
+
     async def delete_expired(self) -> int:
         """
         Delete all expired cache entries.
@@ -557,6 +824,24 @@ class ResultCacheManager:
 
         return deleted_count
 
+    async def clear(self) -> int:
+        """
+        Delete all cache entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(str(self.db_path)) as db:
+            cursor = await db.execute("DELETE FROM cached_results")
+            await db.commit()
+            deleted_count = cursor.rowcount or 0
+
+        self._decoded_events.clear()
+
+        return deleted_count
+
     async def _enforce_size_limit(self) -> None:
         """Enforce cache size limit by removing oldest entries."""
         await self.initialize()
@@ -621,7 +906,7 @@ class ResultCacheManager:
                     total += 1
                     cache_id, result_data = row
                     try:
-                        json.loads(result_data)
+                        _loads_result(result_data)
                     except json.JSONDecodeError:
                         corrupted.append(cache_id)
                         logger.warning(f"Found corrupted cache entry: {cache_id}")
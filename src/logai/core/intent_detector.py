@@ -91,6 +91,19 @@ class IntentDetector:
         r"\bunfortunately[,]?\s+(i\s+)?((could\s*n[''']?t|could\s+not)|was\s+unable)\b",
     ]
 
+    # Patterns are static, so compile them once. The combined screens let the
+    # common case (no match at all) be decided with a single regex scan.
+    _COMPILED_INTENT_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), intent_type, confidence)
+        for pattern, intent_type, confidence in INTENT_PATTERNS
+    ]
+    _INTENT_SCREEN = re.compile(
+        "|".join(f"(?:{pattern})" for pattern, _, _ in INTENT_PATTERNS), re.IGNORECASE
+    )
+    _GIVING_UP_SCREEN = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in GIVING_UP_PATTERNS), re.IGNORECASE
+    )
+
     @classmethod
     def detect_intent(cls, response_text: str) -> DetectedIntent | None:
         """Detect if response contains stated intent without action.
@@ -110,8 +123,12 @@ class IntentDetector:
 
         text_lower = response_text.lower()
 
-        for pattern, intent_type, confidence in cls.INTENT_PATTERNS:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        if not cls._INTENT_SCREEN.search(text_lower):
+            return None
+
+        # Patterns are checked in priority order, not by position in the text
+        for pattern, intent_type, confidence in cls._COMPILED_INTENT_PATTERNS:
+            matches = pattern.findall(text_lower)
             if matches:
                 # Skip ANALYZE intents - those don't need tool calls
                 # Analysis is something the agent can do on already-retrieved data
@@ -145,13 +162,7 @@ class IntentDetector:
         if not response_text:
             return False
 
-        text_lower = response_text.lower()
-
-        for pattern in cls.GIVING_UP_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
-
-        return False
+        return cls._GIVING_UP_SCREEN.search(response_text.lower()) is not None
 
     @classmethod
     def _get_suggested_action(cls, intent_type: IntentType) -> str:
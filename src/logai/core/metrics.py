@@ -86,6 +86,33 @@ class MetricsCollector:
         )
         self._events.append(event)
 
+    def bulk_increment(self, counters: dict[tuple[str, frozenset[tuple[str, str]]], float]) -> None:
+        """Increment several counter metrics in a single call.
+
+        This lets callers accumulate increments locally (e.g. over one
+        conversation turn) and hand them over at once instead of recording
+        an event per increment.
+
+        Args:
+            counters: Mapping of (name, frozenset of label items) to the amount
+                to increment by
+
+        Example:
+            metrics.bulk_increment({("retry_attempts", frozenset({("reason", "empty_logs")})): 2.0})
+        """
+        if not self._enabled or not counters:
+            return
+
+        self._events.extend(
+            MetricEvent(
+                name=name,
+                type=MetricType.COUNTER,
+                value=value,
+                labels=dict(labels),
+            )
+            for (name, labels), value in counters.items()
+        )
+
     def record_histogram(
         self, name: str, value: float, labels: dict[str, str] | None = None
     ) -> None:
@@ -1,9 +1,12 @@
 """LLM Orchestrator - coordinates LLM interactions with tool execution."""
 
 import asyncio
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Callable
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -16,6 +19,7 @@ from logai.core.context.token_counter import TokenCounter
 from logai.core.intent_detector import IntentDetector
 from logai.core.metrics import MetricsCollector, MetricsTimer
 from logai.core.sanitizer import LogSanitizer
+from logai.core.semantic_cache import SemanticCache
 from logai.core.tools.registry import ToolRegistry
 from logai.providers.llm.base import BaseLLMProvider, LLMProviderError, LLMResponse
 
@@ -26,6 +30,86 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _OrchestratorConfig:
+    """Snapshot of the settings the orchestrator reads on every conversation turn.
+
+    Reading these once at construction time avoids repeated attribute lookups
+    on the settings model inside the tool-calling loop.
+    """
+
+    model: str
+    max_tool_iterations: int
+    max_retry_attempts: int
+    intent_detection_enabled: bool
+    auto_retry_enabled: bool
+    enable_result_caching: bool
+    cache_large_results_threshold: int
+    enable_history_pruning: bool
+    history_max_messages: int
+    context_warning_threshold_pct: float
+    enable_auto_fetch_guidance: bool
+    initial_chunk_size: int
+    response_cache_size: int
+
+    @classmethod
+    def from_settings(cls, settings: LogAISettings) -> "_OrchestratorConfig":
+        """Build a config snapshot from application settings."""
+        return cls(
+            model=settings.current_llm_model,
+            max_tool_iterations=settings.max_tool_iterations,
+            max_retry_attempts=settings.max_retry_attempts,
+            intent_detection_enabled=settings.intent_detection_enabled,
+            auto_retry_enabled=settings.auto_retry_enabled,
+            enable_result_caching=settings.enable_result_caching,
+            cache_large_results_threshold=settings.cache_large_results_threshold,
+            enable_history_pruning=settings.enable_history_pruning,
+            history_max_messages=settings.history_max_messages,
+            context_warning_threshold_pct=getattr(settings, "context_warning_threshold_pct", 80.0),
+            enable_auto_fetch_guidance=settings.enable_auto_fetch_guidance,
+            initial_chunk_size=settings.initial_chunk_size,
+            response_cache_size=getattr(settings, "response_cache_size", 0),
+        )
+
+
+@dataclass
+class ConversationSession:
+    """
+    Mutable state belonging to a single conversation.
+
+    Keeping this out of the orchestrator instance lets one orchestrator serve
+    several conversations concurrently, each passing its own session. The
+    response cache and semantic cache stay on the orchestrator and are shared
+    by all sessions.
+
+    Attributes:
+        history: Conversation messages exchanged so far
+        metrics_buffer: Counter increments buffered during the current turn
+        pending_context_injection: Context update (e.g. from /refresh) for the next LLM call
+        pending_cache_guidance: Details of tool results cached since the last LLM call
+        budget_tracker: Context budget tracker, created by the orchestrator on first use
+    """
+
+    history: list[dict[str, Any]] = field(default_factory=list)
+    metrics_buffer: dict[tuple[str, frozenset[tuple[str, str]]], float] = field(
+        default_factory=dict
+    )
+    pending_context_injection: str | None = None
+    pending_cache_guidance: list[dict[str, Any]] = field(default_factory=list)
+    budget_tracker: ContextBudgetTracker | None = None
+
+
+# Confidence bucket label per whole percentage point (0-100), see _confidence_bucket
+_CONFIDENCE_BUCKETS: tuple[str, ...] = tuple(
+    "high" if pct >= 90 else "medium" if pct >= 70 else "low" for pct in range(101)
+)
+
+# Session bound for the duration of a chat()/chat_stream() call
+_current_session: ContextVar[ConversationSession | None] = ContextVar(
+    "logai_conversation_session", default=None
+)
+
+
 class OrchestratorError(Exception):
     """Raised when orchestrator encounters an error."""
 
@@ -313,6 +397,7 @@ Current time: {current_time}
         metrics_collector: MetricsCollector | None = None,
         log_group_manager: "LogGroupManager | None" = None,
         result_cache: ResultCacheManager | None = None,
+        semantic_cache: SemanticCache | None = None,
     ):
         """
         Initialize LLM orchestrator.
@@ -326,31 +411,23 @@ Current time: {current_time}
             metrics_collector: Optional metrics collector for monitoring
             log_group_manager: Optional pre-loaded log group manager
             result_cache: Optional result cache manager (creates new if None)
+            semantic_cache: Optional cache answering paraphrased opening questions
         """
         self.llm_provider = llm_provider
         self.tool_registry = tool_registry
         self.sanitizer = sanitizer
         self.settings = settings
+        self._cfg = _OrchestratorConfig.from_settings(settings)
         self.cache = cache
-        self.conversation_history: list[dict[str, Any]] = []
         self.metrics = metrics_collector or MetricsCollector()
         self.log_group_manager = log_group_manager
 
+        # Session used when callers don't pass their own
+        self._default_session = ConversationSession()
+
         # Tool call listeners for sidebar integration
         self.tool_call_listeners: list[Callable[[Any], None]] = []
 
-        # Runtime context injections (for /refresh updates)
-        self._pending_context_injection: str | None = None
-
-        # Track pending context injections for cached results
-        self._pending_cache_guidance: dict[str, Any] | None = None
-
-        # Context management components
-        self.budget_tracker = ContextBudgetTracker(
-            settings=settings,
-            model=settings.current_llm_model,
-        )
-
         # Use provided result cache or create new one
         self.result_cache = result_cache or ResultCacheManager(
             cache_dir=settings.cache_dir / "results",
@@ -361,29 +438,60 @@ Current time: {current_time}
         # Context notification callback for UI updates
         self._context_notification_callback: Callable[[str, str], None] | None = None
 
+        # Final answers of tool-free turns, keyed by model, log groups and conversation (LRU order)
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
+        self.semantic_cache = semantic_cache
+
         logger.info("LLM Orchestrator initialized with context management")
 
-    def _get_system_prompt(self) -> str:
+    @property
+    def _session(self) -> ConversationSession:
+        """Session for the chat call in progress, or the default session."""
+        return _current_session.get() or self._default_session
+
+    @property
+    def conversation_history(self) -> list[dict[str, Any]]:
+        """Conversation history of the current session."""
+        return self._session.history
+
+    @property
+    def budget_tracker(self) -> ContextBudgetTracker:
+        """Context budget tracker of the current session."""
+        session = self._session
+        if session.budget_tracker is None:
+            session.budget_tracker = ContextBudgetTracker(
+                settings=self.settings,
+                model=self._cfg.model,
+            )
+        return session.budget_tracker
+
+    def _get_log_groups_context(self) -> str:
         """
-        Get the system prompt with current context.
+        Get the log group section of the system prompt.
 
         Returns:
-            Formatted system prompt including log group context
+            Known log groups from the manager, or instructions to discover them
         """
-        now = datetime.now(UTC)
-
-        # Get log groups context from manager if available
         if self.log_group_manager and self.log_group_manager.is_ready:
-            log_groups_context = self.log_group_manager.format_for_prompt()
-        else:
-            log_groups_context = """## Log Groups
+            return self.log_group_manager.format_for_prompt()
+
+        return """## Log Groups
 
 Log groups will be discovered via the `list_log_groups` tool.
 Use this tool to find available log groups before querying logs."""
 
+    def _get_system_prompt(self) -> str:
+        """
+        Get the system prompt with current context.
+
+        Returns:
+            Formatted system prompt including log group context
+        """
+        now = datetime.now(UTC)
+
         return self.SYSTEM_PROMPT.format(
             current_time=now.strftime("%Y-%m-%d %H:%M:%S UTC"),
-            log_groups_context=log_groups_context,
+            log_groups_context=self._get_log_groups_context(),
         )
 
     def register_tool_listener(self, callback: Callable[[Any], None]) -> None:
@@ -418,7 +526,9 @@ Use this tool to find available log groups before querying logs."""
             except Exception as e:
                 logger.warning(f"Tool listener error: {e}", exc_info=True)
 
-    def inject_context_update(self, context_message: str) -> None:
+    def inject_context_update(
+        self, context_message: str, session: ConversationSession | None = None
+    ) -> None:
         """
         Inject a context update to be included in the next LLM call.
 
@@ -427,33 +537,58 @@ Use this tool to find available log groups before querying logs."""
 
         Args:
             context_message: Message to inject as system context
+            session: Conversation to inject into (defaults to the current session)
         """
-        self._pending_context_injection = context_message
+        (session or self._session).pending_context_injection = context_message
 
     def _get_pending_context_injection(self) -> str | None:
-        """Get and clear any pending context injection."""
+        """Get and clear any pending context injection of the current session."""
+        session = self._session
+
         # Check for cache guidance first (higher priority)
-        if self._pending_cache_guidance and self.settings.enable_auto_fetch_guidance:
-            guidance = self._pending_cache_guidance
-            self._pending_cache_guidance = None  # Clear after use
+        if session.pending_cache_guidance and self._cfg.enable_auto_fetch_guidance:
+            guidance = session.pending_cache_guidance
+            session.pending_cache_guidance = []  # Clear after use
+
+            chunk_size = self._cfg.initial_chunk_size
+            if len(guidance) == 1:
+                header = (
+                    "The previous tool call returned a large result that was automatically cached."
+                )
+            else:
+                header = (
+                    f"The previous tool calls returned {len(guidance)} large results "
+                    "that were automatically cached."
+                )
+            caches = "\n".join(
+                f"Cache ID: {g['cache_id']}\nTotal Events: {g['total_events']}" for g in guidance
+            )
+            first_fetches = " and ".join(
+                f'fetch_cached_result_chunk(cache_id="{g["cache_id"]}", offset=0, limit={chunk_size})'
+                for g in guidance
+            )
+            next_fetches = " and ".join(
+                f'fetch_cached_result_chunk(cache_id="{g["cache_id"]}", '
+                f"offset={chunk_size}, limit={chunk_size})"
+                for g in guidance
+            )
 
-            return f"""SYSTEM INSTRUCTION: The previous tool call returned a large result that was automatically cached.
+            return f"""SYSTEM INSTRUCTION: {header}
 
-Cache ID: {guidance["cache_id"]}
-Total Events: {guidance["total_events"]}
+{caches}
 
 You MUST now fetch chunks to show the user actual log events:
-1. Immediately call: fetch_cached_result_chunk(cache_id="{guidance["cache_id"]}", offset=0, limit={self.settings.initial_chunk_size})
+1. Immediately call: {first_fetches}
 2. Analyze the results and determine if they answer the user's question
-3. If needed, fetch more chunks with increased offset: fetch_cached_result_chunk(cache_id="{guidance["cache_id"]}", offset={self.settings.initial_chunk_size}, limit={self.settings.initial_chunk_size})
+3. If needed, fetch more chunks with increased offset: {next_fetches}
 4. Provide a comprehensive response to the user with actual log events
 
 DO NOT just acknowledge the cache - the user expects to see log events. Execute the fetch immediately.
 """
 
         # Fall back to regular context injection (e.g., /refresh updates)
-        injection = self._pending_context_injection
-        self._pending_context_injection = None
+        injection = session.pending_context_injection
+        session.pending_context_injection = None
         return injection
 
     def _notify_context_event(self, level: str, message: str) -> None:
@@ -489,6 +624,89 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         """
         self._context_notification_callback = callback
 
+    def _increment_metric(self, name: str, labels: dict[str, str] | None = None) -> None:
+        """
+        Buffer a counter increment until the current turn ends.
+
+        Args:
+            name: Name of the counter metric
+            labels: Optional labels for the metric
+        """
+        if not self.metrics.is_enabled():
+            return
+
+        buffer = self._session.metrics_buffer
+        key = (name, frozenset((labels or {}).items()))
+        buffer[key] = buffer.get(key, 0.0) + 1.0
+
+    def _flush_metrics(self) -> None:
+        """Flush the current session's buffered counter increments to the collector."""
+        session = self._session
+        if not session.metrics_buffer:
+            return
+
+        buffer = session.metrics_buffer
+        session.metrics_buffer = {}
+        self.metrics.bulk_increment(buffer)
+
+    def _response_cache_key(self, messages: list[dict[str, Any]]) -> bytes:
+        """
+        Build the response cache key for a request.
+
+        The leading system prompt is replaced by its log group context: the
+        rest of the prompt is fixed apart from the current time, which would
+        otherwise make every key unique. A /refresh that changes the log
+        groups therefore changes the key.
+
+        Args:
+            messages: Messages about to be sent to the LLM
+
+        Returns:
+            Digest of the model name, log group context and conversation messages
+        """
+        payload = json.dumps(
+            [self._cfg.model, self._get_log_groups_context(), messages[1:]],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    def _lookup_cached_response(
+        self, messages: list[dict[str, Any]]
+    ) -> tuple[bytes | None, str | None]:
+        """
+        Look up the final answer of an identical earlier tool-free turn.
+
+        Args:
+            messages: Messages about to be sent to the LLM
+
+        Returns:
+            Tuple of (cache key, cached answer); the key is None when the
+            response cache is disabled and the answer is None on a miss
+        """
+        if self._cfg.response_cache_size <= 0:
+            return None, None
+
+        cache_key = self._response_cache_key(messages)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            self._increment_metric("response_cache_hits")
+        return cache_key, cached
+
+    def _store_cached_response(self, key: bytes, content: str) -> None:
+        """
+        Remember a final answer, evicting the least recently used entry when full.
+
+        Args:
+            key: Response cache key for the request
+            content: Final assistant answer
+        """
+        self._response_cache[key] = content
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self._cfg.response_cache_size:
+            self._response_cache.popitem(last=False)
+
     async def _process_tool_result(
         self,
         tool_result: dict[str, Any],
@@ -511,13 +729,13 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         tool_call_id = tool_result["tool_call_id"]
 
         # Skip processing if caching is disabled
-        if not self.settings.enable_result_caching:
+        if not self._cfg.enable_result_caching:
             return tool_result
 
         # Check if result should be cached based on size
         should_cache, token_count = self.budget_tracker.should_cache_result(
             result_data,
-            threshold=self.settings.cache_large_results_threshold,
+            threshold=self._cfg.cache_large_results_threshold,
         )
 
         if should_cache:
@@ -536,20 +754,21 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     result=result_data,
                 )
 
-                # Store pending injection for next LLM call
-                self._pending_cache_guidance = {
-                    "cache_id": summary.cache_id,
-                    "tool_name": tool_name,
-                    "total_events": summary.total_events,
-                }
+                # Queue guidance for the next LLM call; calls of one batch run
+                # concurrently, so each adds its own entry rather than replacing
+                self._session.pending_cache_guidance.append(
+                    {
+                        "cache_id": summary.cache_id,
+                        "tool_name": tool_name,
+                        "total_events": summary.total_events,
+                    }
+                )
 
                 # Use summary instead of full result
                 modified_result = summary.to_context_dict()
 
                 # Track the summary tokens
-                summary_tokens = TokenCounter.estimate_json_tokens(
-                    modified_result, self.settings.current_llm_model
-                )
+                summary_tokens = TokenCounter.estimate_json_tokens(modified_result, self._cfg.model)
                 self.budget_tracker.add_result_tokens(summary_tokens)
 
                 # Notify UI
@@ -571,7 +790,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                 )
 
                 # Record metric
-                self.metrics.increment(
+                self._increment_metric(
                     "result_cached",
                     labels={"tool": tool_name, "reason": "size_threshold"},
                 )
@@ -607,11 +826,11 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Returns:
             True if pruning is needed
         """
-        if not self.settings.enable_history_pruning:
+        if not self._cfg.enable_history_pruning:
             return False
 
         usage = self.budget_tracker.get_usage()
-        threshold = getattr(self.settings, "context_warning_threshold_pct", 80.0)
+        threshold = self._cfg.context_warning_threshold_pct
 
         return usage.utilization_pct >= threshold
 
@@ -674,11 +893,31 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         )
 
         # Record metric
-        self.metrics.increment(
+        self._increment_metric(
             "history_pruned",
             labels={"message_count": str(pruned_count)},
         )
 
+    def _trim_history_to_cap(self) -> None:
+        """
+        Drop the oldest messages once history exceeds the configured message cap.
+
+        Tool results left at the head of history without their originating
+        assistant message are dropped too, since providers reject them.
+        """
+        excess = len(self.conversation_history) - self._cfg.history_max_messages
+        if excess <= 0:
+            return
+
+        while (
+            excess < len(self.conversation_history)
+            and self.conversation_history[excess].get("role") == "tool"
+        ):
+            excess += 1
+
+        del self.conversation_history[:excess]
+        logger.debug(f"Trimmed {excess} oldest messages to respect history message cap")
+
     def _update_budget_tracker(self, messages: list[dict[str, Any]]) -> None:
         """
         Update budget tracker with current conversation state.
@@ -725,6 +964,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         self,
         user_message: str,
         stream: bool = False,
+        session: ConversationSession | None = None,
     ) -> str:
         """
         Process a user message through the LLM with tool execution.
@@ -733,6 +973,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
             user_message: User's message/query
             stream: Whether to stream the response (currently not supported in this method,
                    use chat_stream() instead for streaming)
+            session: Conversation to continue (defaults to the orchestrator's own session)
 
         Returns:
             Final response text
@@ -740,17 +981,24 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Raises:
             OrchestratorError: If orchestration fails
         """
-        return await self._chat_complete(user_message)
+        token = _current_session.set(session or self._default_session)
+        try:
+            return await self._chat_complete(user_message)
+        finally:
+            self._flush_metrics()
+            _current_session.reset(token)
 
     async def chat_stream(
         self,
         user_message: str,
+        session: ConversationSession | None = None,
     ) -> AsyncGenerator[str, None]:
         """
         Process a user message and stream the response.
 
         Args:
             user_message: User's message/query
+            session: Conversation to continue (defaults to the orchestrator's own session)
 
         Yields:
             Response tokens
@@ -758,8 +1006,27 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Raises:
             OrchestratorError: If orchestration fails
         """
-        async for token in self._chat_stream(user_message):
-            yield token
+        # Bind the session around each step of the inner generator only, so the
+        # binding never spans a yield (this generator may be closed elsewhere)
+        session = session or self._default_session
+        stream = self._chat_stream(user_message)
+        try:
+            while True:
+                context_token = _current_session.set(session)
+                try:
+                    token = await anext(stream)
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_session.reset(context_token)
+                yield token
+        finally:
+            context_token = _current_session.set(session)
+            try:
+                await stream.aclose()
+                self._flush_metrics()
+            finally:
+                _current_session.reset(context_token)
 
     async def _chat_complete(self, user_message: str) -> str:
         """Process message and return complete response.
@@ -777,10 +1044,14 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Returns:
             Complete response text
         """
+        # Semantic matches ignore history, so only opening questions use them
+        opening_turn = not self.conversation_history
+
         # Add user message to history
         self.conversation_history.append({"role": "user", "content": user_message})
 
-        # Prune history if needed (before preparing messages)
+        # Enforce the hard message cap, then prune further if the budget requires it
+        self._trim_history_to_cap()
         self._prune_history_if_needed()
 
         # Prepare messages with system prompt
@@ -793,6 +1064,21 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         if pending_injection:
             messages.append({"role": "system", "content": pending_injection})
 
+        semantic_cache = self.semantic_cache if opening_turn and not pending_injection else None
+        if semantic_cache is not None:
+            # Embedding is CPU-bound; keep it off the event loop that drives the TUI
+            semantic_hit = await asyncio.to_thread(semantic_cache.lookup, user_message)
+            if semantic_hit is not None:
+                self._increment_metric("semantic_cache_hits")
+                self.conversation_history.append({"role": "assistant", "content": semantic_hit})
+                return semantic_hit
+
+        # Serve identical tool-free conversations from the response cache
+        cache_key, cached = self._lookup_cached_response(messages)
+        if cached is not None:
+            self.conversation_history.append({"role": "assistant", "content": cached})
+            return cached
+
         # Update budget tracker with current state
         self._update_budget_tracker(messages)
         self._log_budget_status()
@@ -806,7 +1092,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
 
         # Execute conversation loop with tool calling
         iteration = 0
-        max_iterations = self.settings.max_tool_iterations
+        max_iterations = self._cfg.max_tool_iterations
         while iteration < max_iterations:
             iteration += 1
 
@@ -824,20 +1110,8 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
 
                 # Check if LLM wants to use tools
                 if response.has_tool_calls():
-                    # Execute tool calls
-                    tool_results = await self._execute_tool_calls(response.tool_calls)
-
-                    # Track tool calls for retry logic
-                    for tool_call in response.tool_calls:
-                        func_info = tool_call.get("function", {})
-                        retry_state.last_tool_name = func_info.get("name")
-                        try:
-                            args_str = func_info.get("arguments", "{}")
-                            retry_state.last_tool_args = (
-                                json.loads(args_str) if isinstance(args_str, str) else args_str
-                            )
-                        except json.JSONDecodeError:
-                            retry_state.last_tool_args = {}
+                    # Execute tool calls (also tracks the last call for retry logic)
+                    tool_results = await self._execute_tool_calls(response.tool_calls, retry_state)
 
                     # Add assistant message with tool calls to history
                     assistant_message: dict[str, Any] = {
@@ -863,9 +1137,9 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         tool_results, retry_state
                     )
 
-                    if should_retry and retry_state.should_retry(self.settings.max_retry_attempts):
+                    if should_retry and retry_state.should_retry(self._cfg.max_retry_attempts):
                         # Record retry metrics
-                        self.metrics.increment("retry_attempts", labels={"reason": retry_reason})
+                        self._increment_metric("retry_attempts", labels={"reason": retry_reason})
 
                         # Apply exponential backoff before retry
                         backoff_delay = self._calculate_backoff_delay(retry_state.attempts)
@@ -903,7 +1177,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         )
 
                         # Record successful retry metric
-                        self.metrics.increment(
+                        self._increment_metric(
                             "retry_prompt_injected", labels={"reason": retry_reason}
                         )
 
@@ -911,7 +1185,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         # Retry not triggered or max attempts reached
                         if should_retry:
                             # Max attempts reached - record failure
-                            self.metrics.increment(
+                            self._increment_metric(
                                 "retry_max_attempts_reached", labels={"reason": retry_reason}
                             )
 
@@ -919,12 +1193,12 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     continue
 
                 # No tool calls - check for intent without action
-                if self.settings.intent_detection_enabled and response.content:
+                if self._cfg.intent_detection_enabled and response.content:
                     detected_intent = IntentDetector.detect_intent(response.content)
 
                     if detected_intent and detected_intent.confidence >= 0.8:
                         # Record intent detection hit
-                        self.metrics.increment(
+                        self._increment_metric(
                             "intent_detection_hits",
                             labels={
                                 "intent_type": detected_intent.intent_type.value,
@@ -935,8 +1209,8 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         )
 
                         # Agent stated intent but didn't act - prompt to act
-                        if retry_state.should_retry(self.settings.max_retry_attempts):
-                            self.metrics.increment(
+                        if retry_state.should_retry(self._cfg.max_retry_attempts):
+                            self._increment_metric(
                                 "retry_attempts", labels={"reason": "intent_without_action"}
                             )
 
@@ -963,7 +1237,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     # Check for premature giving up
                     if IntentDetector.detect_premature_giving_up(response.content):
                         if retry_state.empty_result_count > 0 and retry_state.should_retry(
-                            self.settings.max_retry_attempts
+                            self._cfg.max_retry_attempts
                         ):
                             # Agent giving up after empty results - encourage retry
                             nudge_message = {
@@ -988,6 +1262,15 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     self.conversation_history.append(
                         {"role": "assistant", "content": response.content}
                     )
+                    # Only a first-iteration answer is cacheable: no tools ran
+                    # and no retry or nudge changed the request
+                    if iteration == 1 and response.finish_reason == "stop":
+                        if cache_key is not None:
+                            self._store_cached_response(cache_key, response.content)
+                        if semantic_cache is not None:
+                            await asyncio.to_thread(
+                                semantic_cache.store, user_message, response.content
+                            )
                     return response.content
                 else:
                     # Empty response, shouldn't happen but handle gracefully
@@ -1032,10 +1315,14 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Yields:
             Response tokens
         """
+        # Semantic matches ignore history, so only opening questions use them
+        opening_turn = not self.conversation_history
+
         # Add user message to history
         self.conversation_history.append({"role": "user", "content": user_message})
 
-        # Prune history if needed (before preparing messages)
+        # Enforce the hard message cap, then prune further if the budget requires it
+        self._trim_history_to_cap()
         self._prune_history_if_needed()
 
         # Prepare messages with system prompt
@@ -1048,6 +1335,25 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         if pending_injection:
             messages.append({"role": "system", "content": pending_injection})
 
+        semantic_cache = self.semantic_cache if opening_turn and not pending_injection else None
+        if semantic_cache is not None:
+            # Embedding is CPU-bound; keep it off the event loop that drives the TUI
+            semantic_hit = await asyncio.to_thread(semantic_cache.lookup, user_message)
+            if semantic_hit is not None:
+                self._increment_metric("semantic_cache_hits")
+                self.conversation_history.append({"role": "assistant", "content": semantic_hit})
+                for char in semantic_hit:
+                    yield char
+                return
+
+        # Serve identical tool-free conversations from the response cache
+        cache_key, cached = self._lookup_cached_response(messages)
+        if cached is not None:
+            self.conversation_history.append({"role": "assistant", "content": cached})
+            for char in cached:
+                yield char
+            return
+
         # Update budget tracker with current state
         self._update_budget_tracker(messages)
         self._log_budget_status()
@@ -1061,7 +1367,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
 
         # Execute conversation loop with tool calling (non-streaming)
         iteration = 0
-        max_iterations = self.settings.max_tool_iterations
+        max_iterations = self._cfg.max_tool_iterations
         while iteration < max_iterations:
             iteration += 1
 
@@ -1079,20 +1385,8 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
 
                 # Check if LLM wants to use tools
                 if response.has_tool_calls():
-                    # Execute tool calls
-                    tool_results = await self._execute_tool_calls(response.tool_calls)
-
-                    # Track tool calls for retry logic
-                    for tool_call in response.tool_calls:
-                        func_info = tool_call.get("function", {})
-                        retry_state.last_tool_name = func_info.get("name")
-                        try:
-                            args_str = func_info.get("arguments", "{}")
-                            retry_state.last_tool_args = (
-                                json.loads(args_str) if isinstance(args_str, str) else args_str
-                            )
-                        except json.JSONDecodeError:
-                            retry_state.last_tool_args = {}
+                    # Execute tool calls (also tracks the last call for retry logic)
+                    tool_results = await self._execute_tool_calls(response.tool_calls, retry_state)
 
                     # Add assistant message with tool calls to history
                     assistant_message: dict[str, Any] = {
@@ -1118,9 +1412,9 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         tool_results, retry_state
                     )
 
-                    if should_retry and retry_state.should_retry(self.settings.max_retry_attempts):
+                    if should_retry and retry_state.should_retry(self._cfg.max_retry_attempts):
                         # Record retry metrics
-                        self.metrics.increment("retry_attempts", labels={"reason": retry_reason})
+                        self._increment_metric("retry_attempts", labels={"reason": retry_reason})
 
                         # Apply exponential backoff before retry
                         backoff_delay = self._calculate_backoff_delay(retry_state.attempts)
@@ -1158,7 +1452,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         )
 
                         # Record successful retry metric
-                        self.metrics.increment(
+                        self._increment_metric(
                             "retry_prompt_injected", labels={"reason": retry_reason}
                         )
 
@@ -1166,7 +1460,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         # Retry not triggered or max attempts reached
                         if should_retry:
                             # Max attempts reached - record failure
-                            self.metrics.increment(
+                            self._increment_metric(
                                 "retry_max_attempts_reached", labels={"reason": retry_reason}
                             )
 
@@ -1174,12 +1468,12 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     continue
 
                 # No tool calls - check for intent without action
-                if self.settings.intent_detection_enabled and response.content:
+                if self._cfg.intent_detection_enabled and response.content:
                     detected_intent = IntentDetector.detect_intent(response.content)
 
                     if detected_intent and detected_intent.confidence >= 0.8:
                         # Record intent detection hit
-                        self.metrics.increment(
+                        self._increment_metric(
                             "intent_detection_hits",
                             labels={
                                 "intent_type": detected_intent.intent_type.value,
@@ -1190,8 +1484,8 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                         )
 
                         # Agent stated intent but didn't act - prompt to act
-                        if retry_state.should_retry(self.settings.max_retry_attempts):
-                            self.metrics.increment(
+                        if retry_state.should_retry(self._cfg.max_retry_attempts):
+                            self._increment_metric(
                                 "retry_attempts", labels={"reason": "intent_without_action"}
                             )
 
@@ -1218,7 +1512,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     # Check for premature giving up
                     if IntentDetector.detect_premature_giving_up(response.content):
                         if retry_state.empty_result_count > 0 and retry_state.should_retry(
-                            self.settings.max_retry_attempts
+                            self._cfg.max_retry_attempts
                         ):
                             # Agent giving up after empty results - encourage retry
                             nudge_message = {
@@ -1243,6 +1537,15 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     self.conversation_history.append(
                         {"role": "assistant", "content": response.content}
                     )
+                    # Only a first-iteration answer is cacheable: no tools ran
+                    # and no retry or nudge changed the request
+                    if iteration == 1 and response.finish_reason == "stop":
+                        if cache_key is not None:
+                            self._store_cached_response(cache_key, response.content)
+                        if semantic_cache is not None:
+                            await asyncio.to_thread(
+                                semantic_cache.store, user_message, response.content
+                            )
                     # TODO: Real streaming with tool calls is complex. For MVP, we're "simulating" streaming
                     # by yielding the full response character-by-character. This gives the UI a streaming
                     # effect but doesn't reduce latency for the first token.
@@ -1276,24 +1579,40 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         self.conversation_history.append({"role": "assistant", "content": error_msg})
         yield error_msg
 
-    async def _execute_tool_calls(self, tool_calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def _execute_tool_calls(
+        self,
+        tool_calls: list[dict[str, Any]],
+        retry_state: RetryState | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Execute multiple tool calls.
 
+        Arguments are parsed once here; when a retry state is given, the name and
+        parsed arguments of each call are recorded on it as the last tool call.
+        The distinct calls of a batch run concurrently, since the LLM only emits
+        independent calls side by side. Calls repeating an earlier call in the
+        same batch (same tool and arguments) reuse its result instead of
+        executing the tool again. Results keep the order of ``tool_calls``.
+
         Args:
             tool_calls: List of tool call requests from LLM
+            retry_state: Optional retry state to record the last tool call on
 
         Returns:
             List of tool results with tool_call_id and result (possibly cached summaries)
         """
-        results = []
-
-        for tool_call in tool_calls:
+        results: list[dict[str, Any] | None] = [None] * len(tool_calls)
+        # (tool name, canonical arguments) -> index of the first such call
+        first_calls: dict[tuple[str, str], int] = {}
+        # (index, index of the call whose result it reuses, name, arguments)
+        duplicates: list[tuple[int, int, str, dict[str, Any]]] = []
+        pending: list[tuple[int, str, str, dict[str, Any]]] = []
+
+        for index, tool_call in enumerate(tool_calls):
             tool_call_id = tool_call.get("id", "unknown")
             function_info = tool_call.get("function", {})
             function_name = function_info.get("name")
             function_args_str = function_info.get("arguments", "{}")
-            record = None
 
             try:
                 # Parse arguments
@@ -1301,80 +1620,129 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
                     function_args = json.loads(function_args_str)
                 else:
                     function_args = function_args_str
-
-                # Create record and notify PENDING
-                record = ToolCallRecord(
-                    id=tool_call_id,
-                    name=function_name,
-                    arguments=function_args,
-                    status=ToolCallStatus.PENDING,
-                )
-                self._notify_tool_call(record)
-
-                # Update to RUNNING
-                record.status = ToolCallStatus.RUNNING
-                self._notify_tool_call(record)
-
-                # Execute tool
-                result = await self.tool_registry.execute(function_name, **function_args)
-
-                # Update to SUCCESS
-                record.status = ToolCallStatus.SUCCESS
-                record.result = result
-                record.completed_at = datetime.now()
-                self._notify_tool_call(record)
-
-                # Process through context manager (may cache large results)
-                tool_result = {"tool_call_id": tool_call_id, "result": result}
-                processed_result = await self._process_tool_result(tool_result, function_name)
-
-                results.append(processed_result)
-
             except json.JSONDecodeError as e:
                 # Invalid JSON arguments
-                error_result = {
-                    "success": False,
-                    "error": f"Failed to parse tool arguments: {str(e)}",
+                if retry_state is not None:
+                    retry_state.last_tool_name = function_name
+                    retry_state.last_tool_args = {}
+
+                results[index] = {
+                    "tool_call_id": tool_call_id,
+                    "result": {
+                        "success": False,
+                        "error": f"Failed to parse tool arguments: {str(e)}",
+                    },
                 }
-                results.append(
-                    {
-                        "tool_call_id": tool_call_id,
-                        "result": error_result,
-                    }
-                )
 
                 # Notify ERROR status
-                record = ToolCallRecord(
+                self._notify_tool_call(
+                    ToolCallRecord(
+                        id=tool_call_id,
+                        name=function_name or "unknown",
+                        arguments={},
+                        status=ToolCallStatus.ERROR,
+                        error_message=str(e),
+                        completed_at=datetime.now(),
+                    )
+                )
+                continue
+
+            if retry_state is not None:
+                retry_state.last_tool_name = function_name
+                retry_state.last_tool_args = function_args
+
+            call_key = (function_name, json.dumps(function_args, sort_keys=True, default=str))
+            first_index = first_calls.get(call_key)
+            if first_index is not None:
+                duplicates.append((index, first_index, function_name, function_args))
+                continue
+
+            first_calls[call_key] = index
+            pending.append((index, tool_call_id, function_name, function_args))
+
+        executed = await asyncio.gather(*(self._execute_tool_call(*call[1:]) for call in pending))
+        for (index, *_), processed_result in zip(pending, executed, strict=True):
+            results[index] = processed_result
+
+        for index, first_index, function_name, function_args in duplicates:
+            tool_call_id = tool_calls[index].get("id", "unknown")
+            shared_result = results[first_index]["result"]  # type: ignore[index]
+            results[index] = {"tool_call_id": tool_call_id, "result": shared_result}
+            failed = isinstance(shared_result, dict) and shared_result.get("success") is False
+            self._notify_tool_call(
+                ToolCallRecord(
                     id=tool_call_id,
-                    name=function_name or "unknown",
-                    arguments={},
-                    status=ToolCallStatus.ERROR,
-                    error_message=str(e),
+                    name=function_name,
+                    arguments=function_args,
+                    result=shared_result,
+                    status=ToolCallStatus.ERROR if failed else ToolCallStatus.SUCCESS,
+                    error_message=shared_result.get("error") if failed else None,
                     completed_at=datetime.now(),
                 )
-                self._notify_tool_call(record)
+            )
+            self._increment_metric("tool_calls_deduplicated", labels={"tool": function_name})
 
-            except Exception as e:
-                # Tool execution failed
-                error_result = {
-                    "success": False,
-                    "error": f"Tool execution failed: {str(e)}",
-                }
-                results.append(
-                    {
-                        "tool_call_id": tool_call_id,
-                        "result": error_result,
-                    }
-                )
+        return [result for result in results if result is not None]
 
-                # Notify ERROR status
-                if record is not None:
-                    record.status = ToolCallStatus.ERROR
-                    record.error_message = str(e)
-                    record.completed_at = datetime.now()
-                    self._notify_tool_call(record)
+    async def _execute_tool_call(
+        self,
+        tool_call_id: str,
+        function_name: str,
+        function_args: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Execute a single tool call, reporting its progress to tool listeners.
 
-        return results
+        Args:
+            tool_call_id: ID of the tool call request
+            function_name: Name of the tool to execute
+            function_args: Parsed tool arguments
+
+        Returns:
+            Tool result with tool_call_id and result (possibly a cached summary)
+        """
+        # Create record and notify PENDING
+        record = ToolCallRecord(
+            id=tool_call_id,
+            name=function_name,
+            arguments=function_args,
+            status=ToolCallStatus.PENDING,
+        )
+        self._notify_tool_call(record)
+
+        try:
+            # Update to RUNNING
+            record.status = ToolCallStatus.RUNNING
+            self._notify_tool_call(record)
+
+            # Execute tool
+            result = await self.tool_registry.execute(function_name, **function_args)
+
+            # Update to SUCCESS
+            record.status = ToolCallStatus.SUCCESS
+            record.result = result
+            record.completed_at = datetime.now()
+            self._notify_tool_call(record)
+
+            # Process through context manager (may cache large results)
+            tool_result = {"tool_call_id": tool_call_id, "result": result}
+            return await self._process_tool_result(tool_result, function_name)
+
+        except Exception as e:
+            # Notify ERROR status
+            record.status = ToolCallStatus.ERROR
+            record.error_message = str(e)
+            record.completed_at = datetime.now()
+            self._notify_tool_call(record)
+
+            # Tool execution failed
+            return {
+                "tool_call_id": tool_call_id,
+                "result": {
+                    "success": False,
+                    "error": f"Tool execution failed: {str(e)}",
+                },
+            }
 
     def _analyze_tool_results(
         self,
@@ -1394,7 +1762,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Returns:
             Tuple of (should_retry, reason) where reason is the retry scenario
         """
-        if not self.settings.auto_retry_enabled:
+        if not self._cfg.auto_retry_enabled:
             return False, ""
 
         for result in tool_results:
@@ -1473,12 +1841,7 @@ DO NOT just acknowledge the cache - the user expects to see log events. Execute
         Returns:
             Bucket label: "high" (>0.9), "medium" (0.7-0.9), or "low" (<0.7)
         """
-        if confidence >= 0.9:
-            return "high"
-        elif confidence >= 0.7:
-            return "medium"
-        else:
-            return "low"
+        return _CONFIDENCE_BUCKETS[min(100, max(0, int(confidence * 100)))]
 
     def clear_history(self) -> None:
         """Clear conversation history."""
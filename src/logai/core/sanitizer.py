@@ -1,8 +1,44 @@
 """PII Sanitization layer for protecting sensitive data in logs."""
 
+import functools
+import logging
 import re
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# A global inline flag group such as "(?i)" at the start of a pattern. These are
+# only legal at the very start of an expression, so they are rewritten as scoped
+# groups when the patterns are joined into one alternation.
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+# Numeric group references ("\1", "\g<1>") in a replacement template.
+_GROUP_REF = re.compile(r"\\(\d+)|\\g<(\d+)>")
+# Numeric backreferences inside a pattern cannot be renumbered safely.
+_PATTERN_BACKREF = re.compile(r"\\[1-9]")
+# Joins log messages for batch sanitization. NUL is neither whitespace nor a
+# word character, so it doesn't extend matches and keeps batches ASCII-eligible.
+_BATCH_SEPARATOR = "\x00"
+# ASCII characters that ``\s`` matches only in Unicode mode (file/group/record/
+# unit separators). Text containing them must use the Unicode-mode pattern.
+_UNICODE_ONLY_SPACE = re.compile(r"[\x1c-\x1f]")
+_SCOPED_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}
+
+
+def _display_name(pattern_name: str) -> str:
+    """Convert a pattern name to its readable summary form."""
+    return pattern_name.replace("_", " ").title()
+
+
+def _literal_replacer(literal: str) -> Callable[[re.Match[str]], str]:
+    """Build an ``re.sub`` replacement callable that always returns ``literal``."""
+
+    def replace(_match: re.Match[str]) -> str:
+        return literal
+
+    return replace
 
 
 @dataclass
@@ -13,6 +49,23 @@ class SanitizationPattern:
     pattern: re.Pattern[str]
     replacement: str
     enabled: bool = True
+    # Regex that must match somewhere in a text for ``pattern`` to match it, e.g.
+    # "@" for email. Used to skip texts cheaply; None means no cheap test exists.
+    prefilter: str | None = None
+    # Argument passed to ``re.sub``: a constant-returning callable for literal
+    # replacements (skips template parsing), otherwise the template itself.
+    replacer: str | Callable[[re.Match[str]], str] = field(init=False, repr=False, compare=False)
+    # Readable name used in redaction summaries, e.g. "Aws Access Key"
+    display_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern the replacement and precompute the replacer and display name."""
+        self.display_name = _display_name(self.name)
+        self.replacement = sys.intern(self.replacement)
+        if "\\" in self.replacement:
+            self.replacer = self.replacement
+        else:
+            self.replacer = _literal_replacer(self.replacement)
 
 
 @dataclass
@@ -24,6 +77,174 @@ class SanitizationResult:
     redactions: dict[str, int] = field(default_factory=dict)  # Pattern name -> count
 
 
+# (name, compiled pattern, replacement, prefilter) of one enabled pattern
+_PatternSpec = tuple[str, re.Pattern[str], str, str | None]
+
+
+class _CompiledPatternSet(NamedTuple):
+    """Regexes derived from one ordered set of enabled patterns."""
+
+    # Named-group alternation of all patterns, or None if they can't be joined
+    combined: re.Pattern[str] | None
+    # The same alternation compiled with re.ASCII, for ASCII-only text
+    combined_ascii: re.Pattern[str] | None
+    # Group name -> (pattern name, replacement, template with shifted group refs)
+    groups: dict[str, tuple[str, str, str | None]]
+    # Screening regex of all prefilter anchors, or None if any pattern lacks one
+    prefilter: re.Pattern[str] | None
+    # Whether messages can be sanitized as one NUL-joined buffer (see
+    # _depends_on_message_bounds)
+    batchable: bool
+
+
+def _depends_on_message_bounds(source: str) -> bool:
+    """
+    Check whether a pattern can behave differently inside a joined buffer.
+
+    ``^``, ``$``, ``\\A`` and ``\\Z`` match at the ends of the whole buffer
+    rather than of each message, and lookarounds can see across the
+    separator into a neighbouring message. Characters inside a character
+    class and escaped characters are ignored. The check may report false
+    positives (e.g. ``^`` in a verbose-mode comment), which only cost the
+    batched fast path.
+
+    Args:
+        source: Regex source of a pattern
+
+    Returns:
+        True if the pattern uses anchors or lookarounds
+    """
+    i = 0
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            if not in_class and source[i + 1 : i + 2] in ("A", "Z"):
+                return True
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal member of the class
+            if source[i + 1 : i + 2] == "^":
+                i += 1
+            if source[i + 1 : i + 2] == "]":
+                i += 1
+        elif char in "^$" or source.startswith(("(?=", "(?!", "(?<=", "(?<!"), i):
+            return True
+        i += 1
+    return False
+
+
+def _shift_group_ref(match: re.Match[str], shift: int) -> str:
+    """Renumber one group reference of a replacement template by ``shift``."""
+    return f"\\g<{int(match.group(1) or match.group(2)) + shift}>"
+
+
+def _build_combined(
+    specs: tuple[_PatternSpec, ...],
+) -> tuple[re.Pattern[str] | None, dict[str, tuple[str, str, str | None]]]:
+    """
+    Join patterns into one named-group alternation.
+
+    The scan takes the leftmost match in the text. List order only decides
+    between patterns that match at the same starting position, where the
+    earlier pattern wins.
+
+    Args:
+        specs: Enabled patterns in priority order
+
+    Returns:
+        Tuple of (combined pattern or None, group name -> (name, replacement, template)).
+        The template is None when the replacement is a plain string and
+        otherwise has its group references shifted to the combined numbering.
+        The combined pattern is None if the patterns cannot be joined safely.
+    """
+    parts: list[str] = []
+    groups: dict[str, tuple[str, str, str | None]] = {}
+    offset = 0
+
+    for index, (name, pattern, replacement, _) in enumerate(specs):
+        source = pattern.pattern
+        if _PATTERN_BACKREF.search(source):
+            return None, {}
+
+        flags = pattern.flags & (re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
+        leading = _LEADING_FLAGS.match(source)
+        if leading:
+            source = source[leading.end() :]
+            for letter in leading.group(1):
+                flags |= _SCOPED_FLAGS.get(letter, 0)
+        scoped = "".join(letter for letter, flag in _SCOPED_FLAGS.items() if flags & flag)
+        if scoped:
+            source = f"(?{scoped}:{source})"
+
+        # The outer named group takes number offset + 1; the pattern's own
+        # groups follow it.
+        shift = offset + 1
+        template: str | None = None
+        if "\\" in replacement:
+            template = _GROUP_REF.sub(functools.partial(_shift_group_ref, shift=shift), replacement)
+
+        group_name = f"_p{index}"
+        parts.append(f"(?P<{group_name}>{source})")
+        groups[group_name] = (name, replacement, template)
+        offset += 1 + pattern.groups
+
+    try:
+        return re.compile("|".join(parts)), groups
+    except re.error:
+        return None, {}
+
+
+def _build_prefilter(specs: tuple[_PatternSpec, ...]) -> re.Pattern[str] | None:
+    """
+    Join the patterns' prefilter anchors into one cheap screening regex.
+
+    Args:
+        specs: Enabled patterns
+
+    Returns:
+        Screening pattern, or None if any pattern lacks a prefilter
+    """
+    if not specs or any(prefilter is None for *_, prefilter in specs):
+        return None
+    anchors = dict.fromkeys(prefilter for *_, prefilter in specs if prefilter is not None)
+    return re.compile("|".join(anchors))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_pattern_set(specs: tuple[_PatternSpec, ...]) -> _CompiledPatternSet:
+    """
+    Build (once per distinct pattern set) the regexes used by ``LogSanitizer``.
+
+    Sanitizers with the same enabled patterns, e.g. every default-configured
+    instance, share the result instead of rebuilding it.
+
+    Args:
+        specs: Enabled patterns in priority order
+
+    Returns:
+        Compiled pattern set
+    """
+    combined, groups = _build_combined(specs)
+    combined_ascii = None
+    if combined is not None:
+        try:
+            combined_ascii = re.compile(combined.pattern, re.ASCII)
+        except re.error:
+            pass
+    return _CompiledPatternSet(
+        combined=combined,
+        combined_ascii=combined_ascii,
+        groups=groups,
+        prefilter=_build_prefilter(specs),
+        batchable=not any(_depends_on_message_bounds(pattern.pattern) for _, pattern, *_ in specs),
+    )
+
+
 class LogSanitizer:
     """Sanitizes log data before sending to LLM providers."""
 
@@ -34,46 +255,55 @@ class LogSanitizer:
             name="password_in_url",
             pattern=re.compile(r"://[^:]+:([^@]+)@"),
             replacement="://[user]:[PASSWORD_REDACTED]@",
+            prefilter="://",
         ),
         SanitizationPattern(
             name="email",
             pattern=re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
             replacement="[EMAIL_REDACTED]",
+            prefilter="@",
         ),
         SanitizationPattern(
             name="ipv4",
             pattern=re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"),
             replacement="[IP_REDACTED]",
+            prefilter=r"\d",
         ),
         SanitizationPattern(
             name="ipv6",
             pattern=re.compile(r"([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}"),
             replacement="[IP_REDACTED]",
+            prefilter=":",
         ),
         SanitizationPattern(
             name="credit_card",
             pattern=re.compile(r"\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b"),
             replacement="[CC_REDACTED]",
+            prefilter=r"\d",
         ),
         SanitizationPattern(
             name="ssn",
             pattern=re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
             replacement="[SSN_REDACTED]",
+            prefilter=r"\d",
         ),
         SanitizationPattern(
             name="phone_us",
             pattern=re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"),
             replacement="[PHONE_REDACTED]",
+            prefilter=r"\d",
         ),
         SanitizationPattern(
             name="aws_access_key",
             pattern=re.compile(r"AKIA[0-9A-Z]{16}"),
             replacement="[AWS_KEY_REDACTED]",
+            prefilter="AKIA",
         ),
         SanitizationPattern(
             name="aws_secret_key",
             pattern=re.compile(r"(?i)aws.{0,20}secret.{0,20}['\"][0-9a-zA-Z/+=]{40}['\"]"),
             replacement="[AWS_SECRET_REDACTED]",
+            prefilter="(?i:aws)",
         ),
         SanitizationPattern(
             name="generic_api_key",
@@ -81,21 +311,27 @@ class LogSanitizer:
                 r"(?i)(api[_\s-]?key|apikey|api[_\s-]?secret)[:\s=\"']*[\"']?([a-zA-Z0-9_-]{20,})[\"']?"
             ),
             replacement=r"\1 [API_KEY_REDACTED]",
+            prefilter="(?i:api)",
         ),
         SanitizationPattern(
             name="bearer_token",
             pattern=re.compile(r"(?i)bearer\s+[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+"),
             replacement="[TOKEN_REDACTED]",
+            prefilter="(?i:bearer)",
         ),
         SanitizationPattern(
             name="private_key",
             pattern=re.compile(r"-----BEGIN\s+(RSA|DSA|EC|OPENSSH)?\s*PRIVATE KEY-----"),
             replacement="[PRIVATE_KEY_REDACTED]",
+            prefilter="-----BEGIN",
         ),
     ]
 
     def __init__(
-        self, enabled: bool = True, custom_patterns: list[SanitizationPattern] | None = None
+        self,
+        enabled: bool = True,
+        custom_patterns: list[SanitizationPattern] | None = None,
+        use_hyperscan: bool = False,
     ):
         """
         Initialize sanitizer.
@@ -103,11 +339,126 @@ class LogSanitizer:
         Args:
             enabled: Whether sanitization is enabled
             custom_patterns: Additional patterns to use beyond defaults
+            use_hyperscan: Prefilter text with Hyperscan when it is installed
         """
         self.enabled = enabled
+        self.use_hyperscan = use_hyperscan
         self.patterns = self.DEFAULT_PATTERNS.copy()
         if custom_patterns:
             self.patterns.extend(custom_patterns)
+        self._display_names = {p.name: p.display_name for p in self.patterns}
+
+        # Combined alternation of all enabled patterns, rebuilt whenever the
+        # pattern list or an ``enabled`` flag changes.
+        self._combined_key: tuple[Any, ...] | None = None
+        self._combined: re.Pattern[str] | None = None
+        self._combined_ascii: re.Pattern[str] | None = None
+        self._group_patterns: dict[str, tuple[str, str, str | None]] = {}
+        self._hyperscan_db: Any = None
+        self._prefilter: re.Pattern[str] | None = None
+        self._batchable = False
+
+    @staticmethod
+    def _build_hyperscan_db(active: list[SanitizationPattern]) -> Any:
+        """
+        Compile the active patterns into a Hyperscan prefilter database.
+
+        Patterns are compiled in prefilter mode, so the database reports a
+        superset of the real matches. A text with no prefilter hit cannot
+        contain PII and skips the ``re`` pass. Any hit still goes through
+        ``re`` so that the redaction output is unchanged.
+
+        Args:
+            active: Enabled patterns
+
+        Returns:
+            Compiled Hyperscan database, or None if Hyperscan is unavailable
+            or rejects a pattern
+        """
+        try:
+            import hyperscan
+        except ImportError:
+            logger.warning("hyperscan not installed, using re-only PII sanitization")
+            return None
+
+        base_flags = (
+            hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        expressions: list[bytes] = []
+        flags: list[int] = []
+        for pattern in active:
+            pattern_flags = base_flags
+            if pattern.pattern.flags & re.IGNORECASE:
+                pattern_flags |= hyperscan.HS_FLAG_CASELESS
+            if pattern.pattern.flags & re.DOTALL:
+                pattern_flags |= hyperscan.HS_FLAG_DOTALL
+            if pattern.pattern.flags & re.MULTILINE:
+                pattern_flags |= hyperscan.HS_FLAG_MULTILINE
+            expressions.append(pattern.pattern.pattern.encode("utf-8"))
+            flags.append(pattern_flags)
+
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=flags,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to compile Hyperscan database: {e}")
+            return None
+        return database
+
+    def _may_contain_match(self, text: str) -> bool:
+        """
+        Check the literal-anchor and Hyperscan prefilters for any possible match.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            False only when no pattern can match; True otherwise
+        """
+        if self._prefilter is not None and not self._prefilter.search(text):
+            return False
+        if self._hyperscan_db is None:
+            return True
+
+        found = False
+
+        def _on_match(*_: Any) -> bool:
+            nonlocal found
+            found = True
+            return True  # Stop scanning at the first hit
+
+        try:
+            self._hyperscan_db.scan(text.encode("utf-8"), match_event_handler=_on_match)
+        except Exception:
+            # Unencodable text or a halted scan: let the re pass decide
+            return True
+        return found
+
+    def _refresh_compiled(self) -> None:
+        """Rebuild the compiled regexes if the enabled patterns have changed."""
+        active = [p for p in self.patterns if p.enabled]
+        key = tuple((p.name, p.pattern, p.replacement, p.prefilter) for p in active)
+        if key == self._combined_key:
+            return
+
+        compiled = _compile_pattern_set(key)
+        self._combined = compiled.combined
+        self._combined_ascii = compiled.combined_ascii
+        self._group_patterns = compiled.groups
+        self._prefilter = compiled.prefilter
+        self._batchable = compiled.batchable
+        self._hyperscan_db = (
+            self._build_hyperscan_db(active) if self.use_hyperscan and active else None
+        )
+        self._combined_key = key
 
     def sanitize(self, text: str) -> SanitizationResult:
         """
@@ -126,18 +477,49 @@ class LogSanitizer:
                 redactions={},
             )
 
+        self._refresh_compiled()
+
+        if not self._may_contain_match(text):
+            return SanitizationResult(sanitized_text=text, redaction_count=0, redactions={})
+
         redactions: dict[str, int] = {}
-        result = text
 
+        if self._combined is not None:
+            groups = self._group_patterns
+
+            def _replace(match: re.Match[str]) -> str:
+                name, replacement, template = groups[match.lastgroup]  # type: ignore[index]
+                redactions[name] = redactions.get(name, 0) + 1
+                if template is None:
+                    return replacement
+                return match.expand(template)
+
+            # ASCII-mode matching skips Unicode character-class lookups and is
+            # equivalent for ASCII text apart from the separators \s no longer
+            # matches.
+            combined = self._combined
+            if (
+                self._combined_ascii is not None
+                and text.isascii()
+                and not _UNICODE_ONLY_SPACE.search(text)
+            ):
+                combined = self._combined_ascii
+            result = combined.sub(_replace, text)
+            return SanitizationResult(
+                sanitized_text=result,
+                redaction_count=sum(redactions.values()),
+                redactions=redactions,
+            )
+
+        # Fallback for pattern sets that cannot be combined: one pass per pattern.
+        result = text
         for pattern in self.patterns:
             if not pattern.enabled:
                 continue
 
-            matches = pattern.pattern.findall(result)
-            if matches:
-                count = len(matches) if isinstance(matches, list) else 1
+            result, count = pattern.pattern.subn(pattern.replacer, result)
+            if count:
                 redactions[pattern.name] = redactions.get(pattern.name, 0) + count
-                result = pattern.pattern.sub(pattern.replacement, result)
 
         total_redactions = sum(redactions.values())
 
@@ -162,6 +544,10 @@ class LogSanitizer:
         if not self.enabled:
             return events, {}
 
+        batched = self._sanitize_messages_batched(events)
+        if batched is not None:
+            return batched
+
         sanitized_events = []
         total_redactions: dict[str, int] = {}
 
@@ -181,6 +567,45 @@ class LogSanitizer:
 
         return sanitized_events, total_redactions
 
+    def _sanitize_messages_batched(
+        self, events: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], dict[str, int]] | None:
+        """
+        Sanitize all event messages in one pass over a joined buffer.
+
+        Messages are joined with a NUL sentinel, sanitized with a
+        single ``sanitize`` call and split back apart. If any match consumed a
+        sentinel (a pattern spanning two messages), the split no longer lines
+        up and the caller falls back to per-event sanitization. Patterns with
+        anchors or lookarounds can match differently in the joined buffer
+        without consuming a sentinel, so they always use the fallback.
+
+        Args:
+            events: List of log event dictionaries
+
+        Returns:
+            Tuple of (sanitized events, redaction stats), or None if the batch
+            cannot be sanitized safely as one buffer
+        """
+        self._refresh_compiled()
+        if not self._batchable:
+            return None
+
+        indices = [i for i, event in enumerate(events) if isinstance(event.get("message"), str)]
+        messages = [events[i]["message"] for i in indices]
+        if any(_BATCH_SEPARATOR in message for message in messages):
+            return None
+
+        result = self.sanitize(_BATCH_SEPARATOR.join(messages))
+        parts = result.sanitized_text.split(_BATCH_SEPARATOR)
+        if len(parts) != len(messages):
+            return None
+
+        sanitized_events = [event.copy() for event in events]
+        for i, part in zip(indices, parts, strict=True):
+            sanitized_events[i]["message"] = part
+        return sanitized_events, result.redactions
+
     def sanitize_dict(
         self, data: dict[str, Any], keys_to_sanitize: list[str] | None = None
     ) -> tuple[dict[str, Any], dict[str, int]]:
@@ -226,10 +651,9 @@ class LogSanitizer:
         if not redactions:
             return "No sensitive data redacted"
 
-        parts = []
-        for pattern_name, count in sorted(redactions.items()):
-            # Convert pattern name to readable format
-            readable_name = pattern_name.replace("_", " ").title()
-            parts.append(f"{count} {readable_name}")
-
+        display_names = self._display_names
+        parts = [
+            f"{count} {display_names.get(name) or _display_name(name)}"
+            for name, count in sorted(redactions.items())
+        ]
         return f"Redacted: {', '.join(parts)}"
@@ -0,0 +1,125 @@
+"""Semantic cache for answers to paraphrased opening questions."""
+
+import logging
+import math
+from collections import deque
+from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Maps text to an embedding vector
+Embedder = Callable[[str], Sequence[float]]
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+def load_sentence_transformer_embedder(model_name: str = DEFAULT_EMBEDDING_MODEL) -> Embedder:
+    """
+    Load a local sentence-transformers model as an embedder.
+
+    Args:
+        model_name: sentence-transformers model to load
+
+    Returns:
+        Function that embeds a string
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+
+    def embed(text: str) -> Sequence[float]:
+        return model.encode(text, normalize_embeddings=True).tolist()  # type: ignore[no-any-return]
+
+    return embed
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of (query -> answer) pairs.
+
+    Queries are embedded and compared by cosine similarity, so a paraphrase
+    of an earlier question ("show me the lambda log groups" vs. "list all
+    Lambda function log groups") can reuse its answer without an LLM call.
+    Entries are kept in insertion order and the oldest is dropped once
+    ``max_entries`` is reached; at that size a linear scan is cheaper than
+    maintaining an ANN index.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+    ) -> None:
+        """
+        Initialize semantic cache.
+
+        Args:
+            embedder: Text embedding function (defaults to a local MiniLM model)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of cached answers
+
+        Raises:
+            ImportError: If no embedder is given and sentence-transformers is missing
+        """
+        self._embedder = embedder or load_sentence_transformer_embedder()
+        self.threshold = threshold
+        self._entries: deque[tuple[tuple[float, ...], str]] = deque(maxlen=max_entries)
+
+    def __len__(self) -> int:
+        """Return the number of cached answers."""
+        return len(self._entries)
+
+    def _embed(self, text: str) -> tuple[float, ...]:
+        """Embed text and scale it to unit length."""
+        vector = tuple(float(x) for x in self._embedder(text))
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0.0:
+            return vector
+        return tuple(x / norm for x in vector)
+
+    def lookup(self, query: str, threshold: float | None = None) -> str | None:
+        """
+        Find the cached answer for the most similar earlier query.
+
+        Args:
+            query: User query
+            threshold: Override for the minimum cosine similarity
+
+        Returns:
+            Cached answer, or None if no earlier query is similar enough
+        """
+        if not self._entries:
+            return None
+
+        min_similarity = self.threshold if threshold is None else threshold
+        vector = self._embed(query)
+
+        best_answer: str | None = None
+        best_similarity = min_similarity
+        # Scan a snapshot: lookups and stores may run in worker threads
+        for cached_vector, answer in tuple(self._entries):
+            similarity = sum(a * b for a, b in zip(vector, cached_vector, strict=True))
+            if similarity >= best_similarity:
+                best_answer, best_similarity = answer, similarity
+
+        if best_answer is not None:
+            logger.debug("Semantic cache hit", extra={"similarity": best_similarity})
+        return best_answer
+
+    def store(self, query: str, answer: str) -> None:
+        """
+        Cache an answer for a query.
+
+        Args:
+            query: User query
+            answer: Final assistant answer
+        """
+        self._entries.append((self._embed(query), answer))
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self._entries.clear()
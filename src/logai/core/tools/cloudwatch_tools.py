@@ -1,5 +1,6 @@
 """CloudWatch-specific LLM tools."""
 
+import asyncio
 from typing import Any
 
 from logai.cache.manager import CacheManager
@@ -9,6 +10,28 @@ from logai.core.tools.base import BaseTool, ToolExecutionError
 from logai.providers.datasources.cloudwatch import CloudWatchDataSource
 from logai.utils.time import calculate_time_range
 
+# Batches at least this large are sanitized in a worker thread so the event
+# loop (and the TUI) stays responsive while the regexes run.
+_SANITIZE_OFFLOAD_MIN_EVENTS = 64
+
+
+async def _sanitize_events(
+    sanitizer: LogSanitizer, events: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """
+    Sanitize log events, offloading large batches to a worker thread.
+
+    Args:
+        sanitizer: Sanitizer to apply
+        events: Log events to sanitize
+
+    Returns:
+        Tuple of (sanitized events, aggregated redaction stats)
+    """
+    if len(events) < _SANITIZE_OFFLOAD_MIN_EVENTS:
+        return sanitizer.sanitize_log_events(events)
+    return await asyncio.to_thread(sanitizer.sanitize_log_events, events)
+
 
 class ListLogGroupsTool(BaseTool):
     """
@@ -264,7 +287,7 @@ class FetchLogsTool(BaseTool):
             )
 
             # Sanitize logs before returning to LLM
-            sanitized_events, redactions = self.sanitizer.sanitize_log_events(events)
+            sanitized_events, redactions = await _sanitize_events(self.sanitizer, events)
 
             result = {
                 "success": True,
@@ -459,7 +482,7 @@ class SearchLogsTool(BaseTool):
             )
 
             # Sanitize logs before returning to LLM
-            sanitized_events, redactions = self.sanitizer.sanitize_log_events(events)
+            sanitized_events, redactions = await _sanitize_events(self.sanitizer, events)
 
             # Group events by log group for better presentation
             events_by_group: dict[str, list[dict[str, Any]]] = {}
@@ -1,5 +1,8 @@
 """LLM provider abstractions and implementations."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import (
     AuthenticationError,
     BaseLLMProvider,
@@ -8,14 +11,38 @@ from .base import (
     LLMResponse,
     RateLimitError,
 )
-from .github_copilot_models import (
-    get_available_models,
-    get_model_metadata,
-    refresh_model_cache,
-    validate_model,
-)
-from .github_copilot_provider import GitHubCopilotProvider
-from .litellm_provider import LiteLLMProvider
+
+if TYPE_CHECKING:
+    from .github_copilot_models import (
+        get_available_models,
+        get_model_metadata,
+        refresh_model_cache,
+        validate_model,
+    )
+    from .github_copilot_provider import GitHubCopilotProvider
+    from .litellm_provider import LiteLLMProvider
+
+# Provider implementations pull in litellm and the auth stack, which take
+# seconds to import. They are loaded on first attribute access so that
+# importing ``logai.providers.llm.base`` stays cheap.
+_LAZY_IMPORTS = {
+    "LiteLLMProvider": ".litellm_provider",
+    "GitHubCopilotProvider": ".github_copilot_provider",
+    "get_available_models": ".github_copilot_models",
+    "validate_model": ".github_copilot_models",
+    "get_model_metadata": ".github_copilot_models",
+    "refresh_model_cache": ".github_copilot_models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Base classes and types
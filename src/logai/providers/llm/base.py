@@ -8,6 +8,9 @@ from typing import Any
 class LLMResponse:
     """Represents a response from an LLM provider."""
 
+    # One is created per provider reply, several per chat turn
+    __slots__ = ("content", "tool_calls", "finish_reason", "usage")
+
     def __init__(
         self,
         content: str | None = None,
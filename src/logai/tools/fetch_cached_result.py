@@ -8,6 +8,46 @@ from logai.core.tools.base import BaseTool, ToolExecutionError
 
 logger = logging.getLogger(__name__)
 
+# Parameter schema, built once; sent with every LLM request that offers the tool
+_PARAMETERS: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "cache_id": {
+            "type": "string",
+            "description": "The cache ID from the cached result summary (e.g., 'result_abc123')",
+        },
+        "offset": {
+            "type": "integer",
+            "description": "Starting index for pagination (0-based, default: 0)",
+            "minimum": 0,
+            "default": 0,
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Number of events to fetch (default: 100, max: 200)",
+            "minimum": 1,
+            "maximum": 200,
+            "default": 100,
+        },
+        "filter_pattern": {
+            "type": "string",
+            "description": (
+                "Optional text pattern to filter events (case-insensitive). "
+                "Example: 'ERROR' to find only error messages."
+            ),
+        },
+        "time_start": {
+            "type": "integer",
+            "description": "Optional start timestamp (epoch milliseconds) to filter events",
+        },
+        "time_end": {
+            "type": "integer",
+            "description": "Optional end timestamp (epoch milliseconds) to filter events",
+        },
+    },
+    "required": ["cache_id"],
+}
+
 
 class FetchCachedResultTool(BaseTool):
     """
@@ -45,44 +85,7 @@ class FetchCachedResultTool(BaseTool):
     @property
     def parameters(self) -> dict[str, Any]:
         """Return parameter schema."""
-        return {
-            "type": "object",
-            "properties": {
-                "cache_id": {
-                    "type": "string",
-                    "description": "The cache ID from the cached result summary (e.g., 'result_abc123')",
-                },
-                "offset": {
-                    "type": "integer",
-                    "description": "Starting index for pagination (0-based, default: 0)",
-                    "minimum": 0,
-                    "default": 0,
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Number of events to fetch (default: 100, max: 200)",
-                    "minimum": 1,
-                    "maximum": 200,
-                    "default": 100,
-                },
-                "filter_pattern": {
-                    "type": "string",
-                    "description": (
-                        "Optional text pattern to filter events (case-insensitive). "
-                        "Example: 'ERROR' to find only error messages."
-                    ),
-                },
-                "time_start": {
-                    "type": "integer",
-                    "description": "Optional start timestamp (epoch milliseconds) to filter events",
-                },
-                "time_end": {
-                    "type": "integer",
-                    "description": "Optional end timestamp (epoch milliseconds) to filter events",
-                },
-            },
-            "required": ["cache_id"],
-        }
+        return _PARAMETERS
 
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """
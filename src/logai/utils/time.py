@@ -1,10 +1,14 @@
 """Time parsing and conversion utilities for CloudWatch timestamps."""
 
+import functools
 import re
+import time
 from datetime import UTC, datetime, timedelta
 
-import pendulum
-from dateutil import parser as dateutil_parser
+# Relative time pattern: "5m ago", "2h ago", "1d ago", "1w ago"
+_RELATIVE_TIME_RE = re.compile(r"^(\d+)\s*([mhdw])\s*ago$")
+# Relative time unit -> timedelta keyword
+_RELATIVE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
 
 
 class TimeParseError(Exception):
@@ -46,9 +50,7 @@ def parse_relative_time(relative_str: str) -> datetime:
     if relative_str == "yesterday":
         return now - timedelta(days=1)
 
-    # Parse relative time pattern: "5m ago", "2h ago", "1d ago", "1w ago"
-    pattern = r"^(\d+)\s*([mhdw])\s*ago$"
-    match = re.match(pattern, relative_str)
+    match = _RELATIVE_TIME_RE.match(relative_str)
 
     if not match:
         raise TimeParseError(
@@ -57,18 +59,7 @@ def parse_relative_time(relative_str: str) -> datetime:
         )
 
     amount = int(match.group(1))
-    unit = match.group(2)
-
-    if unit == "m":
-        return now - timedelta(minutes=amount)
-    elif unit == "h":
-        return now - timedelta(hours=amount)
-    elif unit == "d":
-        return now - timedelta(days=amount)
-    elif unit == "w":
-        return now - timedelta(weeks=amount)
-    else:
-        raise TimeParseError(f"Unknown time unit: {unit}")
+    return now - timedelta(**{_RELATIVE_UNITS[match.group(2)]: amount})
 
 
 def parse_iso8601(iso_str: str) -> datetime:
@@ -90,8 +81,23 @@ def parse_iso8601(iso_str: str) -> datetime:
     Raises:
         TimeParseError: If parsing fails
     """
+    # Fast path: the stdlib parser handles the common forms, including "Z"
+    try:
+        parsed = datetime.fromisoformat(iso_str)
+    except ValueError:
+        pass
+    else:
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=UTC)
+        return parsed.astimezone(UTC)
+
+    # Imported here so that importing this module doesn't pay for pendulum
+    # and dateutil unless a string actually misses the fast path
+    import pendulum
+    from dateutil import parser as dateutil_parser
+
     try:
-        # Try pendulum first (better ISO 8601 support)
+        # Fall back to pendulum for the less common ISO 8601 forms
         dt = pendulum.parse(iso_str)
         if dt is None:
             raise TimeParseError(f"Failed to parse ISO 8601 timestamp: {iso_str}")
@@ -173,8 +179,9 @@ def parse_time(time_str: str | int | datetime) -> datetime:
     time_str = time_str.strip()
 
     # Try relative time first (most common for log queries)
-    if "ago" in time_str.lower() or time_str.lower() in ("now", "yesterday"):
-        return parse_relative_time(time_str)
+    lowered = time_str.lower()
+    if "ago" in lowered or lowered in ("now", "yesterday"):
+        return parse_relative_time(lowered)
 
     # Try epoch milliseconds (string of digits)
     if time_str.isdigit():
@@ -184,6 +191,11 @@ def parse_time(time_str: str | int | datetime) -> datetime:
     return parse_iso8601(time_str)
 
 
+def _now_ms() -> int:
+    """Current time in epoch milliseconds."""
+    return int(time.time() * 1000)
+
+
 def to_cloudwatch_timestamp(dt: datetime | str | int) -> int:
     """
     Convert datetime to CloudWatch timestamp (epoch milliseconds).
@@ -212,6 +224,48 @@ def to_cloudwatch_timestamp(dt: datetime | str | int) -> int:
     return int(dt.timestamp() * 1000)
 
 
+# Epoch milliseconds that datetime.fromtimestamp, and so parse_time, accepts
+# (years 1 through 9999)
+_MIN_EPOCH_MS = -62_135_596_800_000
+_MAX_EPOCH_MS = 253_402_300_799_999
+
+
+def _checked_epoch_ms(value: str | int, ms: int) -> int:
+    """
+    Check that epoch milliseconds are in the range parse_time accepts.
+
+    Args:
+        value: Original input, for the error message
+        ms: Epoch milliseconds parsed from ``value``
+
+    Returns:
+        ``ms`` unchanged
+
+    Raises:
+        TimeParseError: If ``ms`` is out of range
+    """
+    if not _MIN_EPOCH_MS <= ms <= _MAX_EPOCH_MS:
+        raise TimeParseError(f"Failed to parse epoch milliseconds: {value}")
+    return ms
+
+
+def _to_epoch_ms(value: str | int | datetime) -> int:
+    """Convert a parse_time input to epoch milliseconds."""
+    # bool is an int subclass, but True/False are never meant as timestamps
+    if isinstance(value, bool):
+        raise TimeParseError(f"Failed to parse epoch milliseconds: {value}")
+    # Ints are already epoch milliseconds (as in parse_time); skip the
+    # datetime round trip, keeping its range check.
+    if isinstance(value, int):
+        return _checked_epoch_ms(value, value)
+    # Likewise for epoch millisecond strings, which parse_time would otherwise
+    # turn into a float-based datetime only to convert straight back.
+    # isdecimal(), unlike isdigit(), rejects characters int() can't parse ("²").
+    if isinstance(value, str) and value.isdecimal():
+        return _checked_epoch_ms(value, int(value))
+    return to_cloudwatch_timestamp(parse_time(value))
+
+
 def calculate_time_range(
     start_time: str | int | datetime | None = None,
     end_time: str | int | datetime | None = None,
@@ -236,24 +290,20 @@ def calculate_time_range(
         ValueError: If start_time is after end_time
     """
     # Calculate end time (defaults to now)
-    if end_time is None:
-        end_dt = datetime.now(UTC)
-    else:
-        end_dt = parse_time(end_time)
+    end_ms = _now_ms() if end_time is None else _to_epoch_ms(end_time)
 
     # Calculate start time (defaults to default_range_minutes ago)
     if start_time is None:
-        start_dt = end_dt - timedelta(minutes=default_range_minutes)
-    else:
-        start_dt = parse_time(start_time)
+        return end_ms - default_range_minutes * 60_000, end_ms
+    start_ms = _to_epoch_ms(start_time)
 
     # Validate time range
-    if start_dt > end_dt:
-        raise ValueError(
-            f"Start time ({start_dt.isoformat()}) cannot be after end time ({end_dt.isoformat()})"
-        )
+    if start_ms > end_ms:
+        start_iso = datetime.fromtimestamp(start_ms / 1000.0, tz=UTC).isoformat()
+        end_iso = datetime.fromtimestamp(end_ms / 1000.0, tz=UTC).isoformat()
+        raise ValueError(f"Start time ({start_iso}) cannot be after end time ({end_iso})")
 
-    return to_cloudwatch_timestamp(start_dt), to_cloudwatch_timestamp(end_dt)
+    return start_ms, end_ms
 
 
 def format_timestamp(timestamp_ms: int, format_str: str = "%Y-%m-%d %H:%M:%S UTC") -> str:
@@ -267,8 +317,25 @@ def format_timestamp(timestamp_ms: int, format_str: str = "%Y-%m-%d %H:%M:%S UTC
     Returns:
         Formatted timestamp string
     """
-    dt = datetime.fromtimestamp(timestamp_ms / 1000.0, tz=UTC)
-    return dt.strftime(format_str)
+    if "%f" in format_str:
+        dt = datetime.fromtimestamp(timestamp_ms / 1000.0, tz=UTC)
+        return dt.strftime(format_str)
+    # Without sub-second fields, every timestamp in the same second formats
+    # identically, so the result is cached per second.
+    return _format_epoch_seconds(timestamp_ms // 1000, format_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_epoch_seconds(epoch_seconds: int, format_str: str) -> str:
+    """Format whole epoch seconds with strftime."""
+    return datetime.fromtimestamp(epoch_seconds, tz=UTC).strftime(format_str)
+
+
+# Singular label and plural %-template for each unit rendered by time_ago
+_TIME_AGO_TEMPLATES: dict[str, tuple[str, str]] = {
+    unit: (f"1 {unit} ago", f"%d {unit}s ago")
+    for unit in ("second", "minute", "hour", "day", "week", "month", "year")
+}
 
 
 def time_ago(timestamp_ms: int) -> str:
@@ -293,27 +360,32 @@ def time_ago(timestamp_ms: int) -> str:
     seconds = int(delta.total_seconds())
 
     if seconds < 60:
-        return f"{seconds} second{'s' if seconds != 1 else ''} ago"
+        return _ago(seconds, "second")
 
     minutes = seconds // 60
     if minutes < 60:
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
+        return _ago(minutes, "minute")
 
     hours = minutes // 60
     if hours < 24:
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+        return _ago(hours, "hour")
 
     days = hours // 24
     if days < 7:
-        return f"{days} day{'s' if days != 1 else ''} ago"
+        return _ago(days, "day")
 
     weeks = days // 7
     if weeks < 4:
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
+        return _ago(weeks, "week")
 
     months = days // 30
     if months < 12:
-        return f"{months} month{'s' if months != 1 else ''} ago"
+        return _ago(months, "month")
+
+    return _ago(days // 365, "year")
+
 
-    years = days // 365
-    return f"{years} year{'s' if years != 1 else ''} ago"
+def _ago(amount: int, unit: str) -> str:
+    """Format an amount of a time unit using the precomputed templates."""
+    singular, plural = _TIME_AGO_TEMPLATES[unit]
+    return singular if amount == 1 else plural % amount
@@ -14,16 +14,29 @@ def clean_env() -> Generator[None, None, None]:
     original_env = os.environ.copy()
 
     # Clear LogAI and AWS environment variables
-    env_prefixes = ["LOGAI_", "AWS_"]
-    for key in list(os.environ.keys()):
-        if any(key.startswith(prefix) for prefix in env_prefixes):
-            del os.environ[key]
+    for key in [key for key in os.environ if key.startswith(("LOGAI_", "AWS_"))]:
+        del os.environ[key]
 
     yield
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    # Restore original environment, touching only the variables that changed
+    for key in os.environ.keys() - original_env.keys():
+        del os.environ[key]
+    for key, value in original_env.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+
+
+@pytest.fixture
+def base_env(clean_env: None, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Minimal environment for constructing LogAISettings."""
+    env = {
+        "LOGAI_ANTHROPIC_API_KEY": "sk-ant-test-key",
+        "AWS_DEFAULT_REGION": "us-east-1",
+    }
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    return env
 
 
 @pytest.fixture
@@ -12,31 +12,34 @@ import pytest
 from logai.config.settings import LogAISettings
 from logai.core.orchestrator import LLMOrchestrator, RetryState
 from logai.core.sanitizer import LogSanitizer
-from logai.core.tools.registry import ToolRegistry
 from logai.providers.llm.base import LLMResponse
 
 
 @pytest.fixture
-def integration_settings():
+def integration_settings(tmp_path):
     """Create settings for integration tests."""
-    settings = Mock(spec=LogAISettings)
-    settings.pii_sanitization_enabled = True
-    settings.max_retry_attempts = 3
-    settings.intent_detection_enabled = True
-    settings.auto_retry_enabled = True
-    settings.time_expansion_factor = 4.0
+    settings = LogAISettings(
+        pii_sanitization_enabled=True,
+        max_retry_attempts=3,
+        intent_detection_enabled=True,
+        auto_retry_enabled=True,
+        time_expansion_factor=4.0,
+        cache_dir=tmp_path,
+    )
     return settings
 
 
 @pytest.fixture
-def disabled_retry_settings():
+def disabled_retry_settings(tmp_path):
     """Create settings with auto-retry disabled."""
-    settings = Mock(spec=LogAISettings)
-    settings.pii_sanitization_enabled = True
-    settings.max_retry_attempts = 3
-    settings.intent_detection_enabled = True
-    settings.auto_retry_enabled = False  # Disabled
-    settings.time_expansion_factor = 4.0
+    settings = LogAISettings(
+        pii_sanitization_enabled=True,
+        max_retry_attempts=3,
+        intent_detection_enabled=True,
+        auto_retry_enabled=False,  # Disabled
+        time_expansion_factor=4.0,
+        cache_dir=tmp_path,
+    )
     return settings
 
 
@@ -107,7 +110,7 @@ class TestEmptyResultsAutoRetry:
         ]
         
         # Setup: Mock tool registry
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -191,7 +194,7 @@ class TestEmptyResultsAutoRetry:
         mock_llm.chat.side_effect = tool_responses + [final_response]
         
         # Setup: Mock tools that always return empty
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={"success": True, "count": 0, "events": []}
@@ -262,7 +265,7 @@ class TestEmptyResultsAutoRetry:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -333,7 +336,7 @@ class TestIntentDetectionAndNudging:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={
@@ -421,7 +424,7 @@ class TestIntentDetectionAndNudging:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -476,7 +479,7 @@ class TestFeatureFlagBehavior:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={"success": True, "count": 0, "events": []}
@@ -498,15 +501,17 @@ class TestFeatureFlagBehavior:
         assert "no logs" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_intent_detection_disabled(self, mock_sanitizer):
+    async def test_intent_detection_disabled(self, mock_sanitizer, tmp_path):
         """Test that disabling intent detection doesn't trigger nudges."""
         # Settings with intent detection disabled
-        settings = Mock(spec=LogAISettings)
-        settings.pii_sanitization_enabled = True
-        settings.max_retry_attempts = 3
-        settings.intent_detection_enabled = False  # Disabled
-        settings.auto_retry_enabled = True
-        settings.time_expansion_factor = 4.0
+        settings = LogAISettings(
+            pii_sanitization_enabled=True,
+            max_retry_attempts=3,
+            intent_detection_enabled=False,  # Disabled
+            auto_retry_enabled=True,
+            time_expansion_factor=4.0,
+            cache_dir=tmp_path,
+        )
         
         mock_llm = AsyncMock()
         
@@ -518,7 +523,7 @@ class TestFeatureFlagBehavior:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         
@@ -576,7 +581,7 @@ class TestStrategyTracking:
         
         mock_llm.chat.side_effect = tool_responses
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={"success": True, "count": 0, "events": []}
@@ -667,7 +672,7 @@ class TestLogGroupNotFound:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -760,7 +765,7 @@ class TestComplexScenarios:
             ),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
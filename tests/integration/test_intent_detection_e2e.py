@@ -13,19 +13,20 @@ from logai.config.settings import LogAISettings
 from logai.core.intent_detector import IntentDetector, IntentType
 from logai.core.orchestrator import LLMOrchestrator
 from logai.core.sanitizer import LogSanitizer
-from logai.core.tools.registry import ToolRegistry
 from logai.providers.llm.base import LLMResponse
 
 
 @pytest.fixture
-def e2e_settings():
+def e2e_settings(tmp_path):
     """Settings for end-to-end testing."""
-    settings = Mock(spec=LogAISettings)
-    settings.pii_sanitization_enabled = True
-    settings.max_retry_attempts = 3
-    settings.intent_detection_enabled = True
-    settings.auto_retry_enabled = True
-    settings.time_expansion_factor = 4.0
+    settings = LogAISettings(
+        pii_sanitization_enabled=True,
+        max_retry_attempts=3,
+        intent_detection_enabled=True,
+        auto_retry_enabled=True,
+        time_expansion_factor=4.0,
+        cache_dir=tmp_path,
+    )
     return settings
 
 
@@ -173,7 +174,7 @@ class TestIntentNudgingFlow:
             LLMResponse(content="Found 5 errors.", finish_reason="stop"),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={
@@ -224,7 +225,7 @@ class TestIntentNudgingFlow:
             LLMResponse(content="Here are the available log groups.", finish_reason="stop"),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={
@@ -291,7 +292,7 @@ class TestIntentNudgingFlow:
             LLMResponse(content="Analysis complete.", finish_reason="stop"),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -357,7 +358,7 @@ class TestIntentWithRetry:
             LLMResponse(content="Found logs in expanded range.", finish_reason="stop"),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -420,7 +421,7 @@ class TestIntentWithRetry:
             LLMResponse(content="Found logs with expanded time.", finish_reason="stop"),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         mock_tools.execute.side_effect = [
@@ -470,7 +471,7 @@ class TestEdgeCases:
             LLMResponse(content="Found errors.", finish_reason="stop"),
         ]
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock(
             return_value={"success": True, "count": 3, "events": [{"message": "ERROR"}] * 3}
@@ -503,7 +504,7 @@ class TestEdgeCases:
         
         mock_llm.chat.side_effect = responses
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_tools.execute = AsyncMock()
         
@@ -19,7 +19,6 @@ from logai.core.log_group_manager import (
 from logai.core.orchestrator import LLMOrchestrator
 from logai.config.settings import LogAISettings
 from logai.core.sanitizer import LogSanitizer
-from logai.core.tools.registry import ToolRegistry
 from logai.providers.llm.base import LLMResponse
 
 
@@ -329,7 +328,7 @@ class TestStartupFlowIntegration:
     """Test the full startup flow with orchestrator integration."""
 
     @pytest.mark.asyncio
-    async def test_startup_flow_end_to_end(self):
+    async def test_startup_flow_end_to_end(self, tmp_path):
         """Test complete startup sequence with log groups loaded before orchestrator init."""
         # 1. Mock datasource
         mock_datasource = Mock()
@@ -355,19 +354,21 @@ class TestStartupFlowIntegration:
         
         # 3. Create orchestrator with log group manager
         mock_llm = AsyncMock()
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_sanitizer = Mock(spec=LogSanitizer)
-        mock_settings = Mock(spec=LogAISettings)
-        mock_settings.max_tool_iterations = 10
-        mock_settings.auto_retry_enabled = True
-        mock_settings.intent_detection_enabled = True
+        settings = LogAISettings(
+            max_tool_iterations=10,
+            auto_retry_enabled=True,
+            intent_detection_enabled=True,
+            cache_dir=tmp_path,
+        )
         
         orchestrator = LLMOrchestrator(
             llm_provider=mock_llm,
             tool_registry=mock_tools,
             sanitizer=mock_sanitizer,
-            settings=mock_settings,
+            settings=settings,
             log_group_manager=manager,
         )
         
@@ -383,23 +384,25 @@ class TestStartupFlowIntegration:
         assert orchestrator.log_group_manager is manager
         
     @pytest.mark.asyncio
-    async def test_orchestrator_works_without_log_group_manager(self):
+    async def test_orchestrator_works_without_log_group_manager(self, tmp_path):
         """Test backward compatibility - orchestrator works without manager."""
         mock_llm = AsyncMock()
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_sanitizer = Mock(spec=LogSanitizer)
-        mock_settings = Mock(spec=LogAISettings)
-        mock_settings.max_tool_iterations = 10
-        mock_settings.auto_retry_enabled = True
-        mock_settings.intent_detection_enabled = True
+        settings = LogAISettings(
+            max_tool_iterations=10,
+            auto_retry_enabled=True,
+            intent_detection_enabled=True,
+            cache_dir=tmp_path,
+        )
         
         # Create orchestrator without log group manager
         orchestrator = LLMOrchestrator(
             llm_provider=mock_llm,
             tool_registry=mock_tools,
             sanitizer=mock_sanitizer,
-            settings=mock_settings,
+            settings=settings,
             log_group_manager=None,
         )
         
@@ -466,7 +469,7 @@ class TestRefreshCommand:
             assert f"/aws/lambda/new-{i}" in refreshed_names
         
     @pytest.mark.asyncio
-    async def test_refresh_updates_orchestrator_context(self):
+    async def test_refresh_updates_orchestrator_context(self, tmp_path):
         """Test that refresh injects updated context into orchestrator."""
         # Setup
         mock_datasource = Mock()
@@ -482,19 +485,21 @@ class TestRefreshCommand:
         
         # Create orchestrator
         mock_llm = AsyncMock()
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_sanitizer = Mock(spec=LogSanitizer)
-        mock_settings = Mock(spec=LogAISettings)
-        mock_settings.max_tool_iterations = 10
-        mock_settings.auto_retry_enabled = True
-        mock_settings.intent_detection_enabled = True
+        settings = LogAISettings(
+            max_tool_iterations=10,
+            auto_retry_enabled=True,
+            intent_detection_enabled=True,
+            cache_dir=tmp_path,
+        )
         
         orchestrator = LLMOrchestrator(
             llm_provider=mock_llm,
             tool_registry=mock_tools,
             sanitizer=mock_sanitizer,
-            settings=mock_settings,
+            settings=settings,
             log_group_manager=manager,
         )
         
@@ -636,7 +641,7 @@ class TestRegressionScenarios:
         assert matches[0].name == "/test"
         
     @pytest.mark.asyncio
-    async def test_orchestrator_conversation_still_works(self):
+    async def test_orchestrator_conversation_still_works(self, tmp_path):
         """Test that normal orchestrator conversations work with log group manager."""
         mock_datasource = Mock()
         page = {"logGroups": [{"logGroupName": "/aws/lambda/api", "creationTime": 1234567890000}]}
@@ -656,19 +661,21 @@ class TestRegressionScenarios:
             finish_reason="stop",
         )
         
-        mock_tools = Mock(spec=ToolRegistry)
+        mock_tools = Mock(spec_set=["to_function_definitions", "execute"])
         mock_tools.to_function_definitions = Mock(return_value=[])
         mock_sanitizer = Mock(spec=LogSanitizer)
-        mock_settings = Mock(spec=LogAISettings)
-        mock_settings.max_tool_iterations = 10
-        mock_settings.auto_retry_enabled = True
-        mock_settings.intent_detection_enabled = True
+        settings = LogAISettings(
+            max_tool_iterations=10,
+            auto_retry_enabled=True,
+            intent_detection_enabled=True,
+            cache_dir=tmp_path,
+        )
         
         orchestrator = LLMOrchestrator(
             llm_provider=mock_llm,
             tool_registry=mock_tools,
             sanitizer=mock_sanitizer,
-            settings=mock_settings,
+            settings=settings,
             log_group_manager=manager,
         )
         
@@ -4,8 +4,11 @@ import asyncio
 import json
 import time
 from pathlib import Path
+from typing import Any
 
+import aiosqlite
 import pytest
+from logai.core.context import result_cache
 from logai.core.context.result_cache import CachedResultSummary, ResultCacheManager
 
 
@@ -237,6 +240,36 @@ class TestResultCacheManager:
         assert len(summary.sample_events) == 0
         assert summary.time_range == {"start": None, "end": None}
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    async def test_cache_result_non_ascii_size(
+        self,
+        cache_manager: ResultCacheManager,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ) -> None:
+        """Test that non-ASCII messages round-trip and are sized as stored bytes."""
+        if not use_orjson:
+            monkeypatch.setattr("logai.core.context.result_cache.orjson", None)
+        result = {"events": [{"timestamp": 1707750000000, "message": "Zeitüberschreitung ✗"}]}
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/unicode"},
+            result=result,
+        )
+
+        async with aiosqlite.connect(str(cache_manager.db_path)) as db:
+            async with db.execute(
+                "SELECT result_data, data_size_bytes FROM cached_results WHERE cache_id = ?",
+                (summary.cache_id,),
+            ) as cursor:
+                row = await cursor.fetchone()
+        chunk = await cache_manager.fetch_chunk(cache_id=summary.cache_id)
+
+        assert row is not None
+        assert row[1] == len(row[0].encode("utf-8"))
+        assert chunk["events"] == result["events"]
+
     @pytest.mark.asyncio
     async def test_cache_result_logs_key(self, cache_manager: ResultCacheManager) -> None:
         """Test caching result with 'logs' key instead of 'events'."""
@@ -375,6 +408,81 @@ class TestResultCacheManager:
         assert len(chunk["events"]) == 2
         assert chunk["total_filtered"] == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_filter_time_range_and_pattern(
+        self, cache_manager: ResultCacheManager, large_result: dict
+    ) -> None:
+        """Test that the pattern filter applies within the time window."""
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/test"},
+            result=large_result,
+        )
+
+        # Events 100-199, of which "Event 15x" matches 10
+        chunk = await cache_manager.fetch_chunk(
+            cache_id=summary.cache_id,
+            filter_pattern="event 15",
+            time_start=1707750100000,
+            time_end=1707750199000,
+        )
+
+        assert chunk["total_filtered"] == 10
+        assert [e["message"] for e in chunk["events"]] == [f"Event {i}" for i in range(150, 160)]
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_repeated_filter_patterns(
+        self, cache_manager: ResultCacheManager, sample_result: dict
+    ) -> None:
+        """Test different case-insensitive patterns against the same memoized entry."""
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/test"},
+            result=sample_result,
+        )
+
+        errors = await cache_manager.fetch_chunk(cache_id=summary.cache_id, filter_pattern="error")
+        warnings = await cache_manager.fetch_chunk(cache_id=summary.cache_id, filter_pattern="WARN")
+        late_errors = await cache_manager.fetch_chunk(
+            cache_id=summary.cache_id, filter_pattern="Error", time_start=1707752700000
+        )
+
+        assert errors["total_filtered"] == 2
+        assert warnings["total_filtered"] == 1
+        assert [e["message"] for e in late_errors["events"]] == ["ERROR: API timeout occurred"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_filter_time_range_unordered(
+        self, cache_manager: ResultCacheManager
+    ) -> None:
+        """Test time filtering of events not in timestamp order or missing timestamps."""
+        result = {
+            "events": [
+                {"timestamp": 1707753600000, "message": "late"},
+                {"message": "no timestamp"},
+                {"timestamp": 1707751800000, "message": "middle"},
+                {"timestamp": 1707750000000, "message": "early"},
+            ]
+        }
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/unordered"},
+            result=result,
+        )
+
+        chunk = await cache_manager.fetch_chunk(
+            cache_id=summary.cache_id, time_start=1707751000000, time_end=1707754000000
+        )
+
+        # Original order is preserved
+        assert [e["message"] for e in chunk["events"]] == ["late", "middle"]
+
+        chunk = await cache_manager.fetch_chunk(
+            cache_id=summary.cache_id, filter_pattern="MID", time_start=1707751000000
+        )
+
+        assert [e["message"] for e in chunk["events"]] == ["middle"]
+
     @pytest.mark.asyncio
     async def test_fetch_chunk_not_found(self, cache_manager: ResultCacheManager) -> None:
         """Test fetching non-existent cache entry."""
@@ -425,6 +533,154 @@ class TestResultCacheManager:
         stats = await cache_manager.get_statistics()
         assert stats["total_accesses"] == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_decodes_payload_once_per_entry(
+        self,
+        cache_manager: ResultCacheManager,
+        large_result: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that paging through an entry parses the cached JSON only once."""
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/test"},
+            result=large_result,
+        )
+
+        loads_calls = 0
+        real_loads = result_cache._loads_result
+
+        def counting_loads(*args: Any, **kwargs: Any) -> Any:
+            nonlocal loads_calls
+            loads_calls += 1
+            return real_loads(*args, **kwargs)
+
+        monkeypatch.setattr(result_cache, "_loads_result", counting_loads)
+
+        pages = [
+            await cache_manager.fetch_chunk(cache_id=summary.cache_id, offset=offset, limit=100)
+            for offset in (0, 100, 900)
+        ]
+
+        assert loads_calls == 1
+        assert [page["events"][0]["message"] for page in pages] == [
+            "Event 0",
+            "Event 100",
+            "Event 900",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_filters_once_per_filtered_view(
+        self,
+        cache_manager: ResultCacheManager,
+        large_result: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that paging a filtered view filters once and slices the rest."""
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/test"},
+            result=large_result,
+        )
+
+        filter_calls = 0
+        real_apply_filters = cache_manager._apply_filters
+
+        def counting_apply_filters(*args: Any, **kwargs: Any) -> Any:
+            nonlocal filter_calls
+            filter_calls += 1
+            return real_apply_filters(*args, **kwargs)
+
+        monkeypatch.setattr(cache_manager, "_apply_filters", counting_apply_filters)
+
+        # "Event 1" matches Event 1, 10-19 and 100-199: 111 events
+        pages = [
+            await cache_manager.fetch_chunk(
+                cache_id=summary.cache_id, offset=offset, limit=50, filter_pattern="Event 1"
+            )
+            for offset in (0, 50, 100)
+        ]
+
+        assert filter_calls == 1
+        assert [page["total_filtered"] for page in pages] == [111, 111, 111]
+        assert [page["count"] for page in pages] == [50, 50, 11]
+        assert pages[-1]["has_more"] is False
+
+        await cache_manager.fetch_chunk(cache_id=summary.cache_id, filter_pattern="Event 2")
+
+        assert filter_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_checks_timestamp_order_once_per_entry(
+        self,
+        cache_manager: ResultCacheManager,
+        large_result: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that different time windows over one entry reuse its sorted timestamps."""
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/test"},
+            result=large_result,
+        )
+
+        pairwise_calls = 0
+        real_pairwise = result_cache.pairwise
+
+        def counting_pairwise(*args: Any) -> Any:
+            nonlocal pairwise_calls
+            pairwise_calls += 1
+            return real_pairwise(*args)
+
+        monkeypatch.setattr(result_cache, "pairwise", counting_pairwise)
+
+        base = 1707750000000
+        windows = [(base, base + 9000), (base + 500_000, None), (None, base + 99_000)]
+        chunks = [
+            await cache_manager.fetch_chunk(
+                cache_id=summary.cache_id, time_start=time_start, time_end=time_end
+            )
+            for time_start, time_end in windows
+        ]
+
+        assert pairwise_calls == 1
+        assert [chunk["total_filtered"] for chunk in chunks] == [10, 500, 100]
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_after_recache_returns_new_result(
+        self, cache_manager: ResultCacheManager, sample_result: dict, large_result: dict
+    ) -> None:
+        """Test that re-caching the same query isn't served stale decoded events."""
+        query_params = {"log_group": "/aws/lambda/test"}
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs", query_params=query_params, result=sample_result
+        )
+        first = await cache_manager.fetch_chunk(cache_id=summary.cache_id)
+
+        await cache_manager.cache_result(
+            tool_name="fetch_logs", query_params=query_params, result=large_result
+        )
+        second = await cache_manager.fetch_chunk(cache_id=summary.cache_id)
+
+        assert first["total_filtered"] == 4
+        assert second["total_filtered"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_clear(self, cache_manager: ResultCacheManager, sample_result: dict) -> None:
+        """Test clearing all entries."""
+        summary = await cache_manager.cache_result(
+            tool_name="fetch_logs",
+            query_params={"log_group": "/aws/lambda/test"},
+            result=sample_result,
+        )
+        await cache_manager.fetch_chunk(cache_id=summary.cache_id)
+
+        deleted = await cache_manager.clear()
+
+        assert deleted == 1
+        chunk = await cache_manager.fetch_chunk(cache_id=summary.cache_id)
+        assert chunk["success"] is False
+
     @pytest.mark.asyncio
     async def test_delete_expired(self, tmp_path: Path, sample_result: dict) -> None:
         """Test deleting expired entries."""
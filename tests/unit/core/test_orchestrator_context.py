@@ -405,6 +405,42 @@ class TestHistoryPruning:
         # We mainly verify no aggressive pruning occurred
         assert len(orch.conversation_history) >= initial_count
 
+    @pytest.mark.asyncio
+    async def test_history_trimmed_to_message_cap(
+        self, settings, mock_llm_provider, mock_sanitizer, mock_result_cache
+    ):
+        """Test that history never grows past history_max_messages."""
+        settings.enable_history_pruning = False
+        settings.history_max_messages = 10
+
+        orch = LLMOrchestrator(
+            llm_provider=mock_llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=mock_sanitizer,
+            settings=settings,
+            result_cache=mock_result_cache,
+        )
+
+        # Oldest entries form a tool-call exchange that will be cut in the middle
+        orch.conversation_history.append({"role": "user", "content": "Old question"})
+        orch.conversation_history.append(
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "call_1"}]}
+        )
+        orch.conversation_history.append(
+            {"role": "tool", "tool_call_id": "call_1", "content": "{}"}
+        )
+        for i in range(8):
+            orch.conversation_history.append({"role": "user", "content": f"Message {i}"})
+
+        mock_llm_provider.chat.return_value = LLMResponse(content="Response", tool_calls=None)
+
+        await orch.chat("Latest message")
+
+        history = orch.conversation_history
+        assert len(history) <= 11  # cap plus the assistant reply
+        assert history[0]["role"] != "tool"
+        assert history[-2]["content"] == "Latest message"
+
 
 class TestContextNotifications:
     """Test context management notifications."""
@@ -755,16 +791,16 @@ class TestCachedResultGuidance:
         assert processed["result"]["cached"] is True
 
         # Should have pending guidance
-        assert orchestrator._pending_cache_guidance is not None
-        assert "cache_id" in orchestrator._pending_cache_guidance
-        assert orchestrator._pending_cache_guidance["tool_name"] == "query_logs"
-        assert orchestrator._pending_cache_guidance["total_events"] == 1000
+        (guidance,) = orchestrator._default_session.pending_cache_guidance
+        assert "cache_id" in guidance
+        assert guidance["tool_name"] == "query_logs"
+        assert guidance["total_events"] == 1000
 
         # Get the injection
         injection = orchestrator._get_pending_context_injection()
         assert injection is not None
         assert "fetch_cached_result_chunk" in injection
-        assert orchestrator._pending_cache_guidance is None  # Should be cleared
+        assert orchestrator._default_session.pending_cache_guidance == []  # Should be cleared
 
     @pytest.mark.asyncio
     async def test_auto_fetch_guidance_can_be_disabled(
@@ -797,7 +833,7 @@ class TestCachedResultGuidance:
         await orchestrator._process_tool_result(tool_result, "query_logs")
 
         # Should have pending guidance stored
-        assert orchestrator._pending_cache_guidance is not None
+        assert orchestrator._default_session.pending_cache_guidance
 
         # But injection should NOT be returned when disabled
         injection = orchestrator._get_pending_context_injection()
@@ -866,6 +902,42 @@ class TestCachedResultGuidance:
         assert injection is not None
         assert f'cache_id="{cache_id}"' in injection
 
+    @pytest.mark.asyncio
+    async def test_cache_guidance_kept_for_concurrent_cached_results(
+        self, settings, mock_llm_provider, mock_sanitizer, mock_result_cache
+    ):
+        """Test that two results cached by one batch of tool calls both get guidance."""
+        settings.enable_result_caching = True
+        settings.enable_auto_fetch_guidance = True
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=mock_llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=mock_sanitizer,
+            settings=settings,
+            result_cache=mock_result_cache,
+        )
+
+        large_result = {
+            "success": True,
+            "events": [{"message": f"log {i}"} for i in range(1000)],
+            "count": 1000,
+        }
+        processed = await asyncio.gather(
+            orchestrator._process_tool_result(
+                {"tool_call_id": "call_1", "result": large_result}, "query_logs"
+            ),
+            orchestrator._process_tool_result(
+                {"tool_call_id": "call_2", "result": large_result}, "fetch_logs"
+            ),
+        )
+
+        injection = orchestrator._get_pending_context_injection()
+        assert injection is not None
+        assert "2 large results" in injection
+        for result in processed:
+            assert f'cache_id="{result["result"]["cache_id"]}"' in injection
+
     @pytest.mark.asyncio
     async def test_pending_cache_guidance_cleared_after_use(
         self, settings, mock_llm_provider, mock_sanitizer, mock_result_cache
@@ -892,14 +964,14 @@ class TestCachedResultGuidance:
         await orchestrator._process_tool_result(tool_result, "query_logs")
 
         # Verify pending guidance exists
-        assert orchestrator._pending_cache_guidance is not None
+        assert orchestrator._default_session.pending_cache_guidance
 
         # Get the injection (should clear it)
         injection = orchestrator._get_pending_context_injection()
         assert injection is not None
 
         # Verify guidance was cleared
-        assert orchestrator._pending_cache_guidance is None
+        assert orchestrator._default_session.pending_cache_guidance == []
 
         # Second call should return None
         injection2 = orchestrator._get_pending_context_injection()
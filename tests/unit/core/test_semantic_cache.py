@@ -0,0 +1,61 @@
+"""Unit tests for SemanticCache."""
+
+import pytest
+
+from logai.core.semantic_cache import SemanticCache
+
+VOCABULARY = ("list", "lambda", "log", "groups", "auth", "errors", "show")
+
+
+def bag_of_words(text: str) -> list[float]:
+    """Embed text as word counts over a tiny fixed vocabulary."""
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(term)) for term in VOCABULARY]
+
+
+@pytest.fixture
+def cache():
+    """Create a semantic cache with a deterministic embedder."""
+    return SemanticCache(embedder=bag_of_words, threshold=0.7)
+
+
+class TestSemanticCache:
+    """Test semantic cache lookups."""
+
+    def test_empty_cache_misses(self, cache):
+        """Test that an empty cache never hits."""
+        assert cache.lookup("list lambda log groups") is None
+
+    def test_paraphrase_hits(self, cache):
+        """Test that a similar query returns the stored answer."""
+        cache.store("list lambda log groups", "Found 2 groups")
+
+        assert cache.lookup("show lambda log groups") == "Found 2 groups"
+
+    def test_unrelated_query_misses(self, cache):
+        """Test that a dissimilar query does not hit."""
+        cache.store("list lambda log groups", "Found 2 groups")
+
+        assert cache.lookup("auth errors") is None
+
+    def test_best_match_wins(self, cache):
+        """Test that the most similar entry is returned."""
+        cache.store("list lambda log groups", "groups answer")
+        cache.store("auth errors", "errors answer")
+
+        assert cache.lookup("auth errors?") == "errors answer"
+
+    def test_threshold_override(self, cache):
+        """Test that a per-lookup threshold overrides the default."""
+        cache.store("list lambda log groups", "Found 2 groups")
+
+        assert cache.lookup("show lambda log groups", threshold=0.99) is None
+
+    def test_oldest_entry_evicted(self):
+        """Test that the cache is bounded by max_entries."""
+        cache = SemanticCache(embedder=bag_of_words, threshold=0.7, max_entries=1)
+        cache.store("list lambda log groups", "groups answer")
+        cache.store("auth errors", "errors answer")
+
+        assert len(cache) == 1
+        assert cache.lookup("list lambda log groups") is None
@@ -1,5 +1,6 @@
 """Tests for CloudWatch tools."""
 
+import threading
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -130,6 +131,30 @@ class TestFetchLogsTool:
         # Verify sanitization was applied
         mock_sanitizer.sanitize_log_events.assert_called_once_with(mock_events)
 
+    @pytest.mark.asyncio
+    async def test_fetch_logs_large_batch_sanitized_off_event_loop(
+        self, mock_datasource, mock_sanitizer, mock_settings
+    ):
+        """Test that large batches are sanitized in a worker thread."""
+        mock_events = [{"timestamp": i, "message": f"Log message {i}"} for i in range(100)]
+        mock_datasource.fetch_logs.return_value = mock_events
+        sanitize_threads = []
+
+        def sanitize(events):
+            sanitize_threads.append(threading.get_ident())
+            return events, {}
+
+        mock_sanitizer.sanitize_log_events.side_effect = sanitize
+
+        tool = FetchLogsTool(
+            datasource=mock_datasource, sanitizer=mock_sanitizer, settings=mock_settings
+        )
+
+        result = await tool.execute(log_group="/aws/lambda/test", start_time="1h ago")
+
+        assert result["count"] == 100
+        assert sanitize_threads and sanitize_threads[0] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_fetch_logs_with_filter(self, mock_datasource, mock_sanitizer, mock_settings):
         """Test fetching with filter pattern."""
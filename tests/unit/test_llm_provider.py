@@ -309,3 +309,21 @@ class TestLiteLLMProvider:
         )
 
         assert provider._get_model_name() == "openai/gpt-4-turbo-preview"
+
+
+class TestProviderPackageExports:
+    """Tests for the lazily loaded exports of logai.providers.llm."""
+
+    def test_lazy_exports_resolve(self):
+        """Test that provider classes resolve on attribute access."""
+        from logai.providers import llm
+
+        assert llm.LiteLLMProvider is LiteLLMProvider
+        assert callable(llm.validate_model)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        from logai.providers import llm
+
+        with pytest.raises(AttributeError):
+            llm.NotAProvider  # noqa: B018
@@ -44,6 +44,31 @@ class TestMetricsCollector:
         assert collector.get_counter_value("requests", labels={"status": "success"}) == 2.0
         assert collector.get_counter_value("requests", labels={"status": "error"}) == 1.0
 
+    def test_bulk_increment(self):
+        """Test incrementing several counters in one call."""
+        collector = MetricsCollector()
+
+        collector.bulk_increment(
+            {
+                ("requests", frozenset({("status", "success")})): 2.0,
+                ("requests", frozenset({("status", "error")})): 1.0,
+                ("retries", frozenset()): 3.0,
+            }
+        )
+
+        assert collector.get_counter_value("requests") == 3.0
+        assert collector.get_counter_value("requests", labels={"status": "success"}) == 2.0
+        assert collector.get_counter_value("retries") == 3.0
+
+    def test_bulk_increment_disabled(self):
+        """Test that bulk increments are dropped when collection is disabled."""
+        collector = MetricsCollector()
+        collector.disable()
+
+        collector.bulk_increment({("requests", frozenset()): 1.0})
+
+        assert len(collector.get_events()) == 0
+
     def test_record_histogram(self):
         """Test recording histogram metrics."""
         collector = MetricsCollector()
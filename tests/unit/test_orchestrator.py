@@ -8,10 +8,12 @@ import pytest
 from logai.config.settings import LogAISettings
 from logai.core.metrics import MetricsCollector
 from logai.core.orchestrator import (
+    ConversationSession,
     LLMOrchestrator,
     OrchestratorError,
     RetryState,
     RetryPromptGenerator,
+    ToolCallStatus,
 )
 from logai.core.sanitizer import LogSanitizer
 from logai.core.tools.registry import ToolRegistry
@@ -19,17 +21,18 @@ from logai.providers.llm.base import LLMResponse
 
 
 @pytest.fixture
-def mock_settings():
-    """Create mock settings with self-direction enabled."""
-    settings = Mock(spec=LogAISettings)
-    settings.pii_sanitization_enabled = True
-    # Self-direction settings
-    settings.max_retry_attempts = 3
-    settings.intent_detection_enabled = True
-    settings.auto_retry_enabled = True
-    settings.time_expansion_factor = 4.0
-    settings.max_tool_iterations = 10  # Default value
-    return settings
+def mock_settings(tmp_path):
+    """Create settings with self-direction enabled."""
+    return LogAISettings(
+        pii_sanitization_enabled=True,
+        # Self-direction settings
+        max_retry_attempts=3,
+        intent_detection_enabled=True,
+        auto_retry_enabled=True,
+        time_expansion_factor=4.0,
+        max_tool_iterations=10,  # Default value
+        cache_dir=tmp_path,
+    )
 
 
 @pytest.fixture
@@ -108,6 +111,58 @@ class TestLLMOrchestrator:
         assert orchestrator.conversation_history[0]["role"] == "user"
         assert orchestrator.conversation_history[1]["role"] == "assistant"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_keep_separate_history(self, orchestrator, mock_llm_provider):
+        """Test that concurrent chats on separate sessions don't share history."""
+
+        async def reply(messages, tools, stream):
+            await asyncio.sleep(0)
+            return LLMResponse(content=f"Echo: {messages[-1]['content']}", finish_reason="stop")
+
+        mock_llm_provider.chat.side_effect = reply
+        session_a = ConversationSession()
+        session_b = ConversationSession()
+
+        await asyncio.gather(
+            orchestrator.chat("from a", session=session_a),
+            orchestrator.chat("from b", session=session_b),
+        )
+
+        assert [m["content"] for m in session_a.history] == ["from a", "Echo: from a"]
+        assert [m["content"] for m in session_b.history] == ["from b", "Echo: from b"]
+        assert orchestrator.conversation_history == []
+
+    @pytest.mark.asyncio
+    async def test_context_injection_stays_in_its_session(self, orchestrator, mock_llm_provider):
+        """Test that a context update injected into one session doesn't reach another."""
+        mock_llm_provider.chat.return_value = LLMResponse(content="ok", finish_reason="stop")
+        session_a = ConversationSession()
+        session_b = ConversationSession()
+        orchestrator.inject_context_update("refreshed for a", session=session_a)
+
+        await orchestrator.chat("hi", session=session_b)
+        sent_to_b = mock_llm_provider.chat.call_args.kwargs["messages"]
+        await orchestrator.chat("hi", session=session_a)
+        sent_to_a = mock_llm_provider.chat.call_args.kwargs["messages"]
+
+        assert all(m["content"] != "refreshed for a" for m in sent_to_b)
+        assert sent_to_a[-1] == {"role": "system", "content": "refreshed for a"}
+        assert session_a.budget_tracker is not session_b.budget_tracker
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_closed_from_another_context(self, orchestrator, mock_llm_provider):
+        """Test that closing a partly consumed stream in another context doesn't raise."""
+        mock_llm_provider.chat.return_value = LLMResponse(content="streamed", finish_reason="stop")
+        session = ConversationSession()
+        stream = orchestrator.chat_stream("hi", session=session)
+
+        assert await anext(stream) == "s"
+        # The asyncgen finalizer closes abandoned generators in a task of its own
+        await asyncio.create_task(stream.aclose())
+
+        assert [m["content"] for m in session.history] == ["hi", "streamed"]
+        assert orchestrator.conversation_history == []
+
     @pytest.mark.asyncio
     async def test_chat_with_tool_call(self, orchestrator, mock_llm_provider, mock_tool_registry):
         """Test chat with single tool call."""
@@ -188,6 +243,75 @@ class TestLLMOrchestrator:
         # Should have executed both tools
         assert mock_tool_registry.execute.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_duplicate_tool_calls_in_batch_execute_once(
+        self, orchestrator, mock_llm_provider, mock_tool_registry
+    ):
+        """Test that identical tool calls in one response run the tool only once."""
+        tool_call_response = LLMResponse(
+            content="",
+            tool_calls=[
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "fetch_logs", "arguments": '{"a": 1, "b": 2}'},
+                },
+                {
+                    "id": "call_2",
+                    "type": "function",
+                    "function": {"name": "fetch_logs", "arguments": '{"b": 2, "a": 1}'},
+                },
+            ],
+            finish_reason="tool_calls",
+        )
+        final_response = LLMResponse(content="Done!", finish_reason="stop")
+
+        mock_llm_provider.chat.side_effect = [tool_call_response, final_response]
+        mock_tool_registry.execute.return_value = {"success": True, "count": 1}
+
+        await orchestrator.chat("Do something")
+
+        assert mock_tool_registry.execute.call_count == 1
+        # Every tool call still gets its own result message
+        tool_ids = [
+            m["tool_call_id"] for m in orchestrator.conversation_history if m["role"] == "tool"
+        ]
+        assert tool_ids == ["call_1", "call_2"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_failing_tool_call_reports_error(
+        self, orchestrator, mock_llm_provider, mock_tool_registry
+    ):
+        """Test that a deduplicated call reports the shared failure as ERROR."""
+        tool_call_response = LLMResponse(
+            content="",
+            tool_calls=[
+                {
+                    "id": f"call_{n}",
+                    "type": "function",
+                    "function": {"name": "fetch_logs", "arguments": '{"a": 1}'},
+                }
+                for n in (1, 2)
+            ],
+            finish_reason="tool_calls",
+        )
+        final_response = LLMResponse(content="Done!", finish_reason="stop")
+
+        mock_llm_provider.chat.side_effect = [tool_call_response, final_response]
+        mock_tool_registry.execute.side_effect = RuntimeError("boom")
+
+        finished = {}
+        orchestrator.register_tool_listener(
+            lambda record: finished.update({record.id: record}) if record.is_complete else None
+        )
+
+        await orchestrator.chat("Do something")
+
+        assert mock_tool_registry.execute.call_count == 1
+        duplicate = finished["call_2"]
+        assert duplicate.status == ToolCallStatus.ERROR
+        assert "boom" in duplicate.error_message
+
     @pytest.mark.asyncio
     async def test_respects_max_retry_limit(
         self, orchestrator, mock_llm_provider, mock_tool_registry
@@ -226,17 +350,19 @@ class TestLLMOrchestrator:
 
     @pytest.mark.asyncio
     async def test_no_retry_when_disabled(
-        self, mock_llm_provider, mock_tool_registry, mock_sanitizer
+        self, mock_llm_provider, mock_tool_registry, mock_sanitizer, tmp_path
     ):
         """Test that retry is disabled when auto_retry_enabled is False."""
         # Create settings with retry disabled
-        settings = Mock(spec=LogAISettings)
-        settings.pii_sanitization_enabled = True
-        settings.max_retry_attempts = 3
-        settings.intent_detection_enabled = True
-        settings.auto_retry_enabled = False  # Disabled
-        settings.time_expansion_factor = 4.0
-        settings.max_tool_iterations = 10
+        settings = LogAISettings(
+            pii_sanitization_enabled=True,
+            max_retry_attempts=3,
+            intent_detection_enabled=True,
+            auto_retry_enabled=False,  # Disabled
+            time_expansion_factor=4.0,
+            max_tool_iterations=10,
+            cache_dir=tmp_path,
+        )
 
         orch = LLMOrchestrator(
             llm_provider=mock_llm_provider,
@@ -323,17 +449,19 @@ class TestMaxToolIterationsConfiguration:
 
     @pytest.mark.asyncio
     async def test_custom_max_iterations_limit(
-        self, mock_llm_provider, mock_tool_registry, mock_sanitizer
+        self, mock_llm_provider, mock_tool_registry, mock_sanitizer, tmp_path
     ):
         """Test that custom max_tool_iterations limit is respected."""
         # Create settings with custom limit
-        settings = Mock(spec=LogAISettings)
-        settings.pii_sanitization_enabled = True
-        settings.max_retry_attempts = 3
-        settings.intent_detection_enabled = True
-        settings.auto_retry_enabled = True
-        settings.time_expansion_factor = 4.0
-        settings.max_tool_iterations = 5  # Custom limit
+        settings = LogAISettings(
+            pii_sanitization_enabled=True,
+            max_retry_attempts=3,
+            intent_detection_enabled=True,
+            auto_retry_enabled=True,
+            time_expansion_factor=4.0,
+            max_tool_iterations=5,  # Custom limit
+            cache_dir=tmp_path,
+        )
 
         orch = LLMOrchestrator(
             llm_provider=mock_llm_provider,
@@ -395,17 +523,19 @@ class TestMaxToolIterationsConfiguration:
 
     @pytest.mark.asyncio
     async def test_max_iterations_streaming(
-        self, mock_llm_provider, mock_tool_registry, mock_sanitizer
+        self, mock_llm_provider, mock_tool_registry, mock_sanitizer, tmp_path
     ):
         """Test that max_tool_iterations limit works in streaming mode."""
         # Create settings with custom limit
-        settings = Mock(spec=LogAISettings)
-        settings.pii_sanitization_enabled = True
-        settings.max_retry_attempts = 3
-        settings.intent_detection_enabled = True
-        settings.auto_retry_enabled = True
-        settings.time_expansion_factor = 4.0
-        settings.max_tool_iterations = 3  # Low limit for testing
+        settings = LogAISettings(
+            pii_sanitization_enabled=True,
+            max_retry_attempts=3,
+            intent_detection_enabled=True,
+            auto_retry_enabled=True,
+            time_expansion_factor=4.0,
+            max_tool_iterations=3,  # Low limit for testing
+            cache_dir=tmp_path,
+        )
 
         orch = LLMOrchestrator(
             llm_provider=mock_llm_provider,
@@ -814,3 +944,8 @@ class TestExponentialBackoff:
         assert orch._confidence_bucket(0.7) == "medium"
         assert orch._confidence_bucket(0.65) == "low"
         assert orch._confidence_bucket(0.3) == "low"
+        assert orch._confidence_bucket(0.699) == "low"
+
+        # Out-of-range scores are clamped
+        assert orch._confidence_bucket(1.5) == "high"
+        assert orch._confidence_bucket(-0.2) == "low"
@@ -1,49 +1,100 @@
 """Integration test for Phase 5 - LLM Integration with Tools."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
 from logai.config.settings import LogAISettings
-from logai.core.orchestrator import LLMOrchestrator
+from logai.core.orchestrator import ConversationSession, LLMOrchestrator
 from logai.core.sanitizer import LogSanitizer
 from logai.core.tools.cloudwatch_tools import FetchLogsTool, ListLogGroupsTool
 from logai.core.tools.registry import ToolRegistry
-from logai.providers.datasources.cloudwatch import CloudWatchDataSource
 from logai.providers.llm.base import LLMResponse
-from logai.providers.llm.litellm_provider import LiteLLMProvider
 
 
-@pytest.fixture
-def mock_settings():
-    """Create test settings."""
-    settings = Mock(spec=LogAISettings)
-    settings.llm_provider = "anthropic"
-    settings.current_llm_api_key = "test-key"
-    settings.current_llm_model = "claude-3-5-sonnet-20241022"
-    settings.pii_sanitization_enabled = True
-    # Add self-direction settings for new features
-    settings.max_retry_attempts = 3
-    settings.intent_detection_enabled = True
-    settings.auto_retry_enabled = True
-    settings.time_expansion_factor = 4.0
-    return settings
-
-
-@pytest.fixture
-def setup_tools():
-    """Setup tools for integration test."""
-    # Clear registry before test
+class FakeLLMProvider:
+    """Replays canned LLM responses; the last one repeats once the queue is drained."""
+
+    def __init__(self, responses: list[LLMResponse | Exception]):
+        self._responses = list(responses)
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def chat(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        self.calls.append((args, kwargs))
+        response = self._responses.pop(0) if len(self._responses) > 1 else self._responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FakeCloudWatch:
+    """In-memory stand-in for CloudWatchDataSource that records its calls."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop configured results and recorded calls."""
+        self.groups: list[dict[str, Any]] = []
+        self.events: list[dict[str, Any]] = []
+        self.list_calls: list[dict[str, Any]] = []
+        self.fetch_calls: list[dict[str, Any]] = []
+        # Calls wait here when set, so they only finish once all parties are in flight
+        self.barrier: asyncio.Barrier | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.barrier is not None:
+                await asyncio.wait_for(self.barrier.wait(), timeout=5)
+        finally:
+            self.in_flight -= 1
+
+    async def list_log_groups(self, **kwargs: Any) -> list[dict[str, Any]]:
+        self.list_calls.append(kwargs)
+        await self._call()
+        return self.groups
+
+    async def fetch_logs(self, **kwargs: Any) -> list[dict[str, Any]]:
+        self.fetch_calls.append(kwargs)
+        await self._call()
+        return self.events
+
+
+@pytest.fixture(scope="module")
+def mock_settings(tmp_path_factory):
+    """Create test settings shared by every test in this module (read-only)."""
+    return LogAISettings(
+        llm_provider="anthropic",
+        anthropic_api_key="test-key",
+        anthropic_model="claude-3-5-sonnet-20241022",
+        pii_sanitization_enabled=True,
+        # Add self-direction settings for new features
+        max_retry_attempts=3,
+        intent_detection_enabled=True,
+        auto_retry_enabled=True,
+        time_expansion_factor=4.0,
+        cache_dir=tmp_path_factory.mktemp("cache"),
+    )
+
+
+@pytest.fixture(scope="module")
+def registered_tools(mock_settings):
+    """Register the tools once for the module against a shared fake datasource."""
     ToolRegistry.clear()
 
-    # Create mock datasource
-    datasource = AsyncMock(spec=CloudWatchDataSource)
+    datasource = FakeCloudWatch()
     sanitizer = LogSanitizer(enabled=True)
-    settings = Mock(spec=LogAISettings)
 
     # Register tools
-    list_tool = ListLogGroupsTool(datasource=datasource, settings=settings)
-    fetch_tool = FetchLogsTool(datasource=datasource, sanitizer=sanitizer, settings=settings)
+    list_tool = ListLogGroupsTool(datasource=datasource, settings=mock_settings)
+    fetch_tool = FetchLogsTool(datasource=datasource, sanitizer=sanitizer, settings=mock_settings)
 
     ToolRegistry.register(list_tool)
     ToolRegistry.register(fetch_tool)
@@ -54,6 +105,14 @@ def setup_tools():
     ToolRegistry.clear()
 
 
+@pytest.fixture
+def setup_tools(registered_tools):
+    """Setup tools for integration test."""
+    # Tools hold a reference to the shared datasource; only its state is reset
+    registered_tools["datasource"].reset()
+    return registered_tools
+
+
 class TestPhase5Integration:
     """Integration tests for Phase 5 - LLM with Tools."""
 
@@ -64,15 +123,12 @@ class TestPhase5Integration:
         datasource = setup_tools["datasource"]
         sanitizer = setup_tools["sanitizer"]
 
-        # Mock CloudWatch response
-        datasource.list_log_groups.return_value = [
+        # Fake CloudWatch response
+        datasource.groups = [
             {"name": "/aws/lambda/function1", "created": 1234567890000},
             {"name": "/aws/lambda/function2", "created": 1234567891000},
         ]
 
-        # Mock LLM provider
-        llm_provider = AsyncMock(spec=LiteLLMProvider)
-
         # First call: LLM decides to use list_log_groups tool
         tool_call_response = LLMResponse(
             content="",
@@ -92,7 +148,7 @@ class TestPhase5Integration:
             finish_reason="stop",
         )
 
-        llm_provider.chat.side_effect = [tool_call_response, final_response]
+        llm_provider = FakeLLMProvider([tool_call_response, final_response])
 
         # Create orchestrator
         orchestrator = LLMOrchestrator(
@@ -109,7 +165,7 @@ class TestPhase5Integration:
         assert "2 Lambda function log groups" in result
         assert "function1" in result
         assert "function2" in result
-        assert datasource.list_log_groups.called
+        assert datasource.list_calls
 
     @pytest.mark.asyncio
     async def test_full_workflow_fetch_logs_with_sanitization(self, setup_tools, mock_settings):
@@ -118,8 +174,8 @@ class TestPhase5Integration:
         datasource = setup_tools["datasource"]
         sanitizer = setup_tools["sanitizer"]
 
-        # Mock CloudWatch response with PII
-        datasource.fetch_logs.return_value = [
+        # Fake CloudWatch response with PII
+        datasource.events = [
             {
                 "timestamp": 1234567890000,
                 "message": "User john@example.com logged in from [IP_REDACTED]",
@@ -132,9 +188,6 @@ class TestPhase5Integration:
             },
         ]
 
-        # Mock LLM provider
-        llm_provider = AsyncMock(spec=LiteLLMProvider)
-
         # First call: LLM decides to fetch logs
         tool_call_response = LLMResponse(
             content="",
@@ -158,7 +211,7 @@ class TestPhase5Integration:
             finish_reason="stop",
         )
 
-        llm_provider.chat.side_effect = [tool_call_response, final_response]
+        llm_provider = FakeLLMProvider([tool_call_response, final_response])
 
         # Create orchestrator
         orchestrator = LLMOrchestrator(
@@ -173,10 +226,10 @@ class TestPhase5Integration:
 
         # Verify
         assert "2 log entries" in result
-        assert datasource.fetch_logs.called
+        assert datasource.fetch_calls
 
         # Verify fetch_logs was called with correct parameters
-        call_kwargs = datasource.fetch_logs.call_args[1]
+        call_kwargs = datasource.fetch_calls[-1]
         assert call_kwargs["log_group"] == "/aws/lambda/auth"
 
     @pytest.mark.asyncio
@@ -186,11 +239,11 @@ class TestPhase5Integration:
         datasource = setup_tools["datasource"]
         sanitizer = setup_tools["sanitizer"]
 
-        # Mock responses
-        datasource.list_log_groups.return_value = [
+        # Fake responses
+        datasource.groups = [
             {"name": "/aws/lambda/auth", "created": 1234567890000},
         ]
-        datasource.fetch_logs.return_value = [
+        datasource.events = [
             {
                 "timestamp": 1234567890000,
                 "message": "ERROR: Authentication failed",
@@ -198,9 +251,6 @@ class TestPhase5Integration:
             },
         ]
 
-        # Mock LLM provider
-        llm_provider = AsyncMock(spec=LiteLLMProvider)
-
         # Conversation: list -> fetch -> analyze
         responses = [
             # 1. List log groups
@@ -237,7 +287,7 @@ class TestPhase5Integration:
             ),
         ]
 
-        llm_provider.chat.side_effect = responses
+        llm_provider = FakeLLMProvider(responses)
 
         # Create orchestrator
         orchestrator = LLMOrchestrator(
@@ -252,8 +302,58 @@ class TestPhase5Integration:
 
         # Verify
         assert "authentication errors" in result
-        assert datasource.list_log_groups.called
-        assert datasource.fetch_logs.called
+        assert datasource.list_calls
+        assert datasource.fetch_calls
+
+    @pytest.mark.asyncio
+    async def test_parallel_tool_calls_execute_concurrently(self, setup_tools, mock_settings):
+        """Test that independent tool calls in one response run concurrently."""
+        datasource = setup_tools["datasource"]
+        datasource.barrier = asyncio.Barrier(2)
+        datasource.groups = [{"name": "/aws/lambda/auth", "created": 1234567890000}]
+        datasource.events = [
+            {"timestamp": 1234567890000, "message": "ERROR: timeout", "log_stream": "s1"}
+        ]
+
+        parallel_response = LLMResponse(
+            content="",
+            tool_calls=[
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "list_log_groups", "arguments": "{}"},
+                },
+                {
+                    "id": "call_2",
+                    "type": "function",
+                    "function": {
+                        "name": "fetch_logs",
+                        "arguments": '{"log_group": "/aws/lambda/auth", "start_time": "1h ago"}',
+                    },
+                },
+            ],
+            finish_reason="tool_calls",
+        )
+        final_response = LLMResponse(content="Found a timeout error.", finish_reason="stop")
+        llm_provider = FakeLLMProvider([parallel_response, final_response])
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings,
+        )
+
+        result = await orchestrator.chat("Any errors in auth?")
+
+        assert result == "Found a timeout error."
+        assert datasource.list_calls and datasource.fetch_calls
+        # Each call waits at the barrier for the other, so both were in flight together
+        assert datasource.max_in_flight == 2
+
+        # Tool results are appended in the order the LLM requested them
+        tool_messages = [m for m in orchestrator.conversation_history if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_1", "call_2"]
 
     @pytest.mark.asyncio
     async def test_tool_registry_function_definitions(self, setup_tools):
@@ -282,13 +382,11 @@ class TestPhase5Integration:
         datasource = setup_tools["datasource"]
         sanitizer = setup_tools["sanitizer"]
 
-        datasource.list_log_groups.return_value = []
-
-        llm_provider = AsyncMock(spec=LiteLLMProvider)
+        datasource.groups = []
 
         # Simple response without tools
-        llm_provider.chat.return_value = LLMResponse(
-            content="Hello! How can I help with logs?", finish_reason="stop"
+        llm_provider = FakeLLMProvider(
+            [LLMResponse(content="Hello! How can I help with logs?", finish_reason="stop")]
         )
 
         orchestrator = LLMOrchestrator(
@@ -316,3 +414,203 @@ class TestPhase5Integration:
         # Clear history
         orchestrator.clear_history()
         assert len(orchestrator.conversation_history) == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_tool_free_turn_served_from_response_cache(
+        self, setup_tools, mock_settings
+    ):
+        """Test that an identical tool-free conversation reuses the cached answer."""
+        llm_provider = FakeLLMProvider([LLMResponse(content="pong", finish_reason="stop")])
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings.model_copy(update={"response_cache_size": 128}),
+        )
+
+        first = await orchestrator.chat("ping", session=ConversationSession())
+        second_session = ConversationSession()
+        second = await orchestrator.chat("ping", session=second_session)
+
+        assert first == second == "pong"
+        assert len(llm_provider.calls) == 1
+        assert second_session.history[-1] == {"role": "assistant", "content": "pong"}
+
+    @pytest.mark.asyncio
+    async def test_streamed_turn_served_from_response_cache(self, setup_tools, mock_settings):
+        """Test that chat_stream stores and replays tool-free answers too."""
+        llm_provider = FakeLLMProvider([LLMResponse(content="pong", finish_reason="stop")])
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings.model_copy(update={"response_cache_size": 128}),
+        )
+
+        first = [t async for t in orchestrator.chat_stream("ping", session=ConversationSession())]
+        second_session = ConversationSession()
+        second = [t async for t in orchestrator.chat_stream("ping", session=second_session)]
+
+        assert "".join(first) == "".join(second) == "pong"
+        assert len(llm_provider.calls) == 1
+        assert second_session.history[-1] == {"role": "assistant", "content": "pong"}
+
+    @pytest.mark.asyncio
+    async def test_response_cache_missed_after_log_groups_change(self, setup_tools, mock_settings):
+        """Test that a changed log group list (e.g. after /refresh) bypasses cached answers."""
+        llm_provider = FakeLLMProvider(
+            [
+                LLMResponse(content="one group", finish_reason="stop"),
+                LLMResponse(content="two groups", finish_reason="stop"),
+            ]
+        )
+        log_group_manager = Mock(is_ready=True)
+        log_group_manager.format_for_prompt.return_value = "## Log Groups\n- /aws/lambda/a"
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings.model_copy(update={"response_cache_size": 128}),
+            log_group_manager=log_group_manager,
+        )
+
+        first = await orchestrator.chat("which groups?", session=ConversationSession())
+        log_group_manager.format_for_prompt.return_value = (
+            "## Log Groups\n- /aws/lambda/a\n- /aws/lambda/b"
+        )
+        second = await orchestrator.chat("which groups?", session=ConversationSession())
+
+        assert (first, second) == ("one group", "two groups")
+        assert len(llm_provider.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_disabled_by_default(self, setup_tools, mock_settings):
+        """Test that identical conversations reach the LLM unless the cache is enabled."""
+        llm_provider = FakeLLMProvider([LLMResponse(content="pong", finish_reason="stop")])
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings,
+        )
+
+        await orchestrator.chat("ping", session=ConversationSession())
+        await orchestrator.chat("ping", session=ConversationSession())
+
+        assert mock_settings.response_cache_size == 0
+        assert len(llm_provider.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_using_turn_not_served_from_response_cache(self, setup_tools, mock_settings):
+        """Test that answers produced after tool calls are never cached."""
+        setup_tools["datasource"].groups = []
+        tool_call_response = LLMResponse(
+            content="",
+            tool_calls=[
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "list_log_groups", "arguments": "{}"},
+                }
+            ],
+            finish_reason="tool_calls",
+        )
+        final_response = LLMResponse(content="No log groups found.", finish_reason="stop")
+        llm_provider = FakeLLMProvider(
+            [tool_call_response, final_response, tool_call_response, final_response]
+        )
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings.model_copy(update={"response_cache_size": 128}),
+        )
+
+        await orchestrator.chat("List log groups", session=ConversationSession())
+        await orchestrator.chat("List log groups", session=ConversationSession())
+
+        assert len(llm_provider.calls) == 4
+        assert len(setup_tools["datasource"].list_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_hit_skips_llm(self, setup_tools, mock_settings):
+        """Test that a semantic cache hit answers an opening question without the LLM."""
+
+        class StubSemanticCache:
+            def __init__(self):
+                self.stored = []
+
+            def lookup(self, query, threshold=None):
+                return "Cached: 2 Lambda log groups" if "lambda" in query.lower() else None
+
+            def store(self, query, answer):
+                self.stored.append((query, answer))
+
+        semantic_cache = StubSemanticCache()
+        llm_provider = FakeLLMProvider([LLMResponse(content="fresh", finish_reason="stop")])
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings,
+            semantic_cache=semantic_cache,
+        )
+
+        result = await orchestrator.chat("show me the lambda log groups")
+        assert result == "Cached: 2 Lambda log groups"
+        assert llm_provider.calls == []
+
+        # A miss on a fresh conversation goes to the LLM and is stored
+        miss = await orchestrator.chat("any auth failures?", session=ConversationSession())
+        assert miss == "fresh"
+        assert semantic_cache.stored == [("any auth failures?", "fresh")]
+
+    @pytest.mark.asyncio
+    async def test_streamed_semantic_cache_hit_embeds_off_event_loop(
+        self, setup_tools, mock_settings
+    ):
+        """Test that chat_stream uses the semantic cache and embeds in a worker thread."""
+
+        class StubSemanticCache:
+            def __init__(self):
+                self.threads = []
+                self.stored = []
+
+            def lookup(self, query, threshold=None):
+                self.threads.append(threading.get_ident())
+                return "Cached: 2 Lambda log groups" if "lambda" in query.lower() else None
+
+            def store(self, query, answer):
+                self.threads.append(threading.get_ident())
+                self.stored.append((query, answer))
+
+        semantic_cache = StubSemanticCache()
+        llm_provider = FakeLLMProvider([LLMResponse(content="fresh", finish_reason="stop")])
+
+        orchestrator = LLMOrchestrator(
+            llm_provider=llm_provider,
+            tool_registry=ToolRegistry,
+            sanitizer=setup_tools["sanitizer"],
+            settings=mock_settings,
+            semantic_cache=semantic_cache,
+        )
+
+        hit = [t async for t in orchestrator.chat_stream("show me the lambda log groups")]
+        miss = [
+            t
+            async for t in orchestrator.chat_stream(
+                "any auth failures?", session=ConversationSession()
+            )
+        ]
+
+        assert "".join(hit) == "Cached: 2 Lambda log groups"
+        assert "".join(miss) == "fresh"
+        assert len(llm_provider.calls) == 1
+        assert semantic_cache.stored == [("any auth failures?", "fresh")]
+        assert threading.get_ident() not in semantic_cache.threads
@@ -1,6 +1,7 @@
 """Tests for PII sanitization."""
 
 import re
+import sys
 
 import pytest
 
@@ -196,6 +197,50 @@ class TestLogSanitizer:
         assert "email" in redactions
         assert "ipv4" in redactions
 
+    def test_sanitize_log_events_match_spanning_messages(self) -> None:
+        """Test that a match across two joined messages does not leak between events."""
+        sanitizer = LogSanitizer()
+        events = [
+            {"message": "Redirecting to http://internal-host"},
+            {"message": "token abc:def@example"},
+            {"timestamp": 1234567890},
+        ]
+
+        sanitized_events, redactions = sanitizer.sanitize_log_events(events)
+
+        assert [e.get("message") for e in sanitized_events] == [
+            "Redirecting to http://internal-host",
+            "token abc:def@example",
+            None,
+        ]
+        assert redactions == {}
+
+    @pytest.mark.parametrize(
+        "source",
+        [r"^secret=\w+$", r"\Asecret=\w+\Z", r"(?<![^\s])secret=\w+"],
+        ids=["line_anchors", "string_anchors", "lookbehind"],
+    )
+    def test_sanitize_log_events_boundary_dependent_pattern(self, source: str) -> None:
+        """Test that anchored custom patterns match each event, not the joined batch."""
+        sanitizer = LogSanitizer(
+            custom_patterns=[
+                SanitizationPattern(
+                    name="line_secret",
+                    pattern=re.compile(source),
+                    replacement="[REDACTED_SECRET]",
+                )
+            ]
+        )
+        events = [{"message": "secret=hunter2"}, {"message": "secret=swordfish"}]
+
+        sanitized_events, redactions = sanitizer.sanitize_log_events(events)
+
+        assert [e["message"] for e in sanitized_events] == [
+            "[REDACTED_SECRET]",
+            "[REDACTED_SECRET]",
+        ]
+        assert redactions == {"line_secret": 2}
+
     def test_sanitize_log_events_disabled(self) -> None:
         """Test that disabled sanitizer returns original log events."""
         sanitizer = LogSanitizer(enabled=False)
@@ -255,6 +300,104 @@ class TestLogSanitizer:
         assert "ID-123456" not in result.sanitized_text
         assert result.redactions["custom_id"] == 2
 
+    def test_custom_pattern_group_reference_in_replacement(self) -> None:
+        """Test that group references in replacements survive pattern combining."""
+        custom_pattern = SanitizationPattern(
+            name="session",
+            pattern=re.compile(r"(?i)(session)=(\w{8,})"),
+            replacement=r"\1=[SESSION_REDACTED]",
+        )
+        sanitizer = LogSanitizer(custom_patterns=[custom_pattern])
+
+        result = sanitizer.sanitize("user@example.com SESSION=abcdef123456")
+
+        assert result.sanitized_text == "[EMAIL_REDACTED] SESSION=[SESSION_REDACTED]"
+        assert result.redactions == {"email": 1, "session": 1}
+
+    def test_custom_pattern_with_backreference_falls_back(self) -> None:
+        """Test that patterns with internal backreferences are still applied."""
+        custom_pattern = SanitizationPattern(
+            name="repeated",
+            pattern=re.compile(r"(\d{3})-\1"),
+            replacement="[REPEATED_REDACTED]",
+        )
+        sanitizer = LogSanitizer(custom_patterns=[custom_pattern])
+
+        result = sanitizer.sanitize("code 123-123 and 123-456")
+
+        assert result.sanitized_text == "code [REPEATED_REDACTED] and 123-456"
+        assert result.redactions == {"repeated": 1}
+
+    def test_ascii_and_unicode_text_sanitize_alike(self) -> None:
+        """Test that the ASCII fast path matches Unicode-mode results."""
+        sanitizer = LogSanitizer()
+
+        ascii_result = sanitizer.sanitize("Bearer abc.def.ghi from 10.0.0.1")
+        unicode_result = sanitizer.sanitize("Bearer abc.def.ghi from 10.0.0.1 ✓")
+        # \x1f is whitespace only in Unicode mode
+        separator_result = sanitizer.sanitize("Bearer\x1fabc.def.ghi")
+
+        assert ascii_result.sanitized_text == "[TOKEN_REDACTED] from [IP_REDACTED]"
+        assert unicode_result.sanitized_text == "[TOKEN_REDACTED] from [IP_REDACTED] ✓"
+        assert separator_result.sanitized_text == "[TOKEN_REDACTED]"
+
+    def test_hyperscan_prefilter_falls_back_without_hyperscan(self, monkeypatch) -> None:
+        """Test that the Hyperscan flag degrades to re-only sanitization."""
+        monkeypatch.setitem(sys.modules, "hyperscan", None)
+        sanitizer = LogSanitizer(use_hyperscan=True)
+
+        result = sanitizer.sanitize("Contact user@example.com")
+
+        assert result.sanitized_text == "Contact [EMAIL_REDACTED]"
+        assert result.redactions == {"email": 1}
+
+    def test_prefilter_skips_text_without_anchors(self) -> None:
+        """Test that the default patterns' anchors screen out text that cannot match."""
+        sanitizer = LogSanitizer()
+        sanitizer.sanitize("build the screening regex")
+
+        assert sanitizer._may_contain_match("Service started, waiting for requests") is False
+        assert sanitizer._may_contain_match("Bearer header present") is True
+        assert sanitizer._may_contain_match("retry 3 of 5") is True
+
+    def test_custom_pattern_without_prefilter_disables_screening(self) -> None:
+        """Test that a custom pattern with no prefilter is never skipped."""
+        custom_pattern = SanitizationPattern(
+            name="secret_word",
+            pattern=re.compile(r"swordfish"),
+            replacement="[SECRET_REDACTED]",
+        )
+        sanitizer = LogSanitizer(custom_patterns=[custom_pattern])
+
+        result = sanitizer.sanitize("the password is swordfish")
+
+        assert result.sanitized_text == "the password is [SECRET_REDACTED]"
+        assert result.redactions == {"secret_word": 1}
+
+    def test_sanitizers_share_compiled_pattern_set(self) -> None:
+        """Test that identically configured sanitizers reuse the compiled regexes."""
+        first = LogSanitizer()
+        second = LogSanitizer()
+        first.sanitize("user@example.com")
+        second.sanitize("user@example.com")
+
+        assert first._combined is second._combined
+        assert first._prefilter is second._prefilter
+
+    def test_compiled_pattern_set_fields(self) -> None:
+        """Test that each compiled regex lands in the attribute named for it."""
+        sanitizer = LogSanitizer()
+        sanitizer.sanitize("user@example.com")
+
+        assert isinstance(sanitizer._combined, re.Pattern)
+        assert isinstance(sanitizer._combined_ascii, re.Pattern)
+        assert sanitizer._combined_ascii.flags & re.ASCII
+        assert not sanitizer._combined.flags & re.ASCII
+        assert isinstance(sanitizer._group_patterns, dict)
+        assert {name for name, *_ in sanitizer._group_patterns.values()} == {
+            p.name for p in sanitizer.patterns if p.enabled
+        }
+
     def test_get_redaction_summary(self) -> None:
         """Test generation of redaction summary."""
         sanitizer = LogSanitizer()
@@ -270,6 +413,14 @@ class TestLogSanitizer:
         assert "2 Ipv4" in summary
         assert "1 Aws Access Key" in summary
 
+    def test_get_redaction_summary_unknown_pattern_name(self) -> None:
+        """Test that names not registered on the sanitizer are still made readable."""
+        sanitizer = LogSanitizer()
+
+        summary = sanitizer.get_redaction_summary({"session_token": 2, "email": 1})
+
+        assert summary == "Redacted: 1 Email, 2 Session Token"
+
     def test_get_redaction_summary_empty(self) -> None:
         """Test redaction summary with no redactions."""
         sanitizer = LogSanitizer()
@@ -292,16 +443,19 @@ class TestLogSanitizer:
 
         result = sanitizer.sanitize(log_message)
 
-        assert "[EMAIL_REDACTED]" in result.sanitized_text
-        assert "[IP_REDACTED]" in result.sanitized_text
-        assert "[API_KEY_REDACTED]" in result.sanitized_text
-        assert "[AWS_KEY_REDACTED]" in result.sanitized_text
-        assert "[PASSWORD_REDACTED]" in result.sanitized_text
+        # One scan per group; failures show exactly which tokens are missing/leaked
+        tokens = {
+            "[EMAIL_REDACTED]",
+            "[IP_REDACTED]",
+            "[API_KEY_REDACTED]",
+            "[AWS_KEY_REDACTED]",
+            "[PASSWORD_REDACTED]",
+        }
+        found = set(re.findall("|".join(map(re.escape, tokens)), result.sanitized_text))
+        assert found == tokens
 
-        assert "john.doe@company.com" not in result.sanitized_text
-        assert "203.0.113.42" not in result.sanitized_text
-        assert "AKIAI44QH8DHBEXAMPLE" not in result.sanitized_text
-        assert "SuperSecret123" not in result.sanitized_text
+        secrets = ("john.doe@company.com", "203.0.113.42", "AKIAI44QH8DHBEXAMPLE", "SuperSecret123")
+        assert re.findall("|".join(map(re.escape, secrets)), result.sanitized_text) == []
 
     def test_sanitization_preserves_log_structure(self) -> None:
         """Test that sanitization preserves overall log structure."""
@@ -370,3 +524,17 @@ class TestSanitizationPattern:
         )
 
         assert pattern.enabled is False
+
+    def test_sanitization_pattern_replacer(self) -> None:
+        """Test that literal replacements get a callable replacer and templates are kept."""
+        literal = SanitizationPattern(
+            name="test", pattern=re.compile(r"test"), replacement="[TEST]"
+        )
+        template = SanitizationPattern(
+            name="test", pattern=re.compile(r"(te)st"), replacement=r"\1[TEST]"
+        )
+
+        assert literal.replacement is sys.intern("[TEST]")
+        assert callable(literal.replacer)
+        assert literal.pattern.sub(literal.replacer, "a test") == "a [TEST]"
+        assert template.replacer == r"\1[TEST]"
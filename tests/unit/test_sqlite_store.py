@@ -1,19 +1,30 @@
 """Tests for SQLite cache store."""
 
+import asyncio
 import time
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 
 import pytest
 
+from logai.cache import sqlite_store
 from logai.cache.sqlite_store import CacheEntry, SQLiteStore
 
 
+@pytest.fixture(scope="module")
+def shared_store(tmp_path_factory: pytest.TempPathFactory) -> Iterator[SQLiteStore]:
+    """In-memory cache store shared by the module, so the schema is built once."""
+    store = SQLiteStore(tmp_path_factory.mktemp("test_cache"), database=":memory:")
+    yield store
+    asyncio.run(store.close())
+
+
 @pytest.fixture
-async def cache_store(tmp_path: Path) -> SQLiteStore:
-    """Create a temporary cache store for testing."""
-    store = SQLiteStore(tmp_path / "test_cache")
-    await store.initialize()
-    return store
+async def cache_store(shared_store: SQLiteStore) -> AsyncIterator[SQLiteStore]:
+    """Empty cache store for one test."""
+    await shared_store.initialize()
+    yield shared_store
+    await shared_store.clear()
 
 
 @pytest.mark.asyncio
@@ -25,10 +36,33 @@ class TestSQLiteStore:
         cache_dir = tmp_path / "cache"
         store = SQLiteStore(cache_dir)
         await store.initialize()
+        await store.close()
 
         assert cache_dir.exists()
         assert (cache_dir / "cache.db").exists()
 
+    async def test_concurrent_initialize_opens_one_connection(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent initialize calls share a single connection."""
+        store = SQLiteStore(tmp_path)
+        opened = []
+        connect = store._connect
+
+        async def counting_connect():  # type: ignore[no-untyped-def]
+            conn = await connect()
+            opened.append(conn)
+            return conn
+
+        monkeypatch.setattr(store, "_connect", counting_connect)
+
+        await asyncio.gather(*(store.initialize() for _ in range(5)))
+        try:
+            assert len(opened) == 1
+            assert store._conn is opened[0]
+        finally:
+            await store.close()
+
     async def test_set_and_get_entry(self, cache_store: SQLiteStore) -> None:
         """Test storing and retrieving cache entry."""
         entry = CacheEntry(
@@ -87,8 +121,31 @@ class TestSQLiteStore:
         await cache_store.set(entry)
         await cache_store.delete("to_delete")
 
-        result = await cache_store.get("to_delete")
-        assert result is None
+        assert not await cache_store.exists("to_delete")
+
+    async def test_exists(self, cache_store: SQLiteStore) -> None:
+        """Test presence checks ignore expired entries and don't count hits."""
+        now = int(time.time())
+        await cache_store.set_many(
+            [
+                CacheEntry(id="live", query_type="fetch_logs", payload={}),
+                CacheEntry(
+                    id="stale",
+                    query_type="fetch_logs",
+                    payload={},
+                    created_at=now - 7200,
+                    expires_at=now - 3600,
+                ),
+            ]
+        )
+
+        assert await cache_store.exists("live")
+        assert not await cache_store.exists("stale")
+        assert not await cache_store.exists("missing")
+
+        result = await cache_store.get("live")
+        assert result is not None
+        assert result.hit_count == 1
 
     async def test_delete_expired(self, cache_store: SQLiteStore) -> None:
         """Test deleting expired entries."""
@@ -116,8 +173,8 @@ class TestSQLiteStore:
         deleted_count = await cache_store.delete_expired()
 
         assert deleted_count == 1
-        assert await cache_store.get("expired1") is None
-        assert await cache_store.get("valid1") is not None
+        assert not await cache_store.exists("expired1")
+        assert await cache_store.exists("valid1")
 
     async def test_delete_by_log_group(self, cache_store: SQLiteStore) -> None:
         """Test deleting entries by log group."""
@@ -141,28 +198,29 @@ class TestSQLiteStore:
             payload={"events": []},
         )
 
-        await cache_store.set(entry1)
-        await cache_store.set(entry2)
-        await cache_store.set(entry3)
+        await cache_store.set_many([entry1, entry2, entry3])
 
         # Delete func1 entries
         deleted = await cache_store.delete_by_log_group("/aws/lambda/func1")
 
         assert deleted == 2
-        assert await cache_store.get("entry1") is None
-        assert await cache_store.get("entry2") is not None
-        assert await cache_store.get("entry3") is None
+        assert not await cache_store.exists("entry1")
+        assert await cache_store.exists("entry2")
+        assert not await cache_store.exists("entry3")
 
     async def test_clear_all(self, cache_store: SQLiteStore) -> None:
         """Test clearing all cache entries."""
         # Add multiple entries
-        for i in range(5):
-            entry = CacheEntry(
-                id=f"entry{i}",
-                query_type="fetch_logs",
-                payload={"test": "data"},
-            )
-            await cache_store.set(entry)
+        await cache_store.set_many(
+            [
+                CacheEntry(
+                    id=f"entry{i}",
+                    query_type="fetch_logs",
+                    payload={"test": "data"},
+                )
+                for i in range(5)
+            ]
+        )
 
         deleted = await cache_store.clear()
 
@@ -195,13 +253,16 @@ class TestSQLiteStore:
         assert await cache_store.get_entry_count() == 0
 
         # Add entries
-        for i in range(3):
-            entry = CacheEntry(
-                id=f"count{i}",
-                query_type="fetch_logs",
-                payload={"test": "data"},
-            )
-            await cache_store.set(entry)
+        await cache_store.set_many(
+            [
+                CacheEntry(
+                    id=f"count{i}",
+                    query_type="fetch_logs",
+                    payload={"test": "data"},
+                )
+                for i in range(3)
+            ]
+        )
 
         assert await cache_store.get_entry_count() == 3
 
@@ -210,14 +271,17 @@ class TestSQLiteStore:
         now = int(time.time())
 
         # Add entries with different access times
-        for i in range(5):
-            entry = CacheEntry(
-                id=f"lru{i}",
-                query_type="fetch_logs",
-                payload={"test": "data"},
-                last_accessed=now - (5 - i) * 100,  # Older entries first
-            )
-            await cache_store.set(entry)
+        await cache_store.set_many(
+            [
+                CacheEntry(
+                    id=f"lru{i}",
+                    query_type="fetch_logs",
+                    payload={"test": "data"},
+                    last_accessed=now - (5 - i) * 100,  # Older entries first
+                )
+                for i in range(5)
+            ]
+        )
 
         # Get 3 LRU entries
         lru = await cache_store.get_lru_entries(3)
@@ -230,21 +294,24 @@ class TestSQLiteStore:
     async def test_delete_entries_batch(self, cache_store: SQLiteStore) -> None:
         """Test deleting multiple entries."""
         # Add entries
-        for i in range(5):
-            entry = CacheEntry(
-                id=f"batch{i}",
-                query_type="fetch_logs",
-                payload={"test": "data"},
-            )
-            await cache_store.set(entry)
+        await cache_store.set_many(
+            [
+                CacheEntry(
+                    id=f"batch{i}",
+                    query_type="fetch_logs",
+                    payload={"test": "data"},
+                )
+                for i in range(5)
+            ]
+        )
 
         # Delete some entries
         deleted = await cache_store.delete_entries(["batch0", "batch2", "batch4"])
 
         assert deleted == 3
         assert await cache_store.get_entry_count() == 2
-        assert await cache_store.get("batch1") is not None
-        assert await cache_store.get("batch3") is not None
+        assert await cache_store.exists("batch1")
+        assert await cache_store.exists("batch3")
 
     async def test_hit_count_increment(self, cache_store: SQLiteStore) -> None:
         """Test that hit count is incremented on access."""
@@ -322,3 +389,41 @@ class TestSQLiteStore:
         result = await cache_store.get("update")
         assert result is not None
         assert result.payload == {"version": 2}
+
+    async def test_payload_round_trip_without_orjson(
+        self, cache_store: SQLiteStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that payloads are readable whether or not orjson is installed."""
+        payload = {"events": [{"message": "naïve ✓", "timestamp": 1}], "count": 1.5}
+        await cache_store.set(CacheEntry(id="fast", query_type="fetch_logs", payload=payload))
+
+        monkeypatch.setattr(sqlite_store, "orjson", None)
+        await cache_store.set(CacheEntry(id="stdlib", query_type="fetch_logs", payload=payload))
+
+        for key in ("fast", "stdlib"):
+            result = await cache_store.get(key)
+            assert result is not None
+            assert result.payload == payload
+
+    @pytest.mark.parametrize(
+        ("query", "params", "index"),
+        [
+            ("DELETE FROM cache_entries WHERE expires_at < ?", (0,), "idx_expires_at"),
+            (
+                "SELECT id FROM cache_entries ORDER BY last_accessed ASC LIMIT ?",
+                (3,),
+                "idx_last_accessed",
+            ),
+            ("DELETE FROM cache_entries WHERE log_group = ?", ("g",), "idx_log_group_time"),
+        ],
+        ids=["delete_expired", "get_lru_entries", "delete_by_log_group"],
+    )
+    async def test_maintenance_queries_use_indexes(
+        self, cache_store: SQLiteStore, query: str, params: tuple[object, ...], index: str
+    ) -> None:
+        """Test that expiry, LRU and log group queries avoid full table scans."""
+        db = await cache_store._connection()
+        async with db.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert f"USING INDEX {index}" in plan
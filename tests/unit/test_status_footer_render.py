@@ -7,26 +7,31 @@ from logai.ui.widgets.status_footer import StatusFooter
 from textual.binding import Binding
 
 
+@pytest.fixture(scope="module")
+def footer() -> StatusFooter:
+    """Shared StatusFooter for tests that only set reactive attributes."""
+    return StatusFooter()
+
+
 def test_status_footer_has_compose_method():
     """Test that StatusFooter has the compose method for widget creation."""
-    footer = StatusFooter()
+    # Methods live on the class, so the widget doesn't need initializing
+    footer = StatusFooter.__new__(StatusFooter)
     assert hasattr(footer, "compose")
     assert callable(footer.compose)
 
 
 def test_status_footer_has_update_methods():
     """Test that StatusFooter has the necessary update methods."""
-    footer = StatusFooter()
+    footer = StatusFooter.__new__(StatusFooter)
     assert hasattr(footer, "_update_status_display")
     assert callable(footer._update_status_display)
     assert hasattr(footer, "_update_shortcuts")
     assert callable(footer._update_shortcuts)
 
 
-def test_status_display_built_correctly():
+def test_status_display_built_correctly(footer: StatusFooter):
     """Test that status display text is built correctly for different statuses."""
-    footer = StatusFooter()
-
     # These are simple tests that don't require a full Textual context
     # They verify the reactive attributes work
 
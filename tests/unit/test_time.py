@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from freezegun import freeze_time
 
 from logai.utils import (
     TimeParseError,
@@ -16,60 +17,37 @@ from logai.utils import (
     to_cloudwatch_timestamp,
 )
 
+# Clock used by tests that depend on the current time
+FROZEN_NOW = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
 
+
+@freeze_time(FROZEN_NOW)
 class TestParseRelativeTime:
     """Test suite for parse_relative_time function."""
 
     def test_parse_now(self) -> None:
         """Test parsing 'now'."""
         result = parse_relative_time("now")
-        now = datetime.now(timezone.utc)
-
-        # Should be within 1 second of current time
-        assert abs((result - now).total_seconds()) < 1
-
-    def test_parse_yesterday(self) -> None:
-        """Test parsing 'yesterday'."""
-        result = parse_relative_time("yesterday")
-        expected = datetime.now(timezone.utc) - timedelta(days=1)
-
-        # Should be within 1 second
-        assert abs((result - expected).total_seconds()) < 1
-
-    def test_parse_minutes_ago(self) -> None:
-        """Test parsing minutes ago."""
-        result = parse_relative_time("30m ago")
-        expected = datetime.now(timezone.utc) - timedelta(minutes=30)
-
-        assert abs((result - expected).total_seconds()) < 1
-
-    def test_parse_hours_ago(self) -> None:
-        """Test parsing hours ago."""
-        result = parse_relative_time("2h ago")
-        expected = datetime.now(timezone.utc) - timedelta(hours=2)
-
-        assert abs((result - expected).total_seconds()) < 1
-
-    def test_parse_days_ago(self) -> None:
-        """Test parsing days ago."""
-        result = parse_relative_time("3d ago")
-        expected = datetime.now(timezone.utc) - timedelta(days=3)
-
-        assert abs((result - expected).total_seconds()) < 1
-
-    def test_parse_weeks_ago(self) -> None:
-        """Test parsing weeks ago."""
-        result = parse_relative_time("1w ago")
-        expected = datetime.now(timezone.utc) - timedelta(weeks=1)
-
-        assert abs((result - expected).total_seconds()) < 1
 
-    def test_parse_with_whitespace(self) -> None:
-        """Test parsing with extra whitespace."""
-        result = parse_relative_time("  5m  ago  ")
-        expected = datetime.now(timezone.utc) - timedelta(minutes=5)
-
-        assert abs((result - expected).total_seconds()) < 1
+        assert result == FROZEN_NOW
+
+    @pytest.mark.parametrize(
+        ("relative_str", "delta"),
+        [
+            ("yesterday", timedelta(days=1)),
+            ("30m ago", timedelta(minutes=30)),
+            ("2h ago", timedelta(hours=2)),
+            ("3d ago", timedelta(days=3)),
+            ("1w ago", timedelta(weeks=1)),
+            ("  5m  ago  ", timedelta(minutes=5)),
+        ],
+        ids=["yesterday", "minutes", "hours", "days", "weeks", "whitespace"],
+    )
+    def test_parse_relative(self, relative_str: str, delta: timedelta) -> None:
+        """Test parsing relative offsets from now."""
+        result = parse_relative_time(relative_str)
+
+        assert result == FROZEN_NOW - delta
 
     def test_parse_invalid_format(self) -> None:
         """Test parsing invalid format."""
@@ -111,6 +89,14 @@ class TestParseISO8601:
         # Check it's UTC
         assert result.utcoffset() == timezone.utc.utcoffset(None)
 
+    def test_parse_iso8601_with_non_utc_offset(self) -> None:
+        """Test that non-UTC offsets are converted to UTC."""
+        result = parse_iso8601("2024-01-15T10:30:00+05:30")
+
+        assert result.hour == 5
+        assert result.minute == 0
+        assert result.utcoffset() == timezone.utc.utcoffset(None)
+
     def test_parse_iso8601_with_milliseconds(self) -> None:
         """Test parsing ISO 8601 with milliseconds."""
         result = parse_iso8601("2024-01-15T10:30:00.123Z")
@@ -198,12 +184,13 @@ class TestParseTime:
         assert result.month == 1
         assert result.day == 15
 
+    @freeze_time(FROZEN_NOW)
     def test_parse_time_relative(self) -> None:
         """Test parsing relative time string."""
         result = parse_time("1h ago")
-        expected = datetime.now(timezone.utc) - timedelta(hours=1)
+        expected = FROZEN_NOW - timedelta(hours=1)
 
-        assert abs((result - expected).total_seconds()) < 1
+        assert result == expected
 
     def test_parse_time_epoch_string(self) -> None:
         """Test parsing epoch milliseconds string."""
@@ -253,6 +240,7 @@ class TestToCloudWatchTimestamp:
         assert result == 1705312800000
 
 
+@freeze_time(FROZEN_NOW)
 class TestCalculateTimeRange:
     """Test suite for calculate_time_range function."""
 
@@ -269,12 +257,8 @@ class TestCalculateTimeRange:
         """Test with only start time (end defaults to now)."""
         start, end = calculate_time_range(start_time="1h ago")
 
-        now = datetime.now(timezone.utc)
-        expected_start = now - timedelta(hours=1)
-
-        # Should be close to expected (within 1 second)
-        assert abs(start - to_cloudwatch_timestamp(expected_start)) < 1000
-        assert abs(end - to_cloudwatch_timestamp(now)) < 1000
+        assert start == to_cloudwatch_timestamp(FROZEN_NOW - timedelta(hours=1))
+        assert end == to_cloudwatch_timestamp(FROZEN_NOW)
 
     def test_calculate_time_range_only_end(self) -> None:
         """Test with only end time (start defaults to 1 hour before end)."""
@@ -288,27 +272,64 @@ class TestCalculateTimeRange:
         """Test with no times provided (defaults to last hour)."""
         start, end = calculate_time_range()
 
-        now = datetime.now(timezone.utc)
-        expected_start = now - timedelta(minutes=60)
-
-        # Should be close to expected
-        assert abs(start - to_cloudwatch_timestamp(expected_start)) < 1000
-        assert abs(end - to_cloudwatch_timestamp(now)) < 1000
+        assert start == to_cloudwatch_timestamp(FROZEN_NOW - timedelta(minutes=60))
+        assert end == to_cloudwatch_timestamp(FROZEN_NOW)
 
     def test_calculate_time_range_custom_default(self) -> None:
         """Test with custom default range."""
         start, end = calculate_time_range(default_range_minutes=30)
 
-        now = datetime.now(timezone.utc)
-        expected_start = now - timedelta(minutes=30)
-
-        assert abs(start - to_cloudwatch_timestamp(expected_start)) < 1000
+        assert start == to_cloudwatch_timestamp(FROZEN_NOW - timedelta(minutes=30))
 
     def test_calculate_time_range_invalid_order(self) -> None:
         """Test with start time after end time."""
         with pytest.raises(ValueError, match="Start time .* cannot be after end time"):
             calculate_time_range(start_time="2024-01-15T11:00:00Z", end_time="2024-01-15T10:00:00Z")
 
+    def test_calculate_time_range_epoch_milliseconds(self) -> None:
+        """Test that epoch millisecond ints pass through unchanged."""
+        assert calculate_time_range(1705312800123, 1705316400999) == (
+            1705312800123,
+            1705316400999,
+        )
+
+        with pytest.raises(ValueError, match="Start time .* cannot be after end time"):
+            calculate_time_range(1705316400000, 1705312800000)
+
+    @pytest.mark.parametrize(
+        "epoch",
+        [253402300800000, -62135596800001, 10**20, True],
+        ids=["after_year_9999", "before_year_1", "huge", "bool"],
+    )
+    def test_calculate_time_range_rejects_invalid_epoch_milliseconds(self, epoch) -> None:
+        """Test that out-of-range or bool epoch inputs raise TimeParseError."""
+        with pytest.raises(TimeParseError, match="Failed to parse epoch milliseconds"):
+            calculate_time_range(start_time=epoch, end_time=1705316400000)
+
+        with pytest.raises(TimeParseError, match="Failed to parse epoch milliseconds"):
+            calculate_time_range(end_time=epoch)
+
+    def test_calculate_time_range_epoch_milliseconds_bounds(self) -> None:
+        """Test that the first and last representable milliseconds are accepted."""
+        assert calculate_time_range(-62135596800000, 253402300799999) == (
+            -62135596800000,
+            253402300799999,
+        )
+
+    def test_calculate_time_range_epoch_strings(self) -> None:
+        """Test that epoch millisecond strings convert directly to ints."""
+        assert calculate_time_range("1705312800123", "1705316400999") == (
+            1705312800123,
+            1705316400999,
+        )
+
+        with pytest.raises(TimeParseError, match="Failed to parse epoch milliseconds"):
+            calculate_time_range("1705312800123", "253402300800000")
+
+        # Digit-like characters int() can't parse still raise TimeParseError
+        with pytest.raises(TimeParseError):
+            calculate_time_range("1705312800123", "1705316400\u00b2")
+
 
 class TestFormatTimestamp:
     """Test suite for format_timestamp function."""
@@ -325,56 +346,30 @@ class TestFormatTimestamp:
 
         assert result == "2024-01-15 10:00"
 
+    def test_format_timestamp_sub_second(self) -> None:
+        """Test that cached per-second formatting keeps sub-second fields."""
+        assert format_timestamp(1705312800999) == "2024-01-15 10:00:00 UTC"
+        assert format_timestamp(1705312800123, format_str="%S.%f") == "00.123000"
+
 
+@freeze_time(FROZEN_NOW)
 class TestTimeAgo:
     """Test suite for time_ago function."""
 
-    def test_time_ago_seconds(self) -> None:
-        """Test time ago for seconds."""
-        now = datetime.now(timezone.utc)
-        timestamp = to_cloudwatch_timestamp(now - timedelta(seconds=30))
-
-        result = time_ago(timestamp)
-
-        assert "30 seconds ago" in result or "31 seconds ago" in result
-
-    def test_time_ago_minutes(self) -> None:
-        """Test time ago for minutes."""
-        now = datetime.now(timezone.utc)
-        timestamp = to_cloudwatch_timestamp(now - timedelta(minutes=5))
-
-        result = time_ago(timestamp)
-
-        assert "5 minutes ago" in result or "6 minutes ago" in result
-
-    def test_time_ago_hours(self) -> None:
-        """Test time ago for hours."""
-        now = datetime.now(timezone.utc)
-        timestamp = to_cloudwatch_timestamp(now - timedelta(hours=3))
-
-        result = time_ago(timestamp)
-
-        assert "3 hours ago" in result or "2 hours ago" in result
-
-    def test_time_ago_days(self) -> None:
-        """Test time ago for days."""
-        now = datetime.now(timezone.utc)
-        timestamp = to_cloudwatch_timestamp(now - timedelta(days=2))
-
-        result = time_ago(timestamp)
-
-        assert "2 days ago" in result or "1 day ago" in result
-
-    def test_time_ago_singular(self) -> None:
-        """Test singular forms."""
-        now = datetime.now(timezone.utc)
-
-        # 1 second ago
-        timestamp = to_cloudwatch_timestamp(now - timedelta(seconds=1))
-        result = time_ago(timestamp)
-        assert "1 second ago" in result
-
-        # 1 minute ago
-        timestamp = to_cloudwatch_timestamp(now - timedelta(minutes=1))
-        result = time_ago(timestamp)
-        assert "1 minute ago" in result
+    @pytest.mark.parametrize(
+        ("delta", "expected"),
+        [
+            (timedelta(seconds=30), "30 seconds ago"),
+            (timedelta(minutes=5), "5 minutes ago"),
+            (timedelta(hours=3), "3 hours ago"),
+            (timedelta(days=2), "2 days ago"),
+            (timedelta(seconds=1), "1 second ago"),
+            (timedelta(minutes=1), "1 minute ago"),
+        ],
+        ids=["seconds", "minutes", "hours", "days", "singular_second", "singular_minute"],
+    )
+    def test_time_ago(self, delta: timedelta, expected: str) -> None:
+        """Test time ago labels for each unit, including singular forms."""
+        timestamp = to_cloudwatch_timestamp(FROZEN_NOW - delta)
+
+        assert time_ago(timestamp) == expected
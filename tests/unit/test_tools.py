@@ -1,10 +1,25 @@
 """Tests for tool base classes and registry."""
 
+from collections.abc import Iterator
+
 import pytest
 
 from logai.core.tools.base import BaseTool, ToolExecutionError
 from logai.core.tools.registry import ToolRegistry
 
+# Parameter schemas built once; the tools' parameters properties return them as-is
+_MOCK_TOOL_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "test_param": {
+            "type": "string",
+            "description": "Test parameter",
+        }
+    },
+    "required": ["test_param"],
+}
+_NO_PARAMETERS = {"type": "object", "properties": {}, "required": []}
+
 
 class MockTool(BaseTool):
     """Mock tool for testing."""
@@ -19,16 +34,7 @@ class MockTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "test_param": {
-                    "type": "string",
-                    "description": "Test parameter",
-                }
-            },
-            "required": ["test_param"],
-        }
+        return _MOCK_TOOL_PARAMETERS
 
     async def execute(self, **kwargs) -> dict:
         if "test_param" not in kwargs:
@@ -52,19 +58,61 @@ class FailingTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {"type": "object", "properties": {}, "required": []}
+        return _NO_PARAMETERS
 
     async def execute(self, **kwargs) -> dict:
         raise ValueError("This tool always fails")
 
 
+class NamedMockTool(MockTool):
+    """MockTool with a configurable name, for registering several at once."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(scope="module")
+def mock_tool() -> MockTool:
+    """Shared MockTool instance (tools are stateless)."""
+    return MockTool()
+
+
+@pytest.fixture(scope="module")
+def failing_tool() -> FailingTool:
+    """Shared FailingTool instance (tools are stateless)."""
+    return FailingTool()
+
+
+@pytest.fixture
+def registry() -> Iterator[type[ToolRegistry]]:
+    """Tool registry, cleared before and after each test."""
+    ToolRegistry.clear()
+    yield ToolRegistry
+    ToolRegistry.clear()
+
+
+@pytest.fixture(scope="class")
+def populated_registry(
+    mock_tool: MockTool, failing_tool: FailingTool
+) -> Iterator[type[ToolRegistry]]:
+    """Tool registry holding both test tools, shared by read-only tests in a class."""
+    ToolRegistry.clear()
+    ToolRegistry.register(mock_tool)
+    ToolRegistry.register(failing_tool)
+    yield ToolRegistry
+    ToolRegistry.clear()
+
+
 class TestBaseTool:
     """Tests for BaseTool."""
 
-    def test_to_function_definition(self):
+    def test_to_function_definition(self, mock_tool):
         """Test conversion to function definition format."""
-        tool = MockTool()
-        definition = tool.to_function_definition()
+        definition = mock_tool.to_function_definition()
 
         assert definition["type"] == "function"
         assert definition["function"]["name"] == "mock_tool"
@@ -72,139 +120,105 @@ class TestBaseTool:
         assert "properties" in definition["function"]["parameters"]
         assert "test_param" in definition["function"]["parameters"]["properties"]
 
-    @pytest.mark.asyncio
-    async def test_execute_success(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_success(self, mock_tool):
         """Test successful tool execution."""
-        tool = MockTool()
-        result = await tool.execute(test_param="hello")
+        result = await mock_tool.execute(test_param="hello")
 
         assert result["success"] is True
         assert result["result"] == "hello"
 
-    @pytest.mark.asyncio
-    async def test_execute_missing_param(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_missing_param(self, mock_tool):
         """Test execution with missing required parameter."""
-        tool = MockTool()
+        with pytest.raises(ToolExecutionError, match="test_param is required") as exc_info:
+            await mock_tool.execute()
 
-        with pytest.raises(ToolExecutionError) as exc_info:
-            await tool.execute()
-
-        assert "test_param is required" in str(exc_info.value)
         assert exc_info.value.tool_name == "mock_tool"
 
 
 class TestToolRegistry:
     """Tests for ToolRegistry."""
 
-    def setup_method(self):
-        """Clear registry before each test."""
-        ToolRegistry.clear()
-
-    def teardown_method(self):
-        """Clear registry after each test."""
-        ToolRegistry.clear()
-
-    def test_register_tool(self):
+    def test_register_tool(self, registry, mock_tool):
         """Test registering a tool."""
-        tool = MockTool()
-        ToolRegistry.register(tool)
+        registry.register(mock_tool)
 
-        assert ToolRegistry.get("mock_tool") is tool
-        assert len(ToolRegistry.get_all()) == 1
+        assert registry.get("mock_tool") is mock_tool
+        assert len(registry.get_all()) == 1
 
-    def test_register_duplicate_tool(self):
+    def test_register_duplicate_tool(self, registry, mock_tool):
         """Test that registering duplicate tool raises error."""
-        tool1 = MockTool()
-        tool2 = MockTool()
-
-        ToolRegistry.register(tool1)
-
-        with pytest.raises(ValueError) as exc_info:
-            ToolRegistry.register(tool2)
+        registry.register(mock_tool)
 
-        assert "already registered" in str(exc_info.value)
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(MockTool())
 
-    def test_unregister_tool(self):
+    def test_unregister_tool(self, registry, mock_tool):
         """Test unregistering a tool."""
-        tool = MockTool()
-        ToolRegistry.register(tool)
-        assert ToolRegistry.get("mock_tool") is not None
+        registry.register(mock_tool)
+        assert registry.get("mock_tool") is not None
 
-        ToolRegistry.unregister("mock_tool")
-        assert ToolRegistry.get("mock_tool") is None
+        registry.unregister("mock_tool")
+        assert registry.get("mock_tool") is None
 
-    def test_get_nonexistent_tool(self):
+    def test_get_nonexistent_tool(self, registry):
         """Test getting a tool that doesn't exist."""
-        result = ToolRegistry.get("nonexistent")
+        result = registry.get("nonexistent")
         assert result is None
 
-    def test_get_all_tools(self):
-        """Test getting all registered tools."""
-        tool1 = MockTool()
-        tool2 = FailingTool()
-
-        ToolRegistry.register(tool1)
-        ToolRegistry.register(tool2)
-
-        all_tools = ToolRegistry.get_all()
-        assert len(all_tools) == 2
-        assert tool1 in all_tools
-        assert tool2 in all_tools
-
-    def test_to_function_definitions(self):
-        """Test converting all tools to function definitions."""
-        tool1 = MockTool()
-        tool2 = FailingTool()
-
-        ToolRegistry.register(tool1)
-        ToolRegistry.register(tool2)
-
-        definitions = ToolRegistry.to_function_definitions()
-        assert len(definitions) == 2
-        assert all(d["type"] == "function" for d in definitions)
-        assert any(d["function"]["name"] == "mock_tool" for d in definitions)
-        assert any(d["function"]["name"] == "failing_tool" for d in definitions)
-
-    @pytest.mark.asyncio
-    async def test_execute_existing_tool(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_existing_tool(self, registry, mock_tool):
         """Test executing a registered tool."""
-        tool = MockTool()
-        ToolRegistry.register(tool)
+        registry.register(mock_tool)
 
-        result = await ToolRegistry.execute("mock_tool", test_param="test")
+        result = await registry.execute("mock_tool", test_param="test")
 
         assert result["success"] is True
         assert result["result"] == "test"
 
-    @pytest.mark.asyncio
-    async def test_execute_nonexistent_tool(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_nonexistent_tool(self, registry):
         """Test executing a tool that doesn't exist."""
-        with pytest.raises(ToolExecutionError) as exc_info:
-            await ToolRegistry.execute("nonexistent", test_param="test")
+        with pytest.raises(ToolExecutionError, match="not found in registry") as exc_info:
+            await registry.execute("nonexistent", test_param="test")
 
-        assert "not found in registry" in str(exc_info.value)
         assert exc_info.value.tool_name == "nonexistent"
 
-    @pytest.mark.asyncio
-    async def test_execute_failing_tool(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_failing_tool(self, registry, failing_tool):
         """Test executing a tool that raises an exception."""
-        tool = FailingTool()
-        ToolRegistry.register(tool)
+        registry.register(failing_tool)
 
-        with pytest.raises(ToolExecutionError) as exc_info:
-            await ToolRegistry.execute("failing_tool")
+        with pytest.raises(ToolExecutionError, match="This tool always fails") as exc_info:
+            await registry.execute("failing_tool")
 
-        assert "This tool always fails" in str(exc_info.value)
         assert exc_info.value.tool_name == "failing_tool"
 
-    def test_clear_registry(self):
-        """Test clearing the registry."""
-        tool1 = MockTool()
-        tool2 = FailingTool()
+    @pytest.mark.parametrize("n", [1, 2, 5, 10])
+    def test_register_count_and_clear(self, registry, n):
+        """Test that the registry counts registered tools and clearing empties it."""
+        for i in range(n):
+            registry.register(NamedMockTool(f"tool_{i}"))
+        assert len(registry.get_all()) == n
+
+        registry.clear()
+        assert registry.get_all() == []
+
 
-        ToolRegistry.register(tool1)
-        ToolRegistry.register(tool2)
-        assert len(ToolRegistry.get_all()) == 2
+class TestPopulatedToolRegistry:
+    """Read-only tests against a registry holding both test tools."""
 
-        ToolRegistry.clear()
-        assert len(ToolRegistry.get_all()) == 0
+    def test_get_all_tools(self, populated_registry, mock_tool, failing_tool):
+        """Test getting all registered tools."""
+        all_tools = populated_registry.get_all()
+        assert len(all_tools) == 2
+        assert mock_tool in all_tools
+        assert failing_tool in all_tools
+
+    def test_to_function_definitions(self, populated_registry):
+        """Test converting all tools to function definitions."""
+        definitions = populated_registry.to_function_definitions()
+        assert len(definitions) == 2
+        assert {d["type"] for d in definitions} == {"function"}
+        assert {d["function"]["name"] for d in definitions} == {"mock_tool", "failing_tool"}
@@ -13,6 +13,9 @@ from logai.ui.widgets.tool_sidebar import ToolCallsSidebar
 from textual.widget import Widget
 from textual.widgets import Static
 
+# More log groups than the sidebar previews, built once for the truncation test
+_TRUNCATION_LOG_GROUPS = tuple({"name": f"/aws/lambda/function-{i}"} for i in range(20))
+
 
 class TestUserMessage:
     """Tests for UserMessage widget."""
@@ -27,7 +30,7 @@ class TestUserMessage:
     def test_user_message_has_class(self) -> None:
         """Test that user message has the correct CSS class."""
         msg = UserMessage("Test")
-        assert msg.has_class("user-message")
+        assert "user-message" in msg.classes
 
 
 class TestAssistantMessage:
@@ -43,7 +46,7 @@ class TestAssistantMessage:
     def test_assistant_message_has_class(self) -> None:
         """Test that assistant message has the correct CSS class."""
         msg = AssistantMessage("Test")
-        assert msg.has_class("assistant-message")
+        assert "assistant-message" in msg.classes
 
     def test_assistant_message_append_token(self) -> None:
         """Test that tokens can be appended to assistant message."""
@@ -67,7 +70,7 @@ class TestSystemMessage:
     def test_system_message_has_class(self) -> None:
         """Test that system message has the correct CSS class."""
         msg = SystemMessage("Test")
-        assert msg.has_class("system-message")
+        assert "system-message" in msg.classes
 
 
 class TestLoadingIndicator:
@@ -77,7 +80,7 @@ class TestLoadingIndicator:
         """Test that loading indicator is created correctly."""
         indicator = LoadingIndicator()
         assert isinstance(indicator, Static)
-        assert indicator.has_class("loading-indicator")
+        assert "loading-indicator" in indicator.classes
 
 
 class TestErrorMessage:
@@ -93,7 +96,7 @@ class TestErrorMessage:
     def test_error_message_has_class(self) -> None:
         """Test that error message has the correct CSS class."""
         msg = ErrorMessage("Test error")
-        assert msg.has_class("error-message")
+        assert "error-message" in msg.classes
 
 
 class TestStatusFooter:
@@ -105,26 +108,27 @@ class TestStatusFooter:
         assert isinstance(status_footer, Widget)
         assert status_footer.model == "claude-3-5-sonnet"
 
-    def test_status_footer_set_status(self) -> None:
-        """Test that status can be set."""
+    def test_status_footer_setters(self) -> None:
+        """Test that status, cache stats and context usage can be set."""
         status_footer = StatusFooter()
+
         status_footer.set_status("Thinking...")
         assert status_footer.status == "Thinking..."
 
-    def test_status_footer_update_cache_stats(self) -> None:
-        """Test that cache stats can be updated."""
-        status_footer = StatusFooter()
         status_footer.update_cache_stats(10, 5)
         assert status_footer.cache_hits == 10
         assert status_footer.cache_misses == 5
 
-    def test_status_footer_update_context_usage(self) -> None:
-        """Test that context usage can be updated."""
-        status_footer = StatusFooter()
         status_footer.update_context_usage(75.5)
         assert status_footer.context_utilization == 75.5
 
 
+@pytest.fixture(scope="class")
+def sidebar() -> ToolCallsSidebar:
+    """Sidebar shared by the formatting tests, which don't mutate it."""
+    return ToolCallsSidebar()
+
+
 class TestToolCallsSidebar:
     """Tests for ToolCallsSidebar widget."""
 
@@ -134,9 +138,8 @@ class TestToolCallsSidebar:
         assert isinstance(sidebar, Static)
         assert sidebar._history == []
 
-    def test_format_log_groups(self) -> None:
+    def test_format_log_groups(self, sidebar: ToolCallsSidebar) -> None:
         """Test log groups result formatting."""
-        sidebar = ToolCallsSidebar()
         result = {
             "log_groups": [
                 {"name": "/aws/lambda/function-1"},
@@ -149,9 +152,8 @@ class TestToolCallsSidebar:
         assert "•" in formatted  # Bullet points
         assert "/aws/lambda" in formatted
 
-    def test_format_log_events(self) -> None:
+    def test_format_log_events(self, sidebar: ToolCallsSidebar) -> None:
         """Test log events result formatting."""
-        sidebar = ToolCallsSidebar()
         result = {
             "events": [
                 {
@@ -169,17 +171,15 @@ class TestToolCallsSidebar:
         assert "[" in formatted  # Timestamp brackets
         assert "ERROR" in formatted or "went wrong" in formatted
 
-    def test_format_truncation(self) -> None:
+    def test_format_truncation(self, sidebar: ToolCallsSidebar) -> None:
         """Test that large results are truncated."""
-        sidebar = ToolCallsSidebar()
-        result = {"log_groups": [{"name": f"/aws/lambda/function-{i}"} for i in range(20)]}
+        result = {"log_groups": list(_TRUNCATION_LOG_GROUPS)}
         formatted = sidebar._format_result(result)
         assert "Found 20 log groups:" in formatted
         assert "+10 more" in formatted  # Shows truncation
 
-    def test_format_empty_results(self) -> None:
+    def test_format_empty_results(self, sidebar: ToolCallsSidebar) -> None:
         """Test formatting of empty results."""
-        sidebar = ToolCallsSidebar()
 
         result = {"log_groups": []}
         formatted = sidebar._format_result(result)
@@ -1,20 +1,36 @@
 """Unit tests for FetchCachedResultTool."""
 
-from pathlib import Path
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 from logai.core.context.result_cache import ResultCacheManager
 from logai.core.tools.base import ToolExecutionError
 from logai.tools.fetch_cached_result import FetchCachedResultTool
 
+# Events for the integration workflows, built once at import
+_FULL_WORKFLOW_EVENTS = tuple(
+    {"timestamp": 1707750000000 + i * 1000, "message": f"Event {i}"} for i in range(500)
+)
+_MIXED_LEVEL_MESSAGES = ("ERROR: Error event {}", "WARN: Warning event {}", "INFO: Info event {}")
+_MIXED_LEVEL_EVENTS = tuple(
+    {"timestamp": 1707750000000 + i * 1000, "message": _MIXED_LEVEL_MESSAGES[i % 3].format(i)}
+    for i in range(300)
+)
+
+
+@pytest.fixture(scope="module")
+def cache_manager(tmp_path_factory: pytest.TempPathFactory) -> ResultCacheManager:
+    """Create a result cache manager shared by the module (initialized on first use)."""
+    return ResultCacheManager(cache_dir=tmp_path_factory.mktemp("cache"))
 
-@pytest.fixture
-async def cache_manager(tmp_path: Path) -> ResultCacheManager:
-    """Create a result cache manager for testing."""
-    manager = ResultCacheManager(cache_dir=tmp_path / "cache")
-    await manager.initialize()
-    return manager
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def _clear_cache(cache_manager: ResultCacheManager) -> AsyncIterator[None]:
+    """Empty the shared cache after each test."""
+    yield
+    await cache_manager.clear()
 
 
 @pytest.fixture
@@ -23,9 +39,9 @@ def fetch_tool(cache_manager: ResultCacheManager) -> FetchCachedResultTool:
     return FetchCachedResultTool(result_cache=cache_manager)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_result() -> dict:
-    """Create a sample result with events."""
+    """Create a sample result with events, shared by the module (tests only read it)."""
     return {
         "events": [
             {"timestamp": 1707750000000 + i * 1000, "message": f"Event {i}"} for i in range(100)
@@ -102,6 +118,18 @@ class TestFetchCachedResultTool:
         assert "timestamp" in time_start_param["description"].lower()
         assert "timestamp" in time_end_param["description"].lower()
 
+    def test_tool_parameters_built_once(
+        self, fetch_tool: FetchCachedResultTool, cache_manager: ResultCacheManager
+    ) -> None:
+        """Test that every access and instance shares one parameter schema."""
+        other_tool = FetchCachedResultTool(result_cache=cache_manager)
+
+        assert fetch_tool.parameters is fetch_tool.parameters
+        assert fetch_tool.parameters is other_tool.parameters
+        assert fetch_tool.to_function_definition()["function"]["parameters"] is (
+            fetch_tool.parameters
+        )
+
     def test_to_function_definition(self, fetch_tool: FetchCachedResultTool) -> None:
         """Test conversion to function definition format."""
         func_def = fetch_tool.to_function_definition()
@@ -111,7 +139,7 @@ class TestFetchCachedResultTool:
         assert "description" in func_def["function"]
         assert "parameters" in func_def["function"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_missing_cache_id(self, fetch_tool: FetchCachedResultTool) -> None:
         """Test execute raises error when cache_id is missing."""
         with pytest.raises(ToolExecutionError) as exc_info:
@@ -120,7 +148,7 @@ class TestFetchCachedResultTool:
         assert "cache_id" in str(exc_info.value).lower()
         assert exc_info.value.tool_name == "fetch_cached_result_chunk"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_basic(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -142,7 +170,7 @@ class TestFetchCachedResultTool:
         assert len(result["events"]) == 100
         assert result["cache_id"] == summary.cache_id
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_with_offset_limit(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -164,7 +192,7 @@ class TestFetchCachedResultTool:
         assert result["limit"] == 20
         assert result["events"][0]["message"] == "Event 10"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_with_filter_pattern(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -191,7 +219,7 @@ class TestFetchCachedResultTool:
         assert len(result_data["events"]) == 2
         assert all("ERROR" in e["message"] for e in result_data["events"])
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_with_time_range(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -216,7 +244,7 @@ class TestFetchCachedResultTool:
         assert len(result["events"]) == 11  # Events 10-20 inclusive
         assert result["total_filtered"] == 11
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_cache_not_found(self, fetch_tool: FetchCachedResultTool) -> None:
         """Test execute with non-existent cache_id."""
         result = await fetch_tool.execute(cache_id="result_nonexistent")
@@ -225,7 +253,7 @@ class TestFetchCachedResultTool:
         assert "not found" in result["error"]
         assert "hint" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_default_parameters(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -246,7 +274,7 @@ class TestFetchCachedResultTool:
         assert result["offset"] == 0  # Default offset
         assert result["limit"] == 100  # Default limit
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_error_handling(self) -> None:
         """Test error handling when cache manager raises exception."""
         # Create tool with mock cache manager that raises exception
@@ -262,7 +290,7 @@ class TestFetchCachedResultTool:
         assert exc_info.value.tool_name == "fetch_cached_result_chunk"
         assert "cache_id" in exc_info.value.details
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_all_parameters(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -290,7 +318,7 @@ class TestFetchCachedResultTool:
         assert result["filters_applied"]["time_start"] == 1707750010000
         assert result["filters_applied"]["time_end"] == 1707750090000
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_returns_pagination_info(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -314,7 +342,7 @@ class TestFetchCachedResultTool:
         assert "has_more" in result
         assert result["has_more"] is True  # More events available
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_last_page_has_more_false(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -337,7 +365,7 @@ class TestFetchCachedResultTool:
 class TestFetchCachedResultToolIntegration:
     """Integration tests for FetchCachedResultTool with ResultCacheManager."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_full_workflow(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -345,11 +373,7 @@ class TestFetchCachedResultToolIntegration:
     ) -> None:
         """Test complete workflow: cache, fetch multiple chunks."""
         # Create large result
-        large_result = {
-            "events": [
-                {"timestamp": 1707750000000 + i * 1000, "message": f"Event {i}"} for i in range(500)
-            ]
-        }
+        large_result = {"events": list(_FULL_WORKFLOW_EVENTS)}
 
         # Cache the result
         summary = await cache_manager.cache_result(
@@ -373,7 +397,7 @@ class TestFetchCachedResultToolIntegration:
         assert len(page5["events"]) == 100
         assert page5["has_more"] is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_workflow_with_filtering(
         self,
         fetch_tool: FetchCachedResultTool,
@@ -381,15 +405,7 @@ class TestFetchCachedResultToolIntegration:
     ) -> None:
         """Test workflow with progressive filtering."""
         # Create result with mixed event types
-        result = {"events": []}
-        for i in range(300):
-            if i % 3 == 0:
-                msg = f"ERROR: Error event {i}"
-            elif i % 3 == 1:
-                msg = f"WARN: Warning event {i}"
-            else:
-                msg = f"INFO: Info event {i}"
-            result["events"].append({"timestamp": 1707750000000 + i * 1000, "message": msg})
+        result = {"events": list(_MIXED_LEVEL_EVENTS)}
 
         # Cache the result
         summary = await cache_manager.cache_result(
@@ -7,54 +7,25 @@ from logai.ui.widgets.status_footer import StatusFooter
 class TestStatusFooterContextUsage:
     """Test status footer context usage display."""
 
-    def test_context_usage_green_zone(self):
-        """Test context usage displays in green for 0-70%."""
+    @pytest.mark.parametrize(
+        "usage",
+        [45.0, 78.0, 92.0, 71.0, 86.0, 0.0, 100.0],
+        ids=[
+            "green_zone",
+            "yellow_zone",
+            "red_zone",
+            "boundary_71",
+            "boundary_86",
+            "zero",
+            "hundred",
+        ],
+    )
+    def test_context_usage(self, usage):
+        """Test context usage across the green (0-70%), yellow (71-85%) and red (86-100%) zones."""
         status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(45.0)
+        status_footer.update_context_usage(usage)
 
-        assert status_footer.context_utilization == 45.0
-
-    def test_context_usage_yellow_zone(self):
-        """Test context usage displays in yellow for 71-85%."""
-        status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(78.0)
-
-        assert status_footer.context_utilization == 78.0
-
-    def test_context_usage_red_zone(self):
-        """Test context usage displays in red for 86-100%."""
-        status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(92.0)
-
-        assert status_footer.context_utilization == 92.0
-
-    def test_context_usage_boundary_at_71(self):
-        """Test context usage boundary at 71% (yellow zone)."""
-        status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(71.0)
-
-        assert status_footer.context_utilization == 71.0
-
-    def test_context_usage_boundary_at_86(self):
-        """Test context usage boundary at 86% (red zone)."""
-        status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(86.0)
-
-        assert status_footer.context_utilization == 86.0
-
-    def test_context_usage_zero(self):
-        """Test context usage at 0%."""
-        status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(0.0)
-
-        assert status_footer.context_utilization == 0.0
-
-    def test_context_usage_hundred(self):
-        """Test context usage at 100%."""
-        status_footer = StatusFooter(model="test-model")
-        status_footer.update_context_usage(100.0)
-
-        assert status_footer.context_utilization == 100.0
+        assert status_footer.context_utilization == usage
 
     def test_reactive_property_updates_on_change(self):
         """Test that changing context utilization triggers reactive update."""